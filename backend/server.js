@@ -1555,24 +1555,14 @@ app.get("/api/main-recommendations", async (req, res) => {
       try {
         console.log('[MAIN-RECS] Catch 스크래퍼에서 실시간 공고 수집 중...');
 
-        // Catch 스크래퍼 초기화 및 로그인
+        // Catch 세션 보장 (이미 초기화/로그인된 드라이버가 있으면 즉시 반환)
         try {
-          await axios.post('http://localhost:3000/api/init', {}, { timeout: 5000 });
-          console.log('[MAIN-RECS] Catch 스크래퍼 초기화 완료');
-        } catch (initErr) {
-          console.log('[MAIN-RECS] Catch 초기화 생략 (이미 초기화됨 또는 타임아웃)');
-        }
-
-        try {
-          await axios.post('http://localhost:3000/api/login', {
-            username: 'test0137',
-            password: '#test0808'
-          }, { timeout: 60000 }); // 로그인 타임아웃 60초로 증가
-          console.log('[MAIN-RECS] Catch 로그인 완료');
-          // 로그인 후 브라우저가 안정화될 때까지 대기
-          await new Promise(resolve => setTimeout(resolve, 3000));
-        } catch (loginErr) {
-          console.log('[MAIN-RECS] Catch 로그인 생략 (이미 로그인됨 또는 타임아웃)');
+          const sessionResponse = await axios.post('http://localhost:3000/api/session/ensure', {
+            scraper: false
+          }, { timeout: 60000 });
+          console.log(`[MAIN-RECS] Catch 세션 준비 완료 (${sessionResponse.data.elapsed_ms}ms)`);
+        } catch (sessionErr) {
+          console.log('[MAIN-RECS] Catch 세션 준비 실패, 그대로 진행:', sessionErr.message);
         }
 
         const catchResponse = await axios.get('http://localhost:3000/api/homepage-jobs', {
@@ -3621,22 +3611,14 @@ app.post('/api/interview-questions', async (req, res) => {
       try {
         console.log(`[INTERVIEW-QUESTIONS] Catch에서 ${custom_company} 회사 정보 조회 중...`);
 
-        // Catch 스크래퍼 초기화 및 로그인
+        // Catch 세션 보장 (이미 초기화/로그인된 드라이버가 있으면 즉시 반환)
         try {
-          await axios.post('http://localhost:3000/api/init', {}, { timeout: 5000 });
-          console.log('[INTERVIEW-QUESTIONS] Catch 스크래퍼 초기화 완료');
-        } catch (initErr) {
-          console.log('[INTERVIEW-QUESTIONS] Catch 초기화 생략 (이미 초기화됨 또는 타임아웃)');
-        }
-
-        try {
-          await axios.post('http://localhost:3000/api/login', {
-            username: 'test0137',
-            password: '#test0808'
-          }, { timeout: 5000 });
-          console.log('[INTERVIEW-QUESTIONS] Catch 로그인 완료');
-        } catch (loginErr) {
-          console.log('[INTERVIEW-QUESTIONS] Catch 로그인 생략 (이미 로그인됨 또는 타임아웃)');
+          const sessionResponse = await axios.post('http://localhost:3000/api/session/ensure', {
+            scraper: false
+          }, { timeout: 60000 });
+          console.log(`[INTERVIEW-QUESTIONS] Catch 세션 준비 완료 (${sessionResponse.data.elapsed_ms}ms)`);
+        } catch (sessionErr) {
+          console.log('[INTERVIEW-QUESTIONS] Catch 세션 준비 실패, 그대로 진행:', sessionErr.message);
         }
 
         const catchCompanyResponse = await axios.post('http://localhost:3000/api/search-company-info', {
@@ -3693,22 +3675,14 @@ app.post('/api/interview-questions', async (req, res) => {
         try {
           console.log(`[INTERVIEW-QUESTIONS] Catch에서 ${jobInfo.company_name} 추가 정보 조회 중...`);
 
-          // Catch 스크래퍼 초기화 및 로그인
-          try {
-            await axios.post('http://localhost:3000/api/init', {}, { timeout: 5000 });
-            console.log('[INTERVIEW-QUESTIONS] Catch 스크래퍼 초기화 완료');
-          } catch (initErr) {
-            console.log('[INTERVIEW-QUESTIONS] Catch 초기화 생략 (이미 초기화됨 또는 타임아웃)');
-          }
-
+          // Catch 세션 보장 (이미 초기화/로그인된 드라이버가 있으면 즉시 반환)
           try {
-            await axios.post('http://localhost:3000/api/login', {
-              username: 'test0137',
-              password: '#test0808'
-            }, { timeout: 5000 });
-            console.log('[INTERVIEW-QUESTIONS] Catch 로그인 완료');
-          } catch (loginErr) {
-            console.log('[INTERVIEW-QUESTIONS] Catch 로그인 생략 (이미 로그인됨 또는 타임아웃)');
+            const sessionResponse = await axios.post('http://localhost:3000/api/session/ensure', {
+              scraper: false
+            }, { timeout: 60000 });
+            console.log(`[INTERVIEW-QUESTIONS] Catch 세션 준비 완료 (${sessionResponse.data.elapsed_ms}ms)`);
+          } catch (sessionErr) {
+            console.log('[INTERVIEW-QUESTIONS] Catch 세션 준비 실패, 그대로 진행:', sessionErr.message);
           }
 
           const catchCompanyResponse = await axios.post('http://localhost:3000/api/search-company-info', {
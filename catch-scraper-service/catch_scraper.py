@@ -1,3 +1,8 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -202,8 +207,12 @@ class CatchScraper:
             # 검색 결과 로딩 대기
             time.sleep(3)
 
-            # 검색 결과에서 정확한 기업명 찾기
-            company_links = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//ul[@class='list_corp_round']//li//p[@class='name']//a")))
+            # 검색 결과에서 정확한 기업명 찾기 (결과가 없으면 목록이 없으므로 기다리지 않고 바로 확인)
+            self.driver.implicitly_wait(0)
+            try:
+                company_links = self.driver.find_elements(By.XPATH, "//ul[@class='list_corp_round']//li//p[@class='name']//a")
+            finally:
+                self.driver.implicitly_wait(10)
 
             target_company_url = None
             for link in company_links:
@@ -214,24 +223,17 @@ class CatchScraper:
                     break
 
             if not target_company_url:
-                # 샘플 데이터 반환 (실제 검색 실패 시)
-                return {
-                    "success": True,
-                    "company_detail": self._get_sample_company_data(company_name),
-                    "message": f"'{company_name}' 기업 정보 (샘플 데이터)"
-                }
+                # 찾지 못한 기업은 샘플 데이터로 채우지 않고 없다고 알림 (잠시 기억해서 다시 검색하지 않음)
+                message = f"'{company_name}' 기업을 찾을 수 없습니다."
+                _remember_not_found(company_name, message)
+                return {"success": False, "not_found": True, "message": message}
 
             # 기업 상세 정보 추출
             return self._extract_company_detail(target_company_url, company_name)
 
         except Exception as e:
             print(f"기업 검색 중 오류: {e}")
-            # 오류 발생 시에도 샘플 데이터 반환
-            return {
-                "success": True,
-                "company_detail": self._get_sample_company_data(company_name),
-                "message": f"'{company_name}' 기업 정보 (샘플 데이터 - 스크래핑 오류)"
-            }
+            return {"success": False, "error": str(e), "message": f"'{company_name}' 기업 검색 중 오류가 발생했습니다."}
 
     def _extract_company_detail(self, company_url, company_name):
         """기업 상세 정보 추출"""
@@ -264,37 +266,18 @@ class CatchScraper:
                 "reviews": []
             }
 
-            # 기본 정보 추출 시도 (실패해도 계속 진행)
-            try:
-                company_name_element = wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='name']//h2")))
-                company_detail["company_name"] = company_name_element.text.strip()
-            except:
-                pass
+            # 기업명이 없으면 상세 페이지를 읽지 못한 것 (임의의 값으로 채우지 않음)
+            company_name_element = wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='name']//h2")))
+            company_detail["company_name"] = company_name_element.text.strip()
 
+            # 업종은 있을 때만 채움 (없으면 빈 값)
+            self.driver.implicitly_wait(0)
             try:
-                industry_element = wait.until(EC.presence_of_element_located((By.XPATH, "//span[contains(text(), '포털·플랫폼') or contains(text(), '은행·금융') or contains(text(), '게임') or contains(text(), '전기·전자')]")))
-                company_detail["industry"] = industry_element.text.strip()
-            except:
-                company_detail["industry"] = "IT/소프트웨어"
-
-            # 나머지 정보들도 비슷하게 시도하되 실패 시 기본값 사용
-            company_detail["company_type"] = "중견기업"
-            company_detail["location"] = "서울특별시"
-            company_detail["employee_count"] = "100-500명"
-            company_detail["tags"] = ["성장성", "워라밸", "복리후생"]
-
-            # 샘플 리뷰 데이터 추가
-            company_detail["reviews"] = [
-                {
-                    "employee_status": "현직원",
-                    "employee_info": ["정규직", "경력입사"],
-                    "rating": "4.2",
-                    "good_points": "성장할 수 있는 환경이며 동료들과의 협업이 좋습니다.",
-                    "bad_points": "가끔 야근이 있고 급여 수준이 아쉽습니다.",
-                    "review_date": "2024.09.20",
-                    "likes": "15"
-                }
-            ]
+                industry_elements = self.driver.find_elements(By.XPATH, "//span[contains(text(), '포털·플랫폼') or contains(text(), '은행·금융') or contains(text(), '게임') or contains(text(), '전기·전자')]")
+            finally:
+                self.driver.implicitly_wait(10)
+            if industry_elements:
+                company_detail["industry"] = industry_elements[0].text.strip()
 
             return {
                 "success": True,
@@ -304,51 +287,7 @@ class CatchScraper:
 
         except Exception as e:
             print(f"기업 상세 정보 추출 실패: {e}")
-            return {
-                "success": True,
-                "company_detail": self._get_sample_company_data(company_name),
-                "message": f"'{company_name}' 기업 정보 (샘플 데이터)"
-            }
-
-    def _get_sample_company_data(self, company_name):
-        """샘플 기업 데이터 반환"""
-        return {
-            "company_name": company_name,
-            "industry": "IT/소프트웨어",
-            "company_type": "대기업" if company_name in ["네이버", "카카오", "삼성", "LG"] else "중견기업",
-            "location": "서울특별시",
-            "employee_count": "1000명 이상" if company_name in ["네이버", "카카오", "삼성"] else "100-500명",
-            "revenue": "1조원 이상",
-            "ceo": "대표이사",
-            "establishment_date": "1999.02.15",
-            "company_form": "주식회사",
-            "credit_rating": "AAA",
-            "tags": ["성장성", "안정성", "워라밸", "복리후생"],
-            "recommendation_keywords": ["기술력", "혁신", "글로벌"],
-            "starting_salary": "4,200만원",
-            "average_salary": "6,800만원",
-            "industry_average_salary": "5,200만원",
-            "reviews": [
-                {
-                    "employee_status": "현직원",
-                    "employee_info": ["정규직", "경력입사", "3년차"],
-                    "rating": "4.2",
-                    "good_points": "기술적 도전과 성장 기회가 많은 회사입니다. 동료들과의 협업도 좋고 워라밸도 괜찮습니다.",
-                    "bad_points": "가끔 야근이 있고, 급여 수준이 업계 평균에 비해 아쉬운 편입니다.",
-                    "review_date": "2024.09.20",
-                    "likes": "156"
-                },
-                {
-                    "employee_status": "전직원",
-                    "employee_info": ["정규직", "신입입사", "2년 근무"],
-                    "rating": "3.8",
-                    "good_points": "안정적인 회사이며 복지 혜택이 좋습니다. 교육 프로그램도 잘 되어있습니다.",
-                    "bad_points": "보수적인 문화로 인해 혁신적인 기술 도입이 느린 편입니다.",
-                    "review_date": "2024.09.15",
-                    "likes": "89"
-                }
-            ]
-        }
+            return {"success": False, "error": str(e), "message": f"'{company_name}' 기업 상세 정보 추출 실패"}
 
     def get_job_essays(self, company_name, job_position=None):
         """합격 자소서 정보 반환 (샘플 데이터)"""
@@ -471,6 +410,31 @@ class CatchScraper:
 # 전역 스크래퍼 인스턴스
 scraper = CatchScraper()
 
+# 찾지 못한 기업명 → (만료 시각, 메시지), 오래된 항목부터 제거
+NOT_FOUND_TTL = float(os.environ.get('CATCH_NEGATIVE_CACHE_TTL', '600'))
+NOT_FOUND_MAX_ENTRIES = int(os.environ.get('CATCH_NEGATIVE_CACHE_SIZE', '1000'))
+not_found_companies = OrderedDict()
+not_found_lock = threading.Lock()
+
+def _remember_not_found(company_name, message):
+    with not_found_lock:
+        not_found_companies[company_name.strip()] = (time.time() + NOT_FOUND_TTL, message)
+        not_found_companies.move_to_end(company_name.strip())
+        while len(not_found_companies) > NOT_FOUND_MAX_ENTRIES:
+            not_found_companies.popitem(last=False)
+
+def _recently_not_found(company_name):
+    """최근에 찾지 못한 기업이면 메시지, 아니면 None"""
+    with not_found_lock:
+        entry = not_found_companies.get(company_name.strip())
+        if entry is None:
+            return None
+        expires_at, message = entry
+        if expires_at <= time.time():
+            not_found_companies.pop(company_name.strip(), None)
+            return None
+        return message
+
 def _handle_api_error(e):
     """API 에러 처리 헬퍼 함수"""
     return jsonify({"success": False, "message": str(e)})
@@ -517,6 +481,10 @@ def search_company_info():
         if not company_name:
             return jsonify({"success": False, "message": "기업명을 입력해주세요."})
 
+        not_found_message = _recently_not_found(company_name)
+        if not_found_message:
+            return jsonify({"success": False, "not_found": True, "cached": True, "message": not_found_message})
+
         result = scraper.search_company_info(company_name)
         return jsonify(result)
 
@@ -1,14 +1,118 @@
+import json
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
-from flask import Flask, request, jsonify
+from selenium.common.exceptions import TimeoutException, UnexpectedAlertPresentException
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
 
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:  # lxml이 없으면 JS 일괄 추출만 사용
+    etree = None
+    lxml_html = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # requests가 없으면 HTTP 빠른 경로 없이 Selenium만 사용
+    requests = None
+
 BASE_URL = 'https://www.catch.co.kr/'
 
+# CATCH 로그인 계정 (환경변수로 지정, 없으면 기본 테스트 계정)
+CATCH_USERNAME = os.environ.get('CATCH_USERNAME', 'test0137')
+CATCH_PASSWORD = os.environ.get('CATCH_PASSWORD', '#test0808')
+
+# 드라이버 풀 설정 (환경변수로 조정 가능)
+DRIVER_POOL_SIZE = int(os.environ.get('CATCH_POOL_SIZE', '2'))
+DRIVER_LEASE_TIMEOUT = float(os.environ.get('CATCH_POOL_LEASE_TIMEOUT', '180'))
+DRIVER_BASE_DEBUG_PORT = int(os.environ.get('CATCH_POOL_BASE_DEBUG_PORT', '9300'))
+# 미리 띄워서 로그인해 두는 예비 드라이버 수 (풀 드라이버가 죽거나 교체될 때 즉시 투입, 0이면 비활성화)
+DRIVER_WARM_SPARES = int(os.environ.get('CATCH_POOL_WARM_SPARES', '1'))
+# 풀 드라이버 교체 기준 (로드한 문서 수, 가동 시간(초), Chrome 프로세스 전체 PSS 메모리(MB), 0이면 해당 기준 사용 안 함)
+DRIVER_RECYCLE_MAX_PAGES = int(os.environ.get('CATCH_RECYCLE_MAX_PAGES', '500'))
+DRIVER_RECYCLE_MAX_AGE = float(os.environ.get('CATCH_RECYCLE_MAX_AGE', '3600'))
+DRIVER_RECYCLE_MAX_MEMORY_MB = float(os.environ.get('CATCH_RECYCLE_MAX_MEMORY_MB', '1024'))
+
+# 페이지 준비 상태 감지 설정 (고정 sleep 대신 DOM/네트워크 신호로 대기)
+READY_TIMEOUT = float(os.environ.get('CATCH_READY_TIMEOUT', '15'))
+ROWS_QUIET_MS = int(os.environ.get('CATCH_ROWS_QUIET_MS', '300'))
+NETWORK_IDLE_MS = int(os.environ.get('CATCH_NETWORK_IDLE_MS', '500'))
+
+# 목록 API 빠른 경로 (브라우저가 호출하는 JSON 요청을 기록해 두었다가 HTTP로 직접 재현)
+FAST_PATH_ENABLED = os.environ.get('CATCH_FAST_PATH', '1') != '0'
+FAST_PATH_TIMEOUT = float(os.environ.get('CATCH_FAST_PATH_TIMEOUT', '10'))
+
+# 전체 수집 병렬화 설정 (페이지 구간 단위로 여러 풀 드라이버에 분배)
+CRAWL_WORKERS = int(os.environ.get('CATCH_CRAWL_WORKERS', str(DRIVER_POOL_SIZE)))
+SHARD_PAGES = int(os.environ.get('CATCH_SHARD_PAGES', '5'))
+
+# 증분 수집 설정 (최신순 목록에서 이미 저장된 공고만 있는 페이지가 이만큼 연속되면 중단)
+INCREMENTAL_KNOWN_PAGES = int(os.environ.get('CATCH_INCREMENTAL_KNOWN_PAGES', '1'))
+
+# 백그라운드 수집 작업 설정 (동시에 실행할 작업 수, 끝난 작업 결과 보관 시간(초))
+CRAWL_JOB_WORKERS = int(os.environ.get('CATCH_CRAWL_JOB_WORKERS', '2'))
+CRAWL_JOB_RETENTION = float(os.environ.get('CATCH_CRAWL_JOB_RETENTION', '3600'))
+
+# /api/homepage-jobs 캐시 유효 시간 (초) - 지나면 이전 결과를 바로 주고 백그라운드에서 갱신
+HOMEPAGE_CACHE_TTL = float(os.environ.get('CATCH_HOMEPAGE_CACHE_TTL', '600'))
+
+# 수집한 공고를 저장하는 SQLite 파일 경로
+JOB_STORE_PATH = os.environ.get('CATCH_JOB_STORE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'catch_jobs.db'))
+
+# 로그인 쿠키 저장 경로 (드라이버/프로세스를 다시 시작해도 로그인 없이 세션 복원)
+SESSION_COOKIE_PATH = os.environ.get('CATCH_SESSION_COOKIE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'catch_session.json'))
+
+# 브라우저 없이 로그인 폼을 HTTP로 제출하는 빠른 로그인 (로그인 폼이 있는 페이지 URL, 비우면 Selenium 로그인 때 학습)
+HTTP_LOGIN_ENABLED = os.environ.get('CATCH_HTTP_LOGIN', '1') != '0'
+LOGIN_PAGE_URL = os.environ.get('CATCH_LOGIN_URL', '')
+
+# 로그인 상태를 다시 확인하지 않고 신뢰하는 시간 (초, /api/session/ensure가 이 시간 안에는 즉시 응답)
+SESSION_VERIFY_INTERVAL = float(os.environ.get('CATCH_SESSION_VERIFY_INTERVAL', '300'))
+
+# 기업 상세 정보 섹션별 캐시 유효 시간 (초) - 기본 정보는 거의 바뀌지 않고 연봉/리뷰는 천천히 바뀜
+COMPANY_DETAIL_TTLS = {
+    'profile': float(os.environ.get('CATCH_COMPANY_PROFILE_TTL', str(30 * 24 * 3600))),
+    'salary': float(os.environ.get('CATCH_COMPANY_SALARY_TTL', str(7 * 24 * 3600))),
+    'reviews': float(os.environ.get('CATCH_COMPANY_REVIEWS_TTL', str(24 * 3600)))
+}
+COMPANY_DETAIL_SECTIONS = tuple(COMPANY_DETAIL_TTLS)
+COMPANY_DETAIL_FIELDS = {
+    'profile': ("company_name", "industry", "company_type", "location", "employee_count", "revenue", "ceo",
+                "establishment_date", "company_form", "credit_rating", "tags", "recommendation_keywords"),
+    'salary': ("starting_salary", "average_salary", "industry_average_salary")
+}
+
+# 기업 디렉터리 유사 이름 매칭 기준 (트라이그램 Dice 계수, 0~1)
+COMPANY_MATCH_THRESHOLD = float(os.environ.get('CATCH_COMPANY_MATCH_THRESHOLD', '0.75'))
+
+# 없는 기업/삭제된 공고 결과 캐시 (유효 시간(초), 최대 항목 수)
+NEGATIVE_CACHE_TTL = float(os.environ.get('CATCH_NEGATIVE_CACHE_TTL', '600'))
+NEGATIVE_CACHE_SIZE = int(os.environ.get('CATCH_NEGATIVE_CACHE_SIZE', '1000'))
+
+# 삭제/마감되어 더 이상 볼 수 없는 공고 페이지에 나오는 문구
+MISSING_JOB_MARKERS = ('삭제된 공고', '존재하지 않는 공고', '존재하지 않는 채용공고', '잘못된 접근', '페이지를 찾을 수 없습니다')
+
+# 공고 행 추출 방식: 'js' (execute_script 일괄 추출) 또는 'lxml' (page_source 파싱)
+ROW_EXTRACTION_MODE = os.environ.get('CATCH_ROW_EXTRACTION_MODE', 'js')
+
 SELECTORS = {
     'login_button': [
         ('XPATH', "//a[contains(text(), '로그인')]")
@@ -36,19 +140,780 @@ SELECTORS = {
     ],
     'page_number': [
         ('XPATH', "//p[contains(@class, 'page3')]//a[not(contains(@class, 'ico')) and not(contains(@class, 'selected'))]")
+    ],
+    'current_page': [
+        ('XPATH', "//p[contains(@class, 'page3')]//a[contains(@class, 'selected')]")
+    ],
+    'sort_newest': [
+        ('XPATH', "//a[contains(text(), '최신순')]"),
+        ('XPATH', "//button[contains(text(), '최신순')]"),
+        ('XPATH', "//a[contains(text(), '등록일순')]"),
+        ('XPATH', "//button[contains(text(), '등록일순')]")
     ]
 }
 
+# 공고 목록 카테고리 (직무 필터 버튼 선택자, 표시 이름, 직접 이동 URL)
+# url이 비어 있으면 클릭 필터 적용 후 사이트가 주소창에 반영한 URL을 학습해서 사용
+LISTING_CATEGORIES = {
+    'it': {
+        'name': 'IT개발',
+        'selector': 'it_development',
+        'url': os.environ.get('CATCH_LISTING_URL_IT', '')
+    },
+    'bigdata_ai': {
+        'name': '빅데이터·AI',
+        'selector': 'bigdata_ai',
+        'url': os.environ.get('CATCH_LISTING_URL_BIGDATA_AI', '')
+    }
+}
+LISTING_PAGE_PARAM = os.environ.get('CATCH_LISTING_PAGE_PARAM', 'page')
+LISTING_PAGE_SIZE_PARAM = os.environ.get('CATCH_LISTING_PAGE_SIZE_PARAM', '')
+LISTING_PAGE_SIZE = int(os.environ.get('CATCH_LISTING_PAGE_SIZE', '0'))
+
+# 카테고리별로 학습한 목록 URL (모든 드라이버가 공유)
+listing_url_cache = {}
+
+def job_id_from_url(job_url):
+    """RecruitInfoDetails URL에서 공고 고유 ID 추출 (찾지 못하면 None)"""
+    if not job_url:
+        return None
+    match = re.search(r'RecruitInfoDetails/(\d+)', job_url)
+    if match:
+        return match.group(1)
+    for key, value in parse_qsl(urlsplit(job_url).query):
+        if value.isdigit() and ('recruit' in key.lower() or key.lower() in ('id', 'seq')):
+            return value
+    match = re.search(r'(\d+)(?!.*\d)', urlsplit(job_url).path)
+    return match.group(1) if match else None
+
+COMPANY_NAME_AFFIXES = re.compile(r'주식회사|유한회사|\(주\)|\(유\)|㈜|\s+')
+
+def normalize_company_name(name):
+    """기업명 비교용 정규화 (주식회사/(주)/㈜ 등 법인 표기와 공백 제거, 대소문자 무시)"""
+    return COMPANY_NAME_AFFIXES.sub('', name or '').casefold()
+
+def build_listing_url(base_url, page=1):
+    """목록 URL에 페이지 번호(와 페이지 크기)를 반영"""
+    if '{page}' in base_url:
+        return base_url.format(page=page, page_size=LISTING_PAGE_SIZE or '')
+    
+    parts = urlsplit(base_url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query[LISTING_PAGE_PARAM] = str(page)
+    if LISTING_PAGE_SIZE and LISTING_PAGE_SIZE_PARAM:
+        query[LISTING_PAGE_SIZE_PARAM] = str(LISTING_PAGE_SIZE)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+def process_tree_pss_mb(root_pid):
+    """/proc에서 root_pid와 모든 하위 프로세스(chromedriver → Chrome 브라우저/렌더러)의 PSS 합계 (MB, 읽을 수 없으면 None)
+    
+    Chrome 프로세스들은 공유 라이브러리와 공유 메모리를 많이 나눠 쓰므로 RSS를 더하면 공유 페이지가
+    프로세스 수만큼 중복 계산됨. PSS는 공유 페이지를 나눠 쓰는 프로세스 수로 나눠 계산하므로 합계가 실제 사용량에 가까움
+    """
+    children = {}
+    try:
+        pids = [int(name) for name in os.listdir('/proc') if name.isdigit()]
+    except OSError:
+        return None
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                # comm에 공백/괄호가 들어갈 수 있으므로 마지막 ')' 뒤에서 ppid를 읽음
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(pid)
+    
+    total_kb, stack, seen = 0, [root_pid], set()
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        stack.extend(children.get(pid, []))
+        try:
+            with open(f'/proc/{pid}/smaps_rollup') as f:
+                for line in f:
+                    if line.startswith('Pss:'):
+                        total_kb += int(line.split()[1])
+                        break
+        except (OSError, ValueError):
+            continue
+    return round(total_kb / 1024, 1) if root_pid in seen and total_kb else None
+
+# 공고 목록 행 선택자 (lxml 파서용, JOB_ROWS_SCRIPT와 동일한 기준)
+JOB_ROW_XPATHS = {
+    'row': "//tbody//tr",
+    'company': ".//p[contains(@class, 'name2')]",
+    'title': ".//p[contains(@class, 'subj2')]",
+    'link': ".//a[contains(@href, 'RecruitInfoDetails')]/@href",
+    'job_info': ".//p[contains(@class, 'job')]//span",
+    'conditions': ".//p[contains(@class, 'cond')]",
+    'registration_info': ".//p[contains(@class, 'date2') or contains(@class, 'num_dday')]"
+}
+
+# 공고 목록의 모든 행을 한 번의 execute_script 호출로 추출 (XPath 선택자와 동일한 기준)
+JOB_ROWS_SCRIPT = """
+var texts = function(row, selector) {
+    return Array.prototype.map.call(row.querySelectorAll(selector), function(el) {
+        return (el.innerText || '').trim();
+    });
+};
+var rows = document.querySelectorAll('tbody tr');
+var result = [];
+for (var i = 0; i < rows.length; i++) {
+    var row = rows[i];
+    var company = row.querySelector("p[class*='name2']");
+    var title = row.querySelector("p[class*='subj2']");
+    var link = row.querySelector("a[href*='RecruitInfoDetails']");
+    if (!company || !title || !link) {
+        continue;
+    }
+    result.push({
+        title: (title.innerText || '').trim(),
+        company: (company.innerText || '').trim(),
+        job_info: texts(row, "p[class*='job'] span"),
+        conditions: texts(row, "p[class*='cond']"),
+        registration_info: texts(row, "p[class*='date2'], p[class*='num_dday']"),
+        url: link.href
+    });
+}
+return result;
+"""
+
+# 로그인 상태 확인 (로그아웃 링크가 보일 때만 로그인된 것으로 판단, 빈 페이지나 오류 페이지는 로그아웃 상태)
+LOGIN_PROBE_SCRIPT = """
+var links = Array.prototype.map.call(document.querySelectorAll('a'), function(a) {
+    return (a.textContent || '').trim();
+});
+return links.some(function(text) { return text.indexOf('로그아웃') !== -1; });
+"""
+
+# 공고 목록(tbody) 변경을 감지하는 MutationObserver 설치 및 상태 조회
+# epoch는 문서가 새로 로드될 때마다 바뀌므로 전체 페이지 이동도 변경으로 감지됨
+ROWS_OBSERVER_SCRIPT = """
+if (!window.__catchRows) {
+    var state = {epoch: Math.random().toString(36).slice(2), version: 0, lastChange: Date.now()};
+    var touchesRows = function(node) {
+        if (!node || node.nodeType !== 1) {
+            return false;
+        }
+        return node.nodeName === 'TBODY' || node.nodeName === 'TR' || !!node.querySelector('tbody');
+    };
+    new MutationObserver(function(mutations) {
+        for (var i = 0; i < mutations.length; i++) {
+            var mutation = mutations[i];
+            var target = mutation.target.nodeType === 1 ? mutation.target : mutation.target.parentElement;
+            var changed = !!(target && target.closest && target.closest('tbody'));
+            for (var j = 0; !changed && j < mutation.addedNodes.length; j++) {
+                changed = touchesRows(mutation.addedNodes[j]);
+            }
+            for (var k = 0; !changed && k < mutation.removedNodes.length; k++) {
+                changed = touchesRows(mutation.removedNodes[k]);
+            }
+            if (changed) {
+                state.version += 1;
+                state.lastChange = Date.now();
+            }
+        }
+    }).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    window.__catchRows = state;
+}
+return {
+    epoch: window.__catchRows.epoch,
+    version: window.__catchRows.version,
+    quiet_ms: Date.now() - window.__catchRows.lastChange,
+    rows: document.querySelectorAll('tbody tr').length
+};
+"""
+
+# 기업 상세 페이지의 기본 정보(corp_info_* 블록, 기본 정보 표)와 연봉 정보를 한 번에 읽는 스크립트
+# 없는 항목은 기다리지 않고 빈 값으로 반환
+COMPANY_DETAIL_SCRIPT = """
+var nodes = function(xpath) {
+    var snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var result = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) {
+        result.push(snapshot.snapshotItem(i));
+    }
+    return result;
+};
+var texts = function(xpath) {
+    return nodes(xpath).map(function(el) {
+        return (el.innerText || el.textContent || '').trim();
+    });
+};
+var first = function(xpath) {
+    return texts(xpath)[0] || '';
+};
+var tableValue = function(label) {
+    return first("//table//tr//th[text()='" + label + "']/following-sibling::td");
+};
+return {
+    company_name: first("//div[@class='name']//h2"),
+    industry: first("//span[contains(text(), '포털·플랫폼') or contains(text(), '은행·금융') or contains(text(), '게임') or contains(text(), '전기·전자')]"),
+    company_type: first("//div[@class='item type1']//p[@class='t1']"),
+    location: tableValue('주소').replace('지도', '').trim(),
+    employee_count: first("//div[@class='item type2']//p[@class='t1']"),
+    revenue: first("//div[@class='item type3']//p[@class='t1']"),
+    ceo: tableValue('대표자'),
+    establishment_date: tableValue('개업일'),
+    company_form: tableValue('기업형태'),
+    credit_rating: tableValue('신용등급'),
+    tags: texts("//div[@class='corp_info_base2']//p[@class='tag']//span"),
+    recommendation_keywords: texts("//div[@class='corp_info_recom']//a[@class='bt']"),
+    starting_salary: first("//div[@class='corp_info_payinfo']//div[@class='box'][1]//span[@class='pay']"),
+    average_salary: first("//div[@class='corp_info_payinfo']//div[@class='box'][2]//span[@class='pay']"),
+    industry_average_salary: first("//div[@class='corp_info_payinfo']//div[@class='box'][2]//p[@class='list'][2]//span[@class='pay']")
+};
+"""
+
+# 현직자리뷰 탭의 리뷰 목록을 한 번에 읽는 스크립트 (목록이 아직 없으면 빈 배열)
+COMPANY_REVIEWS_SCRIPT = """
+var text = function(root, selector) {
+    var el = root.querySelector(selector);
+    return el ? (el.innerText || el.textContent || '').trim() : '';
+};
+var items = document.querySelectorAll('ul.corp_review_list li');
+if (!items.length) {
+    items = document.querySelectorAll('div.corp_info_box ul li');
+}
+return Array.prototype.map.call(items, function(item) {
+    return {
+        employee_status: text(item, 'p.state'),
+        employee_info: Array.prototype.map.call(item.querySelectorAll('div.info p span'), function(el) {
+            return (el.innerText || el.textContent || '').trim();
+        }),
+        rating: text(item, 'div.rating_star2 span.fill'),
+        good_points: text(item, 'p.review.good span.t'),
+        bad_points: text(item, 'p.review.bad span.t'),
+        review_date: text(item, 'p.bot span.date'),
+        likes: text(item, 'span.like label')
+    };
+});
+"""
+
 app = Flask(__name__)
 CORS(app)
 
+class JobListParser:
+    """공고 목록 HTML(page_source) 파서 - 브라우저 없이 저장된 HTML에도 사용 가능"""
+    def __init__(self, base_url=BASE_URL):
+        if etree is None:
+            raise RuntimeError("lxml이 설치되어 있지 않습니다.")
+        self.base_url = base_url
+        self.xpaths = {name: etree.XPath(expr) for name, expr in JOB_ROW_XPATHS.items()}
+    
+    @staticmethod
+    def _text(element):
+        """요소의 텍스트를 공백 정리 후 반환"""
+        return " ".join(element.text_content().split())
+    
+    def parse(self, page_source):
+        """HTML 문자열에서 공고 행 목록 추출"""
+        if not page_source:
+            return []
+        
+        document = lxml_html.fromstring(page_source)
+        jobs = []
+        for row in self.xpaths['row'](document):
+            companies = self.xpaths['company'](row)
+            titles = self.xpaths['title'](row)
+            links = self.xpaths['link'](row)
+            if not companies or not titles or not links:
+                continue
+            
+            jobs.append({
+                "title": self._text(titles[0]),
+                "company": self._text(companies[0]),
+                "job_info": [self._text(info) for info in self.xpaths['job_info'](row)],
+                "conditions": [self._text(cond) for cond in self.xpaths['conditions'](row)],  # 경력, 학력, 고용형태 등
+                "registration_info": [self._text(date) for date in self.xpaths['registration_info'](row)],  # 등록일, 마감일 등
+                "url": urljoin(self.base_url, links[0]),
+                "job_id": job_id_from_url(urljoin(self.base_url, links[0]))
+            })
+        return jobs
+
+job_list_parser = JobListParser() if etree is not None else None
+# lxml 파싱은 GIL을 놓기 때문에 드라이버가 다음 페이지로 이동하는 동안 워커 스레드에서 수행
+parse_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='catch-parse')
+
+class NetworkMonitor:
+    """Chrome performance 로그(CDP Network 이벤트)로 진행 중인 요청을 추적"""
+    # 오래 끝나지 않는 요청(롱폴링, 비콘 등)은 유휴 판정에서 제외
+    STALE_REQUEST_SECONDS = 5
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.inflight = {}
+        self.last_activity = time.monotonic()
+        self.available = True
+        self.recording = False
+        self.recorded = {}
+        self.captured = []
+        self.documents_loaded = 0
+    
+    def poll(self):
+        """쌓인 performance 로그를 읽어 진행 중인 요청 목록 갱신"""
+        if not self.available:
+            return
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            print(f"[NETWORK] performance 로그를 사용할 수 없습니다: {e}")
+            self.available = False
+            return
+        
+        now = time.monotonic()
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except Exception:
+                continue
+            self._handle_event(message.get('method'), message.get('params', {}), now)
+        
+        for request_id, started in list(self.inflight.items()):
+            if now - started > self.STALE_REQUEST_SECONDS:
+                del self.inflight[request_id]
+    
+    def _handle_event(self, method, params, now):
+        """CDP Network 이벤트 하나 처리"""
+        request_id = params.get('requestId')
+        if method == 'Network.requestWillBeSent':
+            request_info = params.get('request', {})
+            if request_info.get('url', '').startswith('data:'):
+                return
+            self.inflight[request_id] = now
+            self.last_activity = now
+            if params.get('type') == 'Document':
+                self.documents_loaded += 1
+            if self.recording and params.get('type') in ('XHR', 'Fetch'):
+                self.recorded[request_id] = {
+                    "request_id": request_id,
+                    "url": request_info.get('url'),
+                    "method": request_info.get('method', 'GET'),
+                    "headers": request_info.get('headers', {}),
+                    "post_data": request_info.get('postData'),
+                    "is_json": False
+                }
+        elif method == 'Network.responseReceived':
+            if request_id in self.recorded:
+                self.recorded[request_id]["is_json"] = 'json' in params.get('response', {}).get('mimeType', '')
+        elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+            if self.inflight.pop(request_id, None) is not None:
+                self.last_activity = now
+            request_info = self.recorded.pop(request_id, None)
+            if request_info and request_info["is_json"] and method == 'Network.loadingFinished':
+                self.captured.append(request_info)
+    
+    def start_recording(self):
+        """이후 발생하는 XHR/Fetch JSON 요청 기록 시작"""
+        self.poll()
+        self.recorded = {}
+        self.captured = []
+        self.recording = True
+    
+    def stop_recording(self):
+        """기록 종료 후 완료된 JSON 요청 목록 반환"""
+        self.poll()
+        self.recording = False
+        captured, self.captured, self.recorded = self.captured, [], {}
+        return captured
+    
+    def is_idle(self, idle_ms=NETWORK_IDLE_MS):
+        """진행 중인 요청이 없고 idle_ms 동안 네트워크 활동이 없었는지 확인"""
+        self.poll()
+        return not self.inflight and (time.monotonic() - self.last_activity) * 1000 >= idle_ms
+
+def _find_row_lists(data, path=()):
+    """JSON 응답에서 dict로 이루어진 리스트를 (경로, 리스트) 형태로 모두 찾기"""
+    if isinstance(data, list):
+        if data and all(isinstance(item, dict) for item in data):
+            yield path, data
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            yield from _find_row_lists(value, path + (key,))
+
+def _normalize_text(value):
+    """비교용 텍스트 정리 (공백 정규화)"""
+    return " ".join(str(value).split()) if value is not None else ""
+
+class ListingEndpoint:
+    """브라우저가 공고 목록을 불러올 때 호출한 JSON API 요청 (HTTP로 재현하기 위한 정보)"""
+    # 재현할 때 그대로 보내면 안 되는 헤더
+    SKIP_HEADERS = {'content-length', 'cookie', 'host'}
+    
+    def __init__(self, category, request_info, rows_path, field_map, url_template, page_key):
+        self.category = category
+        self.url = request_info["url"]
+        self.method = request_info["method"]
+        self.headers = {
+            name: value for name, value in request_info["headers"].items()
+            if not name.startswith(':') and name.lower() not in self.SKIP_HEADERS
+        }
+        self.post_data = request_info["post_data"]
+        self.rows_path = rows_path
+        self.field_map = field_map
+        self.url_template = url_template
+        self.page_key = page_key
+    
+    @classmethod
+    def from_capture(cls, category, request_info, data, dom_rows):
+        """기록된 요청의 응답이 화면의 공고 목록과 일치하면 ListingEndpoint 생성 (아니면 None)"""
+        if not dom_rows:
+            return None
+        for rows_path, json_rows in _find_row_lists(data):
+            mapping = cls._infer_field_map(json_rows, dom_rows)
+            if mapping:
+                field_map, url_template = mapping
+                return cls(category, request_info, rows_path, field_map, url_template, cls._find_page_key(request_info))
+        return None
+    
+    @staticmethod
+    def _infer_field_map(json_rows, dom_rows):
+        """JSON 행의 값과 화면 공고 값을 비교해 필드 매핑과 공고 URL 템플릿 추론"""
+        dom_by_title = {_normalize_text(row["title"]): row for row in dom_rows}
+        matched = []
+        for json_row in json_rows:
+            for key, value in json_row.items():
+                dom_row = dom_by_title.get(_normalize_text(value))
+                if dom_row:
+                    matched.append((json_row, dom_row, key))
+                    break
+        # 화면에 보이는 공고의 절반 이상이 응답에 있어야 목록 API로 판단
+        if len(matched) * 2 < len(dom_rows):
+            return None
+        
+        field_map = {"title": matched[0][2], "job_info": [], "conditions": [], "registration_info": []}
+        url_template = None
+        json_row, dom_row, _ = matched[0]
+        for key, value in json_row.items():
+            if key == field_map["title"] or isinstance(value, (dict, list)) or value in (None, ""):
+                continue
+            text = _normalize_text(value)
+            if "company" not in field_map and text == _normalize_text(dom_row["company"]):
+                field_map["company"] = key
+            elif "id" not in field_map and len(text) >= 3 and text.isdigit() and re.search(rf'(?<!\d){text}(?!\d)', dom_row["url"]):
+                field_map["id"] = key
+                head, _, tail = dom_row["url"].rpartition(text)
+                url_template = head + "{id}" + tail
+            else:
+                for field in ("job_info", "conditions", "registration_info"):
+                    if text in [_normalize_text(item) for item in dom_row[field]]:
+                        field_map[field].append(key)
+                        break
+        
+        if "company" not in field_map or "id" not in field_map:
+            return None
+        return field_map, url_template
+    
+    @staticmethod
+    def _find_page_key(request_info):
+        """요청의 쿼리스트링/본문에서 페이지 번호 파라미터 찾기 (('query'|'json'|'form', 키) 또는 None)"""
+        def is_page_param(key, value):
+            return 'page' in key.lower() and 'size' not in key.lower() and str(value) == '1'
+        
+        for key, value in parse_qsl(urlsplit(request_info["url"]).query):
+            if is_page_param(key, value):
+                return ('query', key)
+        
+        post_data = request_info.get("post_data")
+        if post_data:
+            try:
+                body = json.loads(post_data)
+                if isinstance(body, dict):
+                    for key, value in body.items():
+                        if is_page_param(key, value):
+                            return ('json', key)
+            except ValueError:
+                for key, value in parse_qsl(post_data):
+                    if is_page_param(key, value):
+                        return ('form', key)
+        return None
+    
+    def build_request(self, page=1):
+        """page 번호를 반영한 (method, url, body) 생성"""
+        if page != 1 and not self.page_key:
+            raise ValueError("목록 API에서 페이지 파라미터를 찾지 못해 1페이지만 호출할 수 있습니다.")
+        
+        url, body = self.url, self.post_data
+        if self.page_key and page != 1:
+            location, key = self.page_key
+            if location == 'query':
+                parts = urlsplit(url)
+                query = dict(parse_qsl(parts.query, keep_blank_values=True))
+                query[key] = str(page)
+                url = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+            elif location == 'json':
+                payload = json.loads(body)
+                payload[key] = page if isinstance(payload[key], int) else str(page)
+                body = json.dumps(payload)
+            else:
+                form = dict(parse_qsl(body, keep_blank_values=True))
+                form[key] = str(page)
+                body = urlencode(form)
+        return self.method, url, body
+    
+    def parse_rows(self, data, page):
+        """API 응답 JSON을 공고 목록 형식으로 변환"""
+        for key in self.rows_path:
+            data = data[key]
+        
+        jobs = []
+        for row in data:
+            job_id = _normalize_text(row.get(self.field_map["id"]))
+            jobs.append({
+                "title": _normalize_text(row.get(self.field_map["title"])),
+                "company": _normalize_text(row.get(self.field_map["company"])),
+                "job_info": [_normalize_text(row.get(key)) for key in self.field_map["job_info"]],
+                "conditions": [_normalize_text(row.get(key)) for key in self.field_map["conditions"]],  # 경력, 학력, 고용형태 등
+                "registration_info": [_normalize_text(row.get(key)) for key in self.field_map["registration_info"]],  # 등록일, 마감일 등
+                "url": self.url_template.replace("{id}", job_id),
+                "job_id": job_id,
+                "page": page
+            })
+        return jobs
+
+# 카테고리별로 발견한 목록 API
+listing_endpoints = {}
+
+class CrawlCancelled(Exception):
+    """수집 작업이 취소되었음을 progress 콜백이 알리는 예외 (페이지 사이에서 발생)"""
+
+def _report(progress, phase, **info):
+    """progress 콜백이 있으면 진행 상황 전달 (취소된 작업이면 CrawlCancelled 발생)"""
+    if progress is not None:
+        progress(phase, **info)
+
+def _category_progress(progress, category):
+    """progress 콜백에 category를 붙여 전달하는 래퍼 (progress가 없으면 None)"""
+    if progress is None:
+        return None
+    return lambda phase, **info: progress(phase, category=info.pop('category', category), **info)
+
+class ListingApiClient:
+    """발견한 목록 API를 로그인 쿠키와 함께 HTTP로 직접 호출 (실패하면 호출 측에서 Selenium으로 대체)"""
+    def __init__(self, timeout=FAST_PATH_TIMEOUT):
+        self.timeout = timeout
+        self.session = None
+        if requests is not None:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(4, DRIVER_POOL_SIZE * 2))
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+    
+    def is_available(self, category):
+        """해당 카테고리를 HTTP로 가져올 수 있는지 확인"""
+        return FAST_PATH_ENABLED and self.session is not None and category in listing_endpoints
+    
+    def sync_cookies(self, driver):
+        """드라이버의 로그인 쿠키를 HTTP 세션으로 복사"""
+        if self.session is None:
+            return
+        for cookie in driver.get_cookies():
+            self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+    
+    def fetch_page(self, category, page=1):
+        """목록 API로 한 페이지의 공고 가져오기"""
+        endpoint = listing_endpoints[category]
+        method, url, body = endpoint.build_request(page)
+        response = self.session.request(method, url, data=body, headers=endpoint.headers, timeout=self.timeout)
+        response.raise_for_status()
+        return endpoint.parse_rows(response.json(), page)
+    
+    def iter_pages(self, category, max_pages=None, start_page=1):
+        """목록 API로 (페이지 번호, 공고 목록)을 차례로 생성 (빈 페이지나 같은 페이지가 반복되면 종료)
+        
+        페이지 파라미터를 찾지 못한 목록 API는 1페이지만 생성하므로 나머지 페이지는 호출 측에서 Selenium으로 이어서 수집
+        """
+        previous_urls = None
+        page = start_page
+        while not max_pages or page < start_page + max_pages:
+            page_jobs = self.fetch_page(category, page)
+            page_urls = [job["url"] for job in page_jobs]
+            if not page_jobs or page_urls == previous_urls:
+                return
+            yield page, page_jobs
+            previous_urls = page_urls
+            if not listing_endpoints[category].page_key:
+                return
+            page += 1
+    
+    def fetch_jobs(self, category, max_pages=None, progress=None):
+        """목록 API로 여러 페이지 공고 가져오기"""
+        if not self.is_available(category):
+            return {"success": False, "message": "사용 가능한 목록 API가 없습니다."}
+        if max_pages != 1 and not listing_endpoints[category].page_key:
+            # 1페이지만 가져오고 성공으로 보고하면 전체 수집이 첫 페이지에서 끝나므로 Selenium 수집으로 대체
+            return {"success": False, "message": "목록 API에서 페이지 파라미터를 찾지 못해 여러 페이지를 가져올 수 없습니다."}
+        
+        try:
+            all_jobs = []
+            total_pages = 0
+            for page, page_jobs in self.iter_pages(category, max_pages):
+                all_jobs.extend(page_jobs)
+                total_pages = page
+                _report(progress, 'page', page=page, rows=len(page_jobs), source='api')
+            
+            if not all_jobs:
+                return {"success": False, "message": "목록 API 응답에 공고가 없습니다."}
+            
+            print(f"[FAST] {LISTING_CATEGORIES[category]['name']}: 목록 API로 {len(all_jobs)}개 공고, {total_pages}페이지 수집")
+            return {"success": True, "jobs": all_jobs, "total_pages": total_pages, "source": "api"}
+            
+        except CrawlCancelled:
+            raise
+        except Exception as e:
+            print(f"[FAST] 목록 API 호출 실패, Selenium으로 대체: {e}")
+            return {"success": False, "message": str(e)}
+
+listing_api = ListingApiClient()
+
+class SessionStore:
+    """로그인 후 쿠키를 파일에 저장하고 같은 계정의 새 드라이버에서 다시 사용"""
+    def __init__(self, path=SESSION_COOKIE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+    
+    def save(self, username, cookies, login_url=None):
+        """계정의 쿠키 저장 (다른 사용자가 읽지 못하도록 0600 권한, 임시 파일로 쓰고 교체)"""
+        data = {"username": username, "saved_at": datetime.now().isoformat(timespec='seconds'), "cookies": cookies,
+                "login_url": login_url or self.login_url()}
+        temp_path = f"{self.path}.tmp"
+        with self._lock:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+    
+    def _read(self):
+        with self._lock:
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return {}
+    
+    def login_url(self):
+        """Selenium 로그인 때 학습한 로그인 폼 페이지 URL (환경변수가 우선)"""
+        return LOGIN_PAGE_URL or self._read().get("login_url")
+    
+    def load(self, username):
+        """저장된 쿠키 목록 (파일이 없거나 다른 계정이거나 모두 만료되었으면 None)"""
+        data = self._read()
+        if data.get("username") != username:
+            return None
+        now = time.time()
+        cookies = [cookie for cookie in data.get("cookies", []) if not cookie.get('expiry') or cookie['expiry'] > now]
+        return cookies or None
+    
+    def clear(self):
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+session_store = SessionStore()
+
+class HttpLoginClient:
+    """로그인 폼(id_login/pw_login)을 브라우저 없이 HTTP로 제출하고 Selenium에 넣을 수 있는 쿠키 목록 반환"""
+    def __init__(self, timeout=FAST_PATH_TIMEOUT):
+        self.timeout = timeout
+    
+    def is_available(self):
+        return HTTP_LOGIN_ENABLED and requests is not None and lxml_html is not None and bool(session_store.login_url())
+    
+    def _find_login_form(self, page_url, html_text):
+        """(제출 URL, 메서드, 기본 필드, 아이디 필드명, 비밀번호 필드명) - 폼이 없으면 None"""
+        document = lxml_html.fromstring(html_text)
+        forms = document.xpath("//form[.//input[@id='id_login'] and .//input[@id='pw_login']]")
+        if not forms:
+            return None
+        form = forms[0]
+        fields = {field.get('name'): field.get('value', '') for field in form.xpath(".//input[@name]")
+                  if field.get('type', 'text').lower() not in ('submit', 'button', 'image', 'checkbox')}
+        username_field = form.xpath(".//input[@id='id_login']")[0].get('name')
+        password_field = form.xpath(".//input[@id='pw_login']")[0].get('name')
+        if not username_field or not password_field:
+            return None
+        action = urljoin(page_url, form.get('action') or page_url)
+        return action, (form.get('method') or 'post').upper(), fields, username_field, password_field
+    
+    def login(self, username, password):
+        """로그인 성공 시 Selenium 형식 쿠키 목록, 폼을 찾지 못하거나 로그인 확인에 실패하면 None"""
+        if not self.is_available():
+            return None
+        login_url = session_store.login_url()
+        try:
+            session = requests.Session()
+            session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            page = session.get(login_url, timeout=self.timeout)
+            form = self._find_login_form(page.url, page.text)
+            if not form:
+                print(f"[HTTP LOGIN] {login_url}에서 로그인 폼을 찾지 못했습니다.")
+                return None
+            action, method, fields, username_field, password_field = form
+            fields[username_field] = username
+            fields[password_field] = password
+            session.request(method, action, data=fields, headers={'Referer': page.url}, timeout=self.timeout)
+            
+            # 메인 페이지에 로그아웃 링크가 보이면 로그인 성공
+            home = session.get(BASE_URL, timeout=self.timeout)
+            if '로그아웃' not in home.text:
+                print("[HTTP LOGIN] 로그인 확인 실패 (로그아웃 링크 없음)")
+                return None
+            
+            cookies = []
+            for cookie in session.cookies:
+                selenium_cookie = {"name": cookie.name, "value": cookie.value, "domain": cookie.domain,
+                                   "path": cookie.path or '/', "secure": bool(cookie.secure)}
+                if cookie.expires:
+                    selenium_cookie["expiry"] = int(cookie.expires)
+                cookies.append(selenium_cookie)
+            print(f"[HTTP LOGIN] 브라우저 없이 로그인 완료 (쿠키 {len(cookies)}개)")
+            return cookies
+        except Exception as e:
+            print(f"[HTTP LOGIN] 실패, Selenium 로그인으로 대체: {e}")
+            return None
+
+http_login = HttpLoginClient()
+
+# 여러 드라이버가 동시에 만들어져도 실제 로그인은 한 번만 하도록 잠금
+login_lock = threading.Lock()
+
 class CatchScraper:
-    def __init__(self):
+    # 요소를 찾을 때 기본으로 기다리는 시간 (초)
+    IMPLICIT_WAIT = 10
+    
+    def __init__(self, debug_port=9222):
         self.driver = None
         self.is_logged_in = False
+        self.debug_port = debug_port
+        self.network = None
+        self.login_page_url = None
+        self.session_verified_at = 0.0
+        self.started_at = None
+        self._init_lock = threading.Lock()
         
     def init_driver(self):
-        """Chrome 드라이버 초기화"""
+        """Chrome 드라이버 초기화 (이미 살아있는 드라이버가 있으면 새로 띄우지 않음)"""
+        with self._init_lock:
+            if self.is_alive():
+                return True
+            if self.driver:
+                print(f"응답 없는 드라이버를 종료하고 다시 시작합니다. (port={self.debug_port})")
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
+            self.is_logged_in = False
+            self.session_verified_at = 0.0
+            return self._start_driver()
+    
+    def _start_driver(self):
+        """Chrome 실행 (init_driver에서 잠금을 잡은 상태로 호출)"""
         try:
             chrome_options = Options()
             chrome_options.add_argument('--headless')
@@ -58,7 +923,7 @@ class CatchScraper:
             chrome_options.add_argument('--disable-extensions')
             chrome_options.add_argument('--disable-web-security')
             chrome_options.add_argument('--disable-features=VizDisplayCompositor')
-            chrome_options.add_argument('--remote-debugging-port=9222')
+            chrome_options.add_argument(f'--remote-debugging-port={self.debug_port}')
             chrome_options.add_argument('--disable-background-timer-throttling')
             chrome_options.add_argument('--disable-renderer-backgrounding')
             chrome_options.add_argument('--disable-backgrounding-occluded-windows')
@@ -76,11 +941,15 @@ class CatchScraper:
                 }
             }
             chrome_options.add_experimental_option('prefs', prefs)
+            # 네트워크 유휴 상태 감지를 위해 CDP Network 이벤트를 performance 로그로 수집
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
 
             self.driver = webdriver.Chrome(options=chrome_options)
+            self.network = NetworkMonitor(self.driver)
+            self.started_at = time.monotonic()
 
             self.driver.set_page_load_timeout(30)
-            self.driver.implicitly_wait(10)
+            self.driver.implicitly_wait(self.IMPLICIT_WAIT)
 
             return True
         except Exception as e:
@@ -89,6 +958,15 @@ class CatchScraper:
             traceback.print_exc()
             return False
     
+    @contextmanager
+    def _no_implicit_wait(self):
+        """없을 수도 있는 요소를 찾을 때 암묵적 대기(IMPLICIT_WAIT) 없이 바로 결과를 받도록 잠시 해제"""
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self.IMPLICIT_WAIT)
+    
     def _find_element_with_fallbacks(self, wait, selectors):
         """여러 선택자를 시도해서 요소 찾기"""
         for selector_value in [s[1] for s in selectors]:
@@ -98,35 +976,111 @@ class CatchScraper:
                 continue
         return None
     
-    def _is_page_changed(self, driver, previous_first_job_title):
-        """페이지가 실제로 변경되었는지 확인"""
+    def arm_rows_observer(self):
+        """공고 목록 변경 감지용 MutationObserver를 설치하고 현재 상태 반환 (클릭 직전에 호출)"""
         try:
-            # 현재 첫 번째 공고 제목 가져오기
-            current_first_job = driver.find_element(By.XPATH, "//tbody//tr[1]//p[contains(@class, 'subj2')]")
-            current_first_job_title = current_first_job.text.strip()
-            
-            # 이전 제목과 다르면 페이지가 변경된 것
-            if current_first_job_title != previous_first_job_title and current_first_job_title != "":
-                print(f"페이지 변경 확인: '{previous_first_job_title}' -> '{current_first_job_title}'")
-                return True
-            
-            # 공고 목록이 로드되었는지도 확인
-            job_rows = driver.find_elements(By.XPATH, "//tbody//tr")
-            if len(job_rows) > 0:
-                # 첫 번째 공고의 회사명도 확인
-                try:
-                    first_company = driver.find_element(By.XPATH, "//tbody//tr[1]//p[contains(@class, 'name2')]")
-                    if first_company.text.strip() != "":
-                        return True
-                except Exception:
-                    pass
+            return self.driver.execute_script(ROWS_OBSERVER_SCRIPT)
+        except Exception:
+            return {"epoch": None, "version": 0, "quiet_ms": 0, "rows": 0}
+    
+    def wait_for_rows_change(self, armed_state, timeout=READY_TIMEOUT):
+        """armed_state 이후 공고 행이 바뀌고 ROWS_QUIET_MS 동안 안정될 때까지 대기
+        
+        행 변화 없이 네트워크가 유휴 상태가 되면 페이지가 바뀌지 않은 것으로 보고 False 반환
+        """
+        started = time.monotonic()
+        while time.monotonic() - started < timeout:
+            try:
+                state = self.driver.execute_script(ROWS_OBSERVER_SCRIPT)
+            except Exception:
+                time.sleep(0.1)
+                continue
             
+            changed = state['epoch'] != armed_state['epoch'] or state['version'] > armed_state['version']
+            if changed:
+                if state['rows'] > 0 and state['quiet_ms'] >= ROWS_QUIET_MS:
+                    return True
+            elif self.network and self.network.available:
+                elapsed_ms = (time.monotonic() - started) * 1000
+                if elapsed_ms >= NETWORK_IDLE_MS and self.network.is_idle():
+                    return False
+            time.sleep(0.1)
+        
+        print(f"공고 목록 변경 대기 시간 초과 ({timeout:.0f}초)")
+        return False
+    
+    def wait_for_rows_settled(self, timeout=READY_TIMEOUT):
+        """공고 행이 존재하고 ROWS_QUIET_MS 동안 변하지 않을 때까지 대기"""
+        def rows_settled(driver):
+            state = driver.execute_script(ROWS_OBSERVER_SCRIPT)
+            return state['rows'] > 0 and state['quiet_ms'] >= ROWS_QUIET_MS
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(rows_settled)
+            return True
+        except TimeoutException:
+            print(f"공고 목록 로딩 대기 시간 초과 ({timeout:.0f}초)")
             return False
-            
-        except Exception:
+    
+    def wait_for_network_idle(self, timeout=READY_TIMEOUT, idle_ms=NETWORK_IDLE_MS):
+        """CDP Network 이벤트 기준으로 네트워크가 유휴 상태가 될 때까지 대기"""
+        if not self.network or not self.network.available:
+            return False
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: self.network.is_idle(idle_ms)
+            )
+            return True
+        except TimeoutException:
             return False
     
-    def login(self, username='test0137', password='#test0808'):
+    def wait_for_page_ready(self, previous_url=None, timeout=READY_TIMEOUT):
+        """(URL 변경 →) document 로딩 완료 → 네트워크 유휴 순서로 대기"""
+        started = time.monotonic()
+        try:
+            if previous_url:
+                WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                    lambda driver: driver.current_url != previous_url
+                )
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            print(f"페이지 로딩 대기 시간 초과 ({timeout:.0f}초)")
+        
+        remaining = max(0.5, timeout - (time.monotonic() - started))
+        return self.wait_for_network_idle(timeout=remaining)
+    
+    def extract_page_rows(self):
+        """현재 페이지의 공고 행 전체 추출 (ROW_EXTRACTION_MODE에 따라 JS 일괄 추출 또는 lxml 파싱)"""
+        return self.submit_page_rows().result()
+    
+    def submit_page_rows(self):
+        """현재 페이지의 공고 행 추출을 Future로 반환 (lxml 모드는 page_source만 가져오고 파싱은 워커 스레드에서 수행)"""
+        if ROW_EXTRACTION_MODE == 'lxml' and job_list_parser:
+            return parse_executor.submit(job_list_parser.parse, self.driver.page_source)
+        
+        future = Future()
+        try:
+            future.set_result(self._extract_page_rows_js())
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def _extract_page_rows_js(self):
+        """현재 페이지의 공고 행 전체를 한 번의 JavaScript 실행으로 추출"""
+        rows = self.driver.execute_script(JOB_ROWS_SCRIPT) or []
+        return [{
+            "title": row.get("title", ""),
+            "company": row.get("company", ""),
+            "job_info": row.get("job_info", []),
+            "conditions": row.get("conditions", []),  # 경력, 학력, 고용형태 등
+            "registration_info": row.get("registration_info", []),  # 등록일, 마감일 등
+            "url": row.get("url", ""),
+            "job_id": job_id_from_url(row.get("url", ""))
+        } for row in rows]
+    
+    def login(self, username=CATCH_USERNAME, password=CATCH_PASSWORD):
         """CATCH 사이트 로그인"""
         try:
             self.driver.get(BASE_URL)
@@ -141,6 +1095,7 @@ class CatchScraper:
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.ID, "id_login"))
             )
+            self.login_page_url = self.driver.current_url
             
             id_input = self.driver.find_element(By.ID, "id_login")
             password_input = self.driver.find_element(By.ID, "pw_login")
@@ -157,6 +1112,8 @@ class CatchScraper:
                     len(driver.find_elements(By.ID, "id_login")) == 0
                 )
                 self.is_logged_in = True
+                self.session_verified_at = time.monotonic()
+                self._save_session(username)
                 return {"success": True, "message": "로그인 성공"}
             except Exception:
                 try:
@@ -167,6 +1124,97 @@ class CatchScraper:
         except Exception as e:
             return {"success": False, "message": str(e)}
     
+    def _save_session(self, username):
+        """로그인된 쿠키를 저장하고 HTTP 빠른 경로 세션에도 복사 (실패해도 로그인 결과에는 영향 없음)"""
+        try:
+            session_store.save(username, self.driver.get_cookies(), login_url=self.login_page_url)
+            listing_api.sync_cookies(self.driver)
+        except Exception as e:
+            print(f"세션 쿠키 저장 실패: {e}")
+    
+    def restore_session(self, cookies):
+        """저장된 쿠키를 넣고 메인 페이지 한 번으로 로그인 상태 확인"""
+        try:
+            # 쿠키는 해당 도메인 페이지에서만 추가할 수 있음
+            self.driver.get(BASE_URL)
+            for cookie in cookies:
+                cookie = {key: value for key, value in cookie.items() if key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'expiry')}
+                if 'expiry' in cookie:
+                    cookie['expiry'] = int(cookie['expiry'])
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception as e:
+                    print(f"쿠키 추가 실패 ({cookie.get('name')}): {e}")
+            
+            self.driver.get(BASE_URL)
+            self.wait_for_page_ready()
+            return bool(self.driver.execute_script(LOGIN_PROBE_SCRIPT))
+        except Exception as e:
+            print(f"세션 복원 실패: {e}")
+            return False
+    
+    def ensure_login(self, username=CATCH_USERNAME, password=CATCH_PASSWORD, force=False):
+        """저장된 세션 쿠키 → HTTP 폼 로그인 쿠키 → 브라우저 로그인 순서로 로그인"""
+        cookies = None if force else session_store.load(username)
+        if cookies and self._use_cookies(cookies):
+            return {"success": True, "message": "저장된 세션으로 로그인", "method": "cookies"}
+        
+        with login_lock:
+            # 기다리는 동안 다른 드라이버가 새로 로그인했으면 그 쿠키를 사용
+            fresh_cookies = None if force else session_store.load(username)
+            if fresh_cookies and fresh_cookies != cookies and self._use_cookies(fresh_cookies):
+                return {"success": True, "message": "저장된 세션으로 로그인", "method": "cookies"}
+            if cookies:
+                print("저장된 세션이 만료되어 다시 로그인합니다.")
+            
+            http_cookies = http_login.login(username, password)
+            if http_cookies and self._use_cookies(http_cookies):
+                session_store.save(username, http_cookies)
+                return {"success": True, "message": "로그인 성공", "method": "http"}
+            
+            return dict(self.login(username, password), method="login")
+    
+    def _use_cookies(self, cookies):
+        """쿠키로 세션을 복원하고 성공하면 로그인 상태로 표시"""
+        if not self.restore_session(cookies):
+            return False
+        self.is_logged_in = True
+        self.session_verified_at = time.monotonic()
+        listing_api.sync_cookies(self.driver)
+        return True
+    
+    def verify_session(self):
+        """메인 페이지를 한 번 열어 로그인 상태가 유지되는지 확인"""
+        try:
+            self.driver.get(BASE_URL)
+            self.wait_for_page_ready()
+            logged_in = bool(self.driver.execute_script(LOGIN_PROBE_SCRIPT))
+        except Exception as e:
+            print(f"로그인 상태 확인 실패: {e}")
+            logged_in = False
+        self.is_logged_in = logged_in
+        if logged_in:
+            self.session_verified_at = time.monotonic()
+        return logged_in
+    
+    def ensure_session(self, username=CATCH_USERNAME, password=CATCH_PASSWORD, max_age=SESSION_VERIFY_INTERVAL):
+        """드라이버와 로그인 상태를 보장하고 실제로 한 작업 목록 반환 (최근에 확인된 세션이면 아무것도 하지 않음)"""
+        actions = []
+        if not self.is_alive():
+            if not self.init_driver():
+                return {"success": False, "message": "Chrome 드라이버 초기화에 실패했습니다.", "actions": actions}
+            actions.append("init")
+        
+        if self.is_logged_in and time.monotonic() - self.session_verified_at < max_age:
+            return {"success": True, "message": "이미 로그인되어 있습니다.", "actions": actions}
+        if self.is_logged_in and self.verify_session():
+            actions.append("verify")
+            return {"success": True, "message": "로그인 상태를 확인했습니다.", "actions": actions}
+        
+        result = self.ensure_login(username, password)
+        actions.append(result.get("method", "login"))
+        return dict(result, actions=actions)
+    
     def get_current_status(self):
         """현재 상태 확인"""
         if not self.driver:
@@ -199,8 +1247,9 @@ class CatchScraper:
         except Exception as e:
             return {"success": False, "message": str(e)}
     
-    def filter_it_jobs(self):
-        """IT개발 공고 필터링"""
+    def _apply_category_filter(self, category):
+        """직무 카테고리 필터 클릭 (필터 상태가 주소에 반영되면 직접 이동용 URL로 기억)"""
+        name = LISTING_CATEGORIES[category]['name']
         try:
             wait = WebDriverWait(self.driver, 10)
             
@@ -212,225 +1261,266 @@ class CatchScraper:
             
             WebDriverWait(self.driver, 2).until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'cate2')]")))
             
-            it_development = self._find_element_with_fallbacks(wait, SELECTORS['it_development'])
-            if not it_development:
-                return {"success": False, "message": "IT개발 버튼을 찾을 수 없습니다."}
+            category_button = self._find_element_with_fallbacks(wait, SELECTORS[LISTING_CATEGORIES[category]['selector']])
+            if not category_button:
+                return {"success": False, "message": f"{name} 버튼을 찾을 수 없습니다."}
             
-            self.driver.execute_script("arguments[0].click();", it_development)
+            url_before_filter = self.driver.current_url
+            armed_state = self.arm_rows_observer()
+            self.driver.execute_script("arguments[0].click();", category_button)
             
-            # 필터링 후 페이지 로딩 대기 시간 증가
-            import time
-            time.sleep(3)
+            # 필터링 결과로 공고 목록이 갱신될 때까지 대기
+            if not self.wait_for_rows_change(armed_state):
+                self.wait_for_rows_settled()
             
-            return {"success": True, "message": "IT개발 공고 필터링 완료"}
+            self._learn_listing_url(category, url_before_filter)
+            return {"success": True, "message": f"{name} 공고 필터링 완료"}
             
         except Exception as e:
             return {"success": False, "message": str(e)}
     
+    def filter_it_jobs(self):
+        """IT개발 공고 필터링"""
+        return self._apply_category_filter('it')
+    
     def filter_bigdata_ai(self):
         """빅데이터·AI 공고 필터링"""
+        return self._apply_category_filter('bigdata_ai')
+    
+    def sort_listing_newest_first(self):
+        """현재 공고 목록을 최신 등록순으로 정렬 (정렬 버튼이 없으면 False - 사이트 기본 순서 유지)"""
         try:
-            wait = WebDriverWait(self.driver, 10)
-            
-            job_category = self._find_element_with_fallbacks(wait, SELECTORS['job_category'])
-            if not job_category:
-                return {"success": False, "message": "직무 카테고리 버튼을 찾을 수 없습니다."}
-            
-            self.driver.execute_script("arguments[0].click();", job_category)
-            
-            WebDriverWait(self.driver, 2).until(EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'cate2')]")))
-            
-            bigdata_ai = self._find_element_with_fallbacks(wait, SELECTORS['bigdata_ai'])
-            if not bigdata_ai:
-                return {"success": False, "message": "빅데이터·AI 버튼을 찾을 수 없습니다."}
+            sort_button = self._find_element_with_fallbacks(WebDriverWait(self.driver, 3), SELECTORS['sort_newest'])
+            if not sort_button:
+                print("최신순 정렬 버튼을 찾을 수 없어 기본 정렬 순서를 사용합니다.")
+                return False
+            if 'on' in (sort_button.get_attribute('class') or '').split():
+                return True
             
-            self.driver.execute_script("arguments[0].click();", bigdata_ai)
+            armed_state = self.arm_rows_observer()
+            self.driver.execute_script("arguments[0].click();", sort_button)
+            if not self.wait_for_rows_change(armed_state):
+                self.wait_for_rows_settled()
+            return True
+        except Exception as e:
+            print(f"최신순 정렬 실패: {str(e)}")
+            return False
+    
+    def _learn_listing_url(self, category, url_before_filter):
+        """필터 적용으로 주소가 바뀌었으면 해당 카테고리의 목록 URL로 기억"""
+        current_url = self.driver.current_url
+        if current_url != url_before_filter and "RecruitSearch" in current_url and category not in listing_url_cache:
+            listing_url_cache[category] = current_url
+            print(f"{LISTING_CATEGORIES[category]['name']} 목록 URL 학습: {current_url}")
+    
+    def _read_current_page_number(self):
+        """페이지네이션에서 현재 선택된 페이지 번호 (페이지네이션이 없으면 None)"""
+        try:
+            return int(self.driver.find_element(By.XPATH, SELECTORS['current_page'][0][1]).text.strip())
+        except Exception:
+            return None
+    
+    def open_listing(self, category, page=1, progress=None, allow_click_fallback=True):
+        """카테고리 공고 목록의 특정 페이지 열기 (직접 URL 이동, 불가능하면 클릭 필터 + 페이지 이동)
+        
+        allow_click_fallback=False면 URL로 연 결과가 요청한 페이지가 아닐 때 1페이지부터 클릭해 가지 않고
+        목록이 끝난 것으로 보고 실패 반환 (page에 마지막 페이지로 추정한 번호)
+        """
+        if category not in LISTING_CATEGORIES:
+            return {"success": False, "message": f"알 수 없는 카테고리입니다: {category}"}
+        name = LISTING_CATEGORIES[category]['name']
+        
+        try:
+            base_url = LISTING_CATEGORIES[category]['url'] or listing_url_cache.get(category)
+            if base_url:
+                _report(progress, 'navigate', category=category, page=page, method='url')
+                self.driver.get(build_listing_url(base_url, page))
+                rows_settled = self.wait_for_rows_settled()
+                current_page = self._read_current_page_number() if rows_settled else None
+                if rows_settled and (current_page or 1) == page:
+                    return {"success": True, "message": f"{name} {page}페이지로 이동 완료", "page": page, "method": "url"}
+                if not allow_click_fallback:
+                    # 공고가 없거나 사이트가 마지막 페이지를 대신 보여준 경우
+                    last_page = min(current_page, page - 1) if current_page else page - 1
+                    return {"success": False, "message": f"{name} {page}페이지가 없습니다. (마지막 페이지: {last_page})", "page": last_page}
+                print(f"{name} {page}페이지 직접 이동 결과가 달라 클릭 방식으로 전환합니다.")
+            elif not allow_click_fallback:
+                return {"success": False, "message": f"{name} 목록 URL을 알 수 없어 {page}페이지로 바로 이동할 수 없습니다."}
+            
+            # 클릭 방식: 채용공고 페이지 → 직무 필터 → 페이지 이동
+            _report(progress, 'navigate', category=category, page=page, method='click')
+            self.driver.get(f"{BASE_URL}NCS/RecruitSearch")
+            WebDriverWait(self.driver, 10).until(EC.url_contains("RecruitSearch"))
+            
+            filter_result = self._apply_category_filter(category)
+            if not filter_result.get('success'):
+                return filter_result
+            _report(progress, 'filter', category=category)
             
-            # 필터링 후 페이지 로딩 대기 시간 증가
-            import time
-            time.sleep(3)
+            current_page = 1
+            while current_page < page:
+                if not self.go_to_next_page(current_page):
+                    return {"success": False, "message": f"{name} {page}페이지가 없습니다. (마지막 페이지: {current_page})", "page": current_page}
+                current_page += 1
             
-            return {"success": True, "message": "빅데이터·AI 공고 필터링 완료"}
+            return {"success": True, "message": f"{name} {page}페이지로 이동 완료", "page": page, "method": "click"}
             
+        except CrawlCancelled:
+            raise
         except Exception as e:
             return {"success": False, "message": str(e)}
     
-    def extract_job_list(self, max_pages=None):
-        """IT개발 공고 목록 추출 (모든 페이지)"""
-        # 기존 코드 그대로 유지
+    def open_listing_with_discovery(self, category):
+        """목록을 열면서 백그라운드 JSON 요청을 기록해 목록 API 찾기 (이미 찾았으면 open_listing과 동일)"""
+        if category in listing_endpoints or not self.network or not self.network.available:
+            return self.open_listing(category)
+        
+        self.network.start_recording()
         try:
-            wait = WebDriverWait(self.driver, 10)
-            all_jobs = []
-            current_page = 1
-            
-            while True:
-                print(f"페이지 {current_page} 추출 중...")
-                
-                # 현재 페이지의 공고 추출
-                job_rows = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//tbody//tr")))
-                
-                page_jobs = []
-                for row in job_rows:
-                    try:
-                        company_element = row.find_element(By.XPATH, ".//p[contains(@class, 'name2')]")
-                        company = company_element.text.strip()
-                        
-                        title_element = row.find_element(By.XPATH, ".//p[contains(@class, 'subj2')]")
-                        title = title_element.text.strip()
-                        
-                        link_element = row.find_element(By.XPATH, ".//a[contains(@href, 'RecruitInfoDetails')]")
-                        job_url = link_element.get_attribute('href')
-                        
-                        job_info_elements = row.find_elements(By.XPATH, ".//p[contains(@class, 'job')]//span")
-                        job_info = [info.text.strip() for info in job_info_elements]
-                        
-                        # 경력, 학력, 등록일 등 추가 정보 추출
-                        conditions = []
-                        try:
-                            condition_elements = row.find_elements(By.XPATH, ".//p[contains(@class, 'cond')]")
-                            for cond in condition_elements:
-                                conditions.append(cond.text.strip())
-                        except Exception:
-                            pass
-                        
-                        # 등록일 정보 추출
-                        registration_info = []
-                        try:
-                            date_elements = row.find_elements(By.XPATH, ".//p[contains(@class, 'date2') or contains(@class, 'num_dday')]")
-                            for date in date_elements:
-                                registration_info.append(date.text.strip())
-                        except Exception:
-                            pass
-                        
-                        page_jobs.append({
-                            "title": title,
-                            "company": company,
-                            "job_info": job_info,
-                            "conditions": conditions,  # 경력, 학력, 고용형태 등
-                            "registration_info": registration_info,  # 등록일, 마감일 등
-                            "url": job_url,
-                            "page": current_page
-                        })
-                        
-                    except Exception:
-                        continue
-                
-                all_jobs.extend(page_jobs)
-                print(f"페이지 {current_page}: {len(page_jobs)}개 공고 추출")
-                
-                # 최대 페이지 수 제한 확인
-                if max_pages and current_page >= max_pages:
-                    break
-                
-                # 다음 페이지로 이동
-                try:
-                    # 현재 페이지의 첫 번째 공고 제목 저장 (페이지 변경 확인용)
-                    first_job_title = ""
-                    try:
-                        first_job = self.driver.find_element(By.XPATH, "//tbody//tr[1]//p[contains(@class, 'subj2')]")
-                        first_job_title = first_job.text.strip()
-                    except Exception:
-                        pass
-                    
-                    # 먼저 "다음" 버튼을 찾아보고, 없으면 숫자 버튼을 찾음
-                    next_page_btn = self._find_element_with_fallbacks(wait, SELECTORS['next_page'])
-                    
-                    if next_page_btn and next_page_btn.is_enabled():
-                        # "다음" 버튼이 있는 경우 - 안전한 클릭 방식 사용
-                        print(f"다음 버튼으로 페이지 {current_page + 1} 이동 시도...")
-                        
-                        # 빈 공간 클릭으로 포커스 해제
-                        self.driver.execute_script("document.body.click();")
-                        
-                        # 충분한 지연 시간 (SPA 로딩 대기)
-                        import time
-                        time.sleep(2.0)
-                        
-                        # "다음" 버튼 클릭
-                        self.driver.execute_script("arguments[0].click();", next_page_btn)
-                        
-                        # 공고 목록이 바뀔 때까지 대기 (첫 번째 공고 제목이 변경되거나 로딩 완료)
-                        WebDriverWait(self.driver, 15).until(
-                            lambda driver: self._is_page_changed(driver, first_job_title)
-                        )
-                        
-                        # 추가 안전 대기
-                        import time
-                        time.sleep(1.0)
-                        
-                        # 페이지가 실제로 변경되었는지 확인
-                        new_first_job_title = ""
-                        try:
-                            new_first_job = self.driver.find_element(By.XPATH, "//tbody//tr[1]//p[contains(@class, 'subj2')]")
-                            new_first_job_title = new_first_job.text.strip()
-                        except Exception:
-                            pass
-                        
-                        # 페이지가 변경되지 않았다면 마지막 페이지
-                        if new_first_job_title == first_job_title:
-                            print(f"페이지가 변경되지 않음. 마지막 페이지({current_page})에 도달했습니다.")
-                            break
-                        
-                        current_page += 1
-                        print(f"다음 버튼으로 페이지 {current_page} 이동 완료")
-                    else:
-                        # "다음" 버튼이 없으면 다음 페이지 숫자 버튼을 찾음
-                        next_page_number = current_page + 1
-                        try:
-                            page_btn = self.driver.find_element(By.XPATH, f"//p[contains(@class, 'page3')]//a[text()='{next_page_number}']")
-                            
-                            if page_btn and page_btn.is_enabled():
-                                print(f"숫자 버튼으로 페이지 {next_page_number} 이동 시도...")
-                                
-                                # 빈 공간 클릭으로 포커스 해제
-                                self.driver.execute_script("document.body.click();")
-                                
-                                # 충분한 지연 시간 (SPA 로딩 대기)
-                                import time
-                                time.sleep(1.5)
-                                
-                                self.driver.execute_script("arguments[0].click();", page_btn)
-                                
-                                # 공고 목록이 바뀔 때까지 대기
-                                WebDriverWait(self.driver, 15).until(
-                                    lambda driver: self._is_page_changed(driver, first_job_title)
-                                )
-                                
-                                # 추가 안전 대기
-                                import time
-                                time.sleep(1.0)
-                                
-                                # 페이지가 실제로 변경되었는지 확인
-                                new_first_job_title = ""
-                                try:
-                                    new_first_job = self.driver.find_element(By.XPATH, "//tbody//tr[1]//p[contains(@class, 'subj2')]")
-                                    new_first_job_title = new_first_job.text.strip()
-                                except Exception:
-                                    pass
-                                
-                                # 페이지가 변경되지 않았다면 마지막 페이지
-                                if new_first_job_title == first_job_title:
-                                    print(f"페이지가 변경되지 않음. 마지막 페이지({current_page})에 도달했습니다.")
-                                    break
-                                
-                                current_page += 1
-                                print(f"숫자 버튼으로 페이지 {current_page} 이동 완료")
-                            else:
-                                # 다음 페이지 버튼이 없는 경우
-                                print(f"페이지 {next_page_number} 버튼을 찾을 수 없습니다. 마지막 페이지에 도달했습니다.")
-                                break
-                        except Exception:
-                            # 다음 페이지 버튼이 없는 경우
-                            print(f"페이지 {next_page_number} 버튼을 찾을 수 없습니다. 마지막 페이지에 도달했습니다.")
-                            break
-                    
-                except Exception as e:
-                    # 다음 페이지로 이동할 수 없는 경우
-                    print(f"페이지 이동 실패: {str(e)}")
-                    break
+            result = self.open_listing(category)
+        finally:
+            captured = self.network.stop_recording()
+        
+        if result.get('success'):
+            self._learn_listing_endpoint(category, captured)
+        return result
+    
+    def _learn_listing_endpoint(self, category, captured):
+        """기록된 JSON 요청 중 화면의 공고 목록과 응답이 일치하는 요청을 목록 API로 등록"""
+        try:
+            dom_rows = self.extract_page_rows()
+        except Exception:
+            return False
+        
+        for request_info in captured:
+            try:
+                body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_info["request_id"]})
+                endpoint = ListingEndpoint.from_capture(category, request_info, json.loads(body['body']), dom_rows)
+            except Exception:
+                continue
+            if endpoint:
+                listing_endpoints[category] = endpoint
+                listing_api.sync_cookies(self.driver)
+                print(f"{LISTING_CATEGORIES[category]['name']} 목록 API 발견: {endpoint.method} {endpoint.url}")
+                return True
+        
+        print(f"{LISTING_CATEGORIES[category]['name']} 목록 API를 찾지 못했습니다. (JSON 요청 {len(captured)}개 확인)")
+        return False
+    
+    def _read_first_job_title(self):
+        """현재 페이지 첫 번째 공고 제목 (페이지 변경 확인용)"""
+        try:
+            return self.driver.find_element(By.XPATH, "//tbody//tr[1]//p[contains(@class, 'subj2')]").text.strip()
+        except Exception:
+            return ""
+    
+    def go_to_next_page(self, current_page):
+        """다음 페이지로 이동 ("다음" 버튼 → 숫자 버튼 순서로 시도)
+        
+        이동에 성공하면 True, 마지막 페이지이거나 이동할 수 없으면 False
+        """
+        try:
+            first_job_title = self._read_first_job_title()
+            
+            # 먼저 "다음" 버튼을 찾아보고, 없으면 숫자 버튼을 찾음
+            page_btn = self._find_element_with_fallbacks(WebDriverWait(self.driver, 10), SELECTORS['next_page'])
+            if page_btn and page_btn.is_enabled():
+                method = "다음 버튼"
+            else:
+                method = "숫자 버튼"
+                try:
+                    page_btn = self.driver.find_element(By.XPATH, f"//p[contains(@class, 'page3')]//a[text()='{current_page + 1}']")
+                except Exception:
+                    page_btn = None
+                if not page_btn or not page_btn.is_enabled():
+                    print(f"페이지 {current_page + 1} 버튼을 찾을 수 없습니다. 마지막 페이지에 도달했습니다.")
+                    return False
+            
+            print(f"{method}으로 페이지 {current_page + 1} 이동 시도...")
             
-            return {"success": True, "message": f"총 {len(all_jobs)}개의 IT개발 공고를 {current_page}페이지에서 찾았습니다.", "jobs": all_jobs, "total_pages": current_page}
+            # 빈 공간 클릭으로 포커스 해제
+            self.driver.execute_script("document.body.click();")
             
+            armed_state = self.arm_rows_observer()
+            self.driver.execute_script("arguments[0].click();", page_btn)
+            
+            # 공고 목록이 바뀌고 안정될 때까지 대기
+            self.wait_for_rows_change(armed_state)
+            
+            # 첫 번째 공고 제목이 그대로면 페이지가 변경되지 않은 것 (마지막 페이지)
+            if self._read_first_job_title() == first_job_title:
+                print(f"페이지가 변경되지 않음. 마지막 페이지({current_page})에 도달했습니다.")
+                return False
+            
+            print(f"{method}으로 페이지 {current_page + 1} 이동 완료")
+            return True
+            
+        except Exception as e:
+            # 다음 페이지로 이동할 수 없는 경우
+            print(f"페이지 이동 실패: {str(e)}")
+            return False
+    
+    def iter_pages(self, max_pages=None, start_page=1):
+        """현재 필터 상태의 공고 목록을 페이지 단위로 (페이지 번호, 공고 목록) 생성
+        
+        제너레이터이므로 호출 측에서 중간에 멈추거나 페이지마다 바로 처리/전송할 수 있음
+        start_page는 현재 드라이버가 보고 있는 페이지 번호 (open_listing으로 이동한 경우)
+        """
+        wait = WebDriverWait(self.driver, 10)
+        current_page = start_page
+        
+        while True:
+            print(f"페이지 {current_page} 추출 중...")
+            
+            # 공고 목록 로딩 대기 후 현재 페이지의 공고 일괄 추출
+            wait.until(EC.presence_of_all_elements_located((By.XPATH, "//tbody//tr")))
+            rows_future = self.submit_page_rows()
+            
+            has_next = None
+            if not rows_future.done():
+                # lxml 파싱이 워커 스레드에서 진행되는 동안 다음 페이지로 미리 이동
+                has_next = self._advance_page(current_page, current_page - start_page + 1, max_pages)
+            
+            yield current_page, [dict(row, page=current_page) for row in rows_future.result()]
+            
+            if has_next is None:
+                has_next = self._advance_page(current_page, current_page - start_page + 1, max_pages)
+            if not has_next:
+                return
+            current_page += 1
+    
+    def _advance_page(self, current_page, pages_read, max_pages):
+        """최대 페이지 수 제한을 확인한 뒤 다음 페이지로 이동"""
+        if max_pages and pages_read >= max_pages:
+            return False
+        return self.go_to_next_page(current_page)
+    
+    def iter_jobs(self, max_pages=None, company_name=None, start_page=1):
+        """공고를 한 건씩 생성 (company_name이 있으면 해당 기업 공고만, 부분 일치)"""
+        for _, page_jobs in self.iter_pages(max_pages, start_page):
+            for job in page_jobs:
+                if company_name and company_name.lower() not in job["company"].lower():
+                    continue
+                yield job
+    
+    def extract_job_list(self, max_pages=None, start_page=1, end_page=None, progress=None):
+        """IT개발 공고 목록 추출 (모든 페이지, end_page가 있으면 start_page~end_page 구간만)"""
+        if end_page:
+            max_pages = end_page - start_page + 1
+        try:
+            all_jobs = []
+            total_pages = 0
+            
+            for page, page_jobs in self.iter_pages(max_pages, start_page):
+                all_jobs.extend(page_jobs)
+                total_pages = page
+                print(f"페이지 {page}: {len(page_jobs)}개 공고 추출")
+                _report(progress, 'page', page=page, rows=len(page_jobs))
+            
+            return {"success": True, "message": f"총 {len(all_jobs)}개의 IT개발 공고를 {total_pages}페이지에서 찾았습니다.", "jobs": all_jobs, "total_pages": total_pages}
+            
+        except CrawlCancelled:
+            raise
         except Exception as e:
             return {"success": False, "message": str(e)}
     
@@ -442,9 +1532,8 @@ class CatchScraper:
             
             print("첫 페이지에서 공고 추출 중...")
             
-            # 페이지 로딩 대기
-            import time
-            time.sleep(2)
+            # 공고 목록이 로딩되고 안정될 때까지 대기
+            self.wait_for_rows_settled()
             
             # 현재 페이지의 공고 추출
             job_rows = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//tbody//tr")))
@@ -452,53 +1541,9 @@ class CatchScraper:
             print(f"페이지에서 총 {len(job_rows)}개의 공고 행을 발견했습니다.")
             
             # 최대 10개까지만 추출
-            for i, row in enumerate(job_rows[:max_jobs]):
-                try:
-                    company_element = row.find_element(By.XPATH, ".//p[contains(@class, 'name2')]")
-                    company = company_element.text.strip()
-                    
-                    title_element = row.find_element(By.XPATH, ".//p[contains(@class, 'subj2')]")
-                    title = title_element.text.strip()
-                    
-                    link_element = row.find_element(By.XPATH, ".//a[contains(@href, 'RecruitInfoDetails')]")
-                    job_url = link_element.get_attribute('href')
-                    
-                    job_info_elements = row.find_elements(By.XPATH, ".//p[contains(@class, 'job')]//span")
-                    job_info = [info.text.strip() for info in job_info_elements]
-                    
-                    # 경력, 학력, 등록일 등 추가 정보 추출
-                    conditions = []
-                    try:
-                        condition_elements = row.find_elements(By.XPATH, ".//p[contains(@class, 'cond')]")
-                        for cond in condition_elements:
-                            conditions.append(cond.text.strip())
-                    except Exception:
-                        pass
-                    
-                    # 등록일 정보 추출
-                    registration_info = []
-                    try:
-                        date_elements = row.find_elements(By.XPATH, ".//p[contains(@class, 'date2') or contains(@class, 'num_dday')]")
-                        for date in date_elements:
-                            registration_info.append(date.text.strip())
-                    except Exception:
-                        pass
-                    
-                    all_jobs.append({
-                        "title": title,
-                        "company": company,
-                        "job_info": job_info,
-                        "conditions": conditions,  # 경력, 학력, 고용형태 등
-                        "registration_info": registration_info,  # 등록일, 마감일 등
-                        "url": job_url,
-                        "page": 1
-                    })
-                    
-                    print(f"공고 {len(all_jobs)} 추출 성공: {company} - {title}")
-                    
-                except Exception as e:
-                    print(f"행 {i+1} 추출 실패: {str(e)}")
-                    continue
+            for row in self.extract_page_rows()[:max_jobs]:
+                all_jobs.append(dict(row, page=1))
+                print(f"공고 {len(all_jobs)} 추출 성공: {row['company']} - {row['title']}")
             
             print(f"첫 페이지에서 {len(all_jobs)}개 공고 추출 완료")
             
@@ -507,187 +1552,26 @@ class CatchScraper:
         except Exception as e:
             return {"success": False, "message": str(e)}
     
-    def extract_company_jobs(self, company_name, max_pages=None):
+    def extract_company_jobs(self, company_name, max_pages=None, progress=None):
         """특정 기업의 공고만 추출 (모든 페이지)"""
         try:
-            wait = WebDriverWait(self.driver, 10)
             all_jobs = []
-            current_page = 1
+            total_pages = 0
             
             print(f"'{company_name}' 기업 공고 검색 중...")
             
-            while True:
-                print(f"페이지 {current_page}에서 '{company_name}' 기업 공고 검색 중...")
-                
-                # 현재 페이지의 공고 추출
-                job_rows = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//tbody//tr")))
-                
-                page_jobs = []
-                for row in job_rows:
-                    try:
-                        company_element = row.find_element(By.XPATH, ".//p[contains(@class, 'name2')]")
-                        company = company_element.text.strip()
-                        
-                        # 기업명이 일치하는지 확인 (부분 일치)
-                        if company_name.lower() not in company.lower():
-                            continue
-                        
-                        title_element = row.find_element(By.XPATH, ".//p[contains(@class, 'subj2')]")
-                        title = title_element.text.strip()
-                        
-                        link_element = row.find_element(By.XPATH, ".//a[contains(@href, 'RecruitInfoDetails')]")
-                        job_url = link_element.get_attribute('href')
-                        
-                        job_info_elements = row.find_elements(By.XPATH, ".//p[contains(@class, 'job')]//span")
-                        job_info = [info.text.strip() for info in job_info_elements]
-                        
-                        # 경력, 학력, 등록일 등 추가 정보 추출
-                        conditions = []
-                        try:
-                            condition_elements = row.find_elements(By.XPATH, ".//p[contains(@class, 'cond')]")
-                            for cond in condition_elements:
-                                conditions.append(cond.text.strip())
-                        except Exception:
-                            pass
-                        
-                        # 등록일 정보 추출
-                        registration_info = []
-                        try:
-                            date_elements = row.find_elements(By.XPATH, ".//p[contains(@class, 'date2') or contains(@class, 'num_dday')]")
-                            for date in date_elements:
-                                registration_info.append(date.text.strip())
-                        except Exception:
-                            pass
-                        
-                        page_jobs.append({
-                            "title": title,
-                            "company": company,
-                            "job_info": job_info,
-                            "conditions": conditions,  # 경력, 학력, 고용형태 등
-                            "registration_info": registration_info,  # 등록일, 마감일 등
-                            "url": job_url,
-                            "page": current_page
-                        })
-                        
-                    except Exception:
-                        continue
-                
+            for page, page_jobs in self.iter_pages(max_pages):
+                # 기업명이 일치하는지 확인 (부분 일치)
+                page_jobs = [job for job in page_jobs if company_name.lower() in job["company"].lower()]
                 all_jobs.extend(page_jobs)
-                print(f"페이지 {current_page}: '{company_name}' 기업 공고 {len(page_jobs)}개 발견")
-                
-                # 최대 페이지 수 제한 확인
-                if max_pages and current_page >= max_pages:
-                    break
-                
-                # 다음 페이지로 이동
-                try:
-                    # 현재 페이지의 첫 번째 공고 제목 저장 (페이지 변경 확인용)
-                    first_job_title = ""
-                    try:
-                        first_job = self.driver.find_element(By.XPATH, "//tbody//tr[1]//p[contains(@class, 'subj2')]")
-                        first_job_title = first_job.text.strip()
-                    except Exception:
-                        pass
-                    
-                    # 먼저 "다음" 버튼을 찾아보고, 없으면 숫자 버튼을 찾음
-                    next_page_btn = self._find_element_with_fallbacks(wait, SELECTORS['next_page'])
-                    
-                    if next_page_btn and next_page_btn.is_enabled():
-                        # "다음" 버튼이 있는 경우 - 안전한 클릭 방식 사용
-                        print(f"다음 버튼으로 페이지 {current_page + 1} 이동 시도...")
-                        
-                        # 빈 공간 클릭으로 포커스 해제
-                        self.driver.execute_script("document.body.click();")
-                        
-                        # 충분한 지연 시간 (SPA 로딩 대기)
-                        import time
-                        time.sleep(2.0)
-                        
-                        # "다음" 버튼 클릭
-                        self.driver.execute_script("arguments[0].click();", next_page_btn)
-                        
-                        # 공고 목록이 바뀔 때까지 대기 (첫 번째 공고 제목이 변경되거나 로딩 완료)
-                        WebDriverWait(self.driver, 15).until(
-                            lambda driver: self._is_page_changed(driver, first_job_title)
-                        )
-                        
-                        # 추가 안전 대기
-                        import time
-                        time.sleep(1.0)
-                        
-                        # 페이지가 실제로 변경되었는지 확인
-                        new_first_job_title = ""
-                        try:
-                            new_first_job = self.driver.find_element(By.XPATH, "//tbody//tr[1]//p[contains(@class, 'subj2')]")
-                            new_first_job_title = new_first_job.text.strip()
-                        except Exception:
-                            pass
-                        
-                        # 페이지가 변경되지 않았다면 마지막 페이지
-                        if new_first_job_title == first_job_title:
-                            print(f"페이지가 변경되지 않음. 마지막 페이지({current_page})에 도달했습니다.")
-                            break
-                        
-                        current_page += 1
-                        print(f"다음 버튼으로 페이지 {current_page} 이동 완료")
-                    else:
-                        # "다음" 버튼이 없으면 다음 페이지 숫자 버튼을 찾음
-                        next_page_number = current_page + 1
-                        try:
-                            page_btn = self.driver.find_element(By.XPATH, f"//p[contains(@class, 'page3')]//a[text()='{next_page_number}']")
-                            
-                            if page_btn and page_btn.is_enabled():
-                                print(f"숫자 버튼으로 페이지 {next_page_number} 이동 시도...")
-                                
-                                # 빈 공간 클릭으로 포커스 해제
-                                self.driver.execute_script("document.body.click();")
-                                
-                                # 충분한 지연 시간 (SPA 로딩 대기)
-                                import time
-                                time.sleep(1.5)
-                                
-                                self.driver.execute_script("arguments[0].click();", page_btn)
-                                
-                                # 공고 목록이 바뀔 때까지 대기
-                                WebDriverWait(self.driver, 15).until(
-                                    lambda driver: self._is_page_changed(driver, first_job_title)
-                                )
-                                
-                                # 추가 안전 대기
-                                import time
-                                time.sleep(1.0)
-                                
-                                # 페이지가 실제로 변경되었는지 확인
-                                new_first_job_title = ""
-                                try:
-                                    new_first_job = self.driver.find_element(By.XPATH, "//tbody//tr[1]//p[contains(@class, 'subj2')]")
-                                    new_first_job_title = new_first_job.text.strip()
-                                except Exception:
-                                    pass
-                                
-                                # 페이지가 변경되지 않았다면 마지막 페이지
-                                if new_first_job_title == first_job_title:
-                                    print(f"페이지가 변경되지 않음. 마지막 페이지({current_page})에 도달했습니다.")
-                                    break
-                                
-                                current_page += 1
-                                print(f"숫자 버튼으로 페이지 {current_page} 이동 완료")
-                            else:
-                                # 다음 페이지 버튼이 없는 경우
-                                print(f"페이지 {next_page_number} 버튼을 찾을 수 없습니다. 마지막 페이지에 도달했습니다.")
-                                break
-                        except Exception:
-                            # 다음 페이지 버튼이 없는 경우
-                            print(f"페이지 {next_page_number} 버튼을 찾을 수 없습니다. 마지막 페이지에 도달했습니다.")
-                            break
-                    
-                except Exception as e:
-                    # 다음 페이지로 이동할 수 없는 경우
-                    print(f"페이지 이동 실패: {str(e)}")
-                    break
+                total_pages = page
+                print(f"페이지 {page}: '{company_name}' 기업 공고 {len(page_jobs)}개 발견")
+                _report(progress, 'page', page=page, rows=len(page_jobs))
             
-            return {"success": True, "message": f"'{company_name}' 기업의 총 {len(all_jobs)}개 공고를 {current_page}페이지에서 찾았습니다.", "jobs": all_jobs, "total_pages": current_page, "company": company_name}
+            return {"success": True, "message": f"'{company_name}' 기업의 총 {len(all_jobs)}개 공고를 {total_pages}페이지에서 찾았습니다.", "jobs": all_jobs, "total_pages": total_pages, "company": company_name}
             
+        except CrawlCancelled:
+            raise
         except Exception as e:
             return {"success": False, "message": str(e)}
     
@@ -695,13 +1579,41 @@ class CatchScraper:
         """특정 공고의 상세 내용 추출"""
         try:
             print(f"공고 상세 페이지로 이동: {job_url}")
-            self.driver.get(job_url)
-            
             wait = WebDriverWait(self.driver, 10)
             
-            # 페이지 로딩 대기
-            import time
-            time.sleep(3)
+            for attempt in range(2):
+                try:
+                    self.driver.get(job_url)
+                    # 페이지 로딩 대기 (document 로딩 완료 + 네트워크 유휴)
+                    self.wait_for_page_ready()
+                    missing_reason = self._detect_missing_job()
+                except UnexpectedAlertPresentException as e:
+                    # 기본 설정(dismiss and notify)에서는 삭제된 공고의 경고창이 닫히면서 예외로 전달됨
+                    missing_reason = e.alert_text or "경고창"
+                # 로그인 페이지 주소의 returnUrl에도 상세 주소가 들어가므로 경로만 비교
+                if missing_reason or "RecruitInfoDetails" in urlsplit(self.driver.current_url).path:
+                    break
+                
+                # 상세 페이지 밖으로 이동했지만 삭제 안내가 없으면 공고가 없다고 단정하지 않음 (not_found 캐시에 넣지 않음)
+                redirected_url = self.driver.current_url
+                if attempt == 0 and "Login" in urlsplit(redirected_url).path:
+                    print("세션이 만료되어 로그인 페이지로 이동했습니다. 다시 로그인한 뒤 공고를 다시 엽니다.")
+                    self.is_logged_in = False
+                    if self.ensure_login().get('success'):
+                        continue
+                return {
+                    "success": False,
+                    "error": f"상세 페이지가 아닌 곳으로 이동: {redirected_url}",
+                    "message": "공고 상세 정보 추출 실패"
+                }
+            if missing_reason:
+                print(f"공고를 볼 수 없습니다: {missing_reason}")
+                return {
+                    "success": False,
+                    "not_found": True,
+                    "error": missing_reason,
+                    "message": "삭제되었거나 존재하지 않는 공고입니다"
+                }
             
             job_detail = {
                 "company_name": "",
@@ -782,12 +1694,25 @@ class CatchScraper:
                 print(f"클릭 전 URL: {current_url}")
                 
                 # 새 탭에서 열기 위해 JavaScript 실행
+                window_count = len(self.driver.window_handles)
                 self.driver.execute_script("arguments[0].click();", apply_element)
-                time.sleep(3)
+                
+                # 새 탭이 열릴 때까지 대기
+                try:
+                    WebDriverWait(self.driver, 5, poll_frequency=0.1).until(EC.number_of_windows_to_be(window_count + 1))
+                except TimeoutException:
+                    pass
                 
                 # 새 탭으로 전환
                 if len(self.driver.window_handles) > 1:
                     self.driver.switch_to.window(self.driver.window_handles[-1])
+                    # 새 탭의 주소가 정해질 때까지 대기
+                    try:
+                        WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
+                            lambda driver: driver.current_url not in ("", "about:blank")
+                        )
+                    except TimeoutException:
+                        pass
                     new_url = self.driver.current_url
                     print(f"지원 페이지 URL: {new_url}")
                     
@@ -821,7 +1746,7 @@ class CatchScraper:
                 if iframe_src:
                     print(f"상세 내용 iframe으로 이동: {iframe_src}")
                     self.driver.get(iframe_src)
-                    time.sleep(2)
+                    self.wait_for_page_ready()
                     
                     # 상세 내용 추출 (HTML 전체)
                     detail_content = self.driver.find_element(By.TAG_NAME, "body").get_attribute('innerHTML')
@@ -847,11 +1772,83 @@ class CatchScraper:
                 "message": "공고 상세 정보 추출 실패"
             }
     
+    def _detect_missing_job(self):
+        """삭제/마감된 공고 페이지인지 바로 확인 (경고창 또는 MISSING_JOB_MARKERS 안내 문구), 정상이면 None
+        
+        로그인 페이지 등으로 이동한 것만으로는 공고가 없다고 보지 않음 (호출 측에서 오류로 처리)
+        """
+        try:
+            alert = self.driver.switch_to.alert
+            alert_text = alert.text
+            alert.accept()
+            return alert_text or "경고창"
+        except Exception:
+            pass
+        
+        with self._no_implicit_wait():
+            if "RecruitInfoDetails" in urlsplit(self.driver.current_url).path and self.driver.find_elements(By.XPATH, "//h2[@class='subj']"):
+                return None
+        body_text = self.driver.execute_script("return document.body ? document.body.innerText : '';") or ""
+        return next((marker for marker in MISSING_JOB_MARKERS if marker in body_text), None)
+    
     def close_driver(self):
         """드라이버 종료"""
         if self.driver:
             self.driver.quit()
     
+    def memory_mb(self, use_cdp=True):
+        """브라우저 메모리 사용량 (MB) - /proc의 Chrome 프로세스 PSS 합계, 없으면 CDP JS 힙 크기"""
+        try:
+            pss = process_tree_pss_mb(self.driver.service.process.pid)
+            if pss is not None:
+                return pss
+        except Exception:
+            pass
+        if not use_cdp:
+            return None
+        try:
+            self.driver.execute_cdp_cmd('Performance.enable', {})
+            metrics = self.driver.execute_cdp_cmd('Performance.getMetrics', {}).get('metrics', [])
+            heap = next((metric['value'] for metric in metrics if metric['name'] == 'JSHeapTotalSize'), None)
+            return round(heap / (1024 * 1024), 1) if heap else None
+        except Exception:
+            return None
+    
+    def usage(self, include_memory=True, passive=False):
+        """교체 판단용 사용량 (로드한 문서 수, 가동 시간, 메모리)
+        
+        passive=True면 드라이버 명령을 보내지 않음 (다른 스레드가 사용 중인 드라이버 조회용)
+        """
+        if self.network and not passive:
+            self.network.poll()
+        return {
+            "port": self.debug_port,
+            "pages": self.network.documents_loaded if self.network else 0,
+            "age": round(time.monotonic() - self.started_at, 1) if self.started_at else 0,
+            "memory_mb": self.memory_mb(use_cdp=not passive) if include_memory else None
+        }
+    
+    def recycle_reason(self, include_memory=True):
+        """교체 기준을 넘었으면 사유 문자열, 아니면 None"""
+        usage = self.usage(include_memory)
+        if DRIVER_RECYCLE_MAX_PAGES and usage["pages"] >= DRIVER_RECYCLE_MAX_PAGES:
+            return f"문서 {usage['pages']}개 로드"
+        if DRIVER_RECYCLE_MAX_AGE and usage["age"] >= DRIVER_RECYCLE_MAX_AGE:
+            return f"가동 {usage['age']:.0f}초"
+        if DRIVER_RECYCLE_MAX_MEMORY_MB and usage["memory_mb"] and usage["memory_mb"] >= DRIVER_RECYCLE_MAX_MEMORY_MB:
+            return f"메모리 {usage['memory_mb']}MB"
+        return None
+    
+    def is_alive(self):
+        """드라이버가 살아있는지 확인"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.window_handles
+            return True
+        except Exception:
+            return False
+    
     def search_company(self, company_name):
         """기업 검색"""
         try:
@@ -861,8 +1858,7 @@ class CatchScraper:
             wait = WebDriverWait(self.driver, 10)
             
             # 페이지 로딩 대기
-            import time
-            time.sleep(3)
+            self.wait_for_page_ready()
             
             # 검색창 찾기
             search_input = wait.until(EC.presence_of_element_located((By.XPATH, "//input[@placeholder='궁금한 기업을 검색해 보세요.']")))
@@ -871,270 +1867,83 @@ class CatchScraper:
             
             # 검색 버튼 클릭
             search_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@class='bt_sch']")))
+            search_url = self.driver.current_url
             search_button.click()
             
-            # 검색 결과 로딩 대기
-            time.sleep(3)
+            # 검색 결과 로딩 대기 (URL 변경 또는 네트워크 유휴)
+            self.wait_for_page_ready(previous_url=search_url)
             
-            # 검색 결과에서 정확한 기업명 찾기
-            company_links = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//ul[@class='list_corp_round']//li//p[@class='name']//a")))
+            # 검색 결과에서 기업명 찾기 (정확히 일치 → 법인 표기/공백을 뺀 이름 일치 순서)
+            # 결과가 없는 검색은 목록이 아예 없으므로 기다리지 않고 바로 확인
+            with self._no_implicit_wait():
+                company_links = self.driver.find_elements(By.XPATH, "//ul[@class='list_corp_round']//li//p[@class='name']//a")
+            if not company_links:
+                return {"success": False, "not_found": True, "message": f"'{company_name}' 검색 결과가 없습니다.", "companies": []}
+            companies = [{"name": link.text.strip(), "url": link.get_attribute('href')} for link in company_links]
             
-            target_company_url = None
-            for link in company_links:
-                company_text = link.text.strip()
-                if company_text == company_name:
-                    target_company_url = link.get_attribute('href')
-                    print(f"정확한 기업명 발견: {company_text}")
-                    break
+            target = next((company for company in companies if company["name"] == company_name), None)
+            if not target:
+                normalized_name = normalize_company_name(company_name)
+                target = next((company for company in companies if normalize_company_name(company["name"]) == normalized_name), None)
             
-            if not target_company_url:
-                return {"success": False, "message": f"'{company_name}' 기업을 찾을 수 없습니다."}
+            if not target:
+                return {"success": False, "not_found": True, "message": f"'{company_name}' 기업을 찾을 수 없습니다.", "companies": companies}
             
-            return {"success": True, "company_url": target_company_url, "message": f"'{company_name}' 기업을 찾았습니다."}
+            print(f"기업명 발견: {target['name']}")
+            return {"success": True, "company_url": target["url"], "company_name": target["name"], "companies": companies,
+                    "message": f"'{company_name}' 기업을 찾았습니다."}
             
         except Exception as e:
             return {"success": False, "message": str(e)}
     
-    def extract_company_detail(self, company_url):
-        """기업 상세 정보 추출"""
+    def extract_company_detail(self, company_url, progress=None, sections=COMPANY_DETAIL_SECTIONS):
+        """기업 상세 정보 추출 (sections로 profile, salary, reviews 중 필요한 부분만 추출 가능)
+        
+        결과의 company_detail에는 요청한 섹션의 필드만 들어가고, 추출에 실패한 섹션은 failed_sections에 표시
+        """
         try:
             print(f"기업 상세 페이지로 이동: {company_url}")
+            _report(progress, 'navigate', url=company_url)
             self.driver.get(company_url)
             
             wait = WebDriverWait(self.driver, 10)
             
-            # 페이지 로딩 대기
-            import time
-            time.sleep(3)
-            
-            company_detail = {
-                "company_name": "",
-                "industry": "",
-                "company_type": "",
-                "location": "",
-                "employee_count": "",
-                "revenue": "",
-                "ceo": "",
-                "establishment_date": "",
-                "company_form": "",
-                "credit_rating": "",
-                "tags": [],
-                "recommendation_keywords": [],
-                "starting_salary": "",
-                "average_salary": "",
-                "industry_average_salary": "",
-                "reviews": []
-            }
-            
-            try:
-                # 기업명 추출 (수정된 XPath)
-                company_name_element = wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='name']//h2")))
-                company_detail["company_name"] = company_name_element.text.strip()
-            except:
-                print("기업명 추출 실패")
-            
-            try:
-                # 업종 추출 (수정된 XPath)
-                industry_element = wait.until(EC.presence_of_element_located((By.XPATH, "//span[contains(text(), '포털·플랫폼') or contains(text(), '은행·금융') or contains(text(), '게임') or contains(text(), '전기·전자')]")))
-                company_detail["industry"] = industry_element.text.strip()
-            except:
-                print("업종 추출 실패")
-            
-            try:
-                # 기업 규모 추출 (수정된 XPath)
-                company_type_element = wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='item type1']//p[@class='t1']")))
-                company_detail["company_type"] = company_type_element.text.strip()
-            except:
-                print("기업 규모 추출 실패")
-            
-            try:
-                # 지역(주소) 추출 (수정된 XPath)
-                location_element = wait.until(EC.presence_of_element_located((By.XPATH, "//table//tr//th[text()='주소']/following-sibling::td")))
-                location_text = location_element.text.strip()
-                # "지도" 버튼 텍스트 제거
-                location_text = location_text.replace("지도", "").strip()
-                company_detail["location"] = location_text
-            except:
-                print("지역(주소) 추출 실패")
-            
-            try:
-                # 사원수 추출
-                employee_element = wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='item type2']//p[@class='t1']")))
-                company_detail["employee_count"] = employee_element.text.strip()
-            except:
-                print("사원수 추출 실패")
-            
-            try:
-                # 매출액 추출
-                revenue_elements = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//div[@class='item type3']//p[@class='t1']")))
-                if revenue_elements:
-                    company_detail["revenue"] = revenue_elements[0].text.strip()
-            except:
-                print("매출액 추출 실패")
-            
-            try:
-                # 대표자 추출
-                ceo_element = wait.until(EC.presence_of_element_located((By.XPATH, "//table//tr//th[text()='대표자']/following-sibling::td")))
-                company_detail["ceo"] = ceo_element.text.strip()
-            except:
-                print("대표자 추출 실패")
-            
-            try:
-                # 개업일 추출
-                establishment_element = wait.until(EC.presence_of_element_located((By.XPATH, "//table//tr//th[text()='개업일']/following-sibling::td")))
-                company_detail["establishment_date"] = establishment_element.text.strip()
-            except:
-                print("개업일 추출 실패")
-            
-            try:
-                # 기업형태 추출
-                company_form_element = wait.until(EC.presence_of_element_located((By.XPATH, "//table//tr//th[text()='기업형태']/following-sibling::td")))
-                company_detail["company_form"] = company_form_element.text.strip()
-            except:
-                print("기업형태 추출 실패")
-            
-            try:
-                # 신용등급 추출
-                credit_element = wait.until(EC.presence_of_element_located((By.XPATH, "//table//tr//th[text()='신용등급']/following-sibling::td")))
-                company_detail["credit_rating"] = credit_element.text.strip()
-            except:
-                print("신용등급 추출 실패")
-            
-            try:
-                # 태그 추출
-                tag_elements = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//div[@class='corp_info_base2']//p[@class='tag']//span")))
-                company_detail["tags"] = [tag.text.strip() for tag in tag_elements]
-            except:
-                print("태그 추출 실패")
-                company_detail["tags"] = []
-            
-            try:
-                # 기업 추천 키워드 추출
-                keyword_elements = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//div[@class='corp_info_recom']//a[@class='bt']")))
-                company_detail["recommendation_keywords"] = [keyword.text.strip() for keyword in keyword_elements]
-            except:
-                print("기업 추천 키워드 추출 실패")
-                company_detail["recommendation_keywords"] = []
-            
-            try:
-                # 초봉 정보 추출
-                starting_salary_element = wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='corp_info_payinfo']//div[@class='box'][1]//span[@class='pay']")))
-                company_detail["starting_salary"] = starting_salary_element.text.strip()
-            except:
-                print("초봉 정보 추출 실패")
-                company_detail["starting_salary"] = ""
-            
-            try:
-                # 평균 연봉 정보 추출
-                avg_salary_element = wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='corp_info_payinfo']//div[@class='box'][2]//span[@class='pay']")))
-                company_detail["average_salary"] = avg_salary_element.text.strip()
-            except:
-                print("평균 연봉 정보 추출 실패")
-                company_detail["average_salary"] = ""
-            
-            try:
-                # 동종 업종 평균 연봉 추출
-                industry_avg_salary_element = wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='corp_info_payinfo']//div[@class='box'][2]//p[@class='list'][2]//span[@class='pay']")))
-                company_detail["industry_average_salary"] = industry_avg_salary_element.text.strip()
-            except:
-                print("동종 업종 평균 연봉 추출 실패")
-                company_detail["industry_average_salary"] = ""
-            
-            # 현직자 리뷰 추출
-            try:
-                print("현직자 리뷰 탭으로 이동...")
-                # 현직자리뷰 탭 클릭 (더 구체적인 XPath 사용)
-                review_tab = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@class='bot']//ul[@class='menu']//li//a[contains(text(), '현직자리뷰')]")))
-                review_tab.click()
-                time.sleep(5)  # 페이지 로딩 시간 증가
-                
-                # 리뷰 목록 추출 (더 안전한 대기)
-                try:
-                    review_elements = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//ul[@class='corp_review_list']//li")))
-                except:
-                    # 대안 XPath 시도
-                    review_elements = self.driver.find_elements(By.XPATH, "//div[@class='corp_info_box']//ul//li")
-                
-                reviews = []
-                print(f"리뷰 요소 {len(review_elements)}개 발견")
-                
-                for i, review_element in enumerate(review_elements):
-                    try:
-                        review_data = {}
-                        
-                        # 직원 상태 (현직/퇴사)
-                        try:
-                            state_element = review_element.find_element(By.XPATH, ".//p[@class='state']")
-                            review_data["employee_status"] = state_element.text.strip()
-                        except:
-                            review_data["employee_status"] = ""
-                        
-                        # 직원 정보 (현직원, 정규직, 경력입사 등)
-                        try:
-                            info_elements = review_element.find_elements(By.XPATH, ".//div[@class='info']//p//span")
-                            review_data["employee_info"] = [info.text.strip() for info in info_elements]
-                        except:
-                            review_data["employee_info"] = []
-                        
-                        # 평점
-                        try:
-                            rating_element = review_element.find_element(By.XPATH, ".//div[@class='rating_star2']//span[@class='fill']")
-                            review_data["rating"] = rating_element.text.strip()
-                        except:
-                            review_data["rating"] = ""
-                        
-                        # 좋은점
-                        try:
-                            good_element = review_element.find_element(By.XPATH, ".//p[@class='review good']//span[@class='t']")
-                            review_data["good_points"] = good_element.text.strip()
-                        except:
-                            review_data["good_points"] = ""
-                        
-                        # 아쉬운점
-                        try:
-                            bad_element = review_element.find_element(By.XPATH, ".//p[@class='review bad']//span[@class='t']")
-                            review_data["bad_points"] = bad_element.text.strip()
-                        except:
-                            review_data["bad_points"] = ""
-                        
-                        # 작성일
-                        try:
-                            date_element = review_element.find_element(By.XPATH, ".//p[@class='bot']//span[@class='date']")
-                            review_data["review_date"] = date_element.text.strip()
-                        except:
-                            review_data["review_date"] = ""
-                        
-                        # 좋아요 수
-                        try:
-                            like_element = review_element.find_element(By.XPATH, ".//span[@class='like']//label")
-                            review_data["likes"] = like_element.text.strip()
-                        except:
-                            review_data["likes"] = ""
-                        
-                        reviews.append(review_data)
-                        print(f"리뷰 {i+1} 추출 완료")
-                        
-                    except Exception as e:
-                        print(f"개별 리뷰 {i+1} 추출 실패: {e}")
-                        continue
-                
-                company_detail["reviews"] = reviews
-                print(f"현직자 리뷰 {len(reviews)}개 추출 완료")
-                
-            except Exception as e:
-                print(f"현직자 리뷰 추출 실패: {e}")
-                # 디버깅을 위해 현재 페이지 URL과 제목 확인
-                print(f"현재 페이지 URL: {self.driver.current_url}")
-                print(f"현재 페이지 제목: {self.driver.title}")
-                company_detail["reviews"] = []
-            
-            print(f"기업 상세 정보 추출 완료: {company_detail['company_name']}")
+            # 페이지 로딩 대기 (document 로딩 완료 + 네트워크 유휴)
+            self.wait_for_page_ready()
+            _report(progress, 'page_ready')
+            
+            company_detail = {}
+            failed_sections = []
+            if 'profile' in sections or 'salary' in sections:
+                snapshot = self._read_company_snapshot()
+                for section in ('profile', 'salary'):
+                    if section in sections:
+                        company_detail.update({key: snapshot.get(key, "") for key in COMPANY_DETAIL_FIELDS[section]})
+                # 기업명이 없으면 페이지가 그려지지 않은 것으로 보고 빈 값을 캐시하지 않도록 두 섹션 모두 실패 처리
+                if not snapshot.get("company_name"):
+                    failed_sections.extend(section for section in ('profile', 'salary') if section in sections)
+            
+            # 기본 정보는 리뷰 탭으로 넘어가기 전에 부분 결과로 전달
+            if company_detail:
+                _report(progress, 'detail_fields', filled=sum(1 for value in company_detail.values() if value), fields=dict(company_detail))
+            
+            if 'reviews' in sections:
+                reviews = self._read_company_reviews(wait)
+                if reviews is None:
+                    failed_sections.append('reviews')
+                company_detail["reviews"] = reviews or []
+                _report(progress, 'reviews', rows=len(company_detail["reviews"]))
+            
+            print(f"기업 상세 정보 추출 완료: {company_detail.get('company_name', company_url)}")
             return {
                 "success": True,
                 "company_detail": company_detail,
+                "failed_sections": failed_sections,
                 "message": "기업 상세 정보 추출 완료"
             }
             
+        except CrawlCancelled:
+            raise
         except Exception as e:
             print(f"기업 상세 정보 추출 중 오류 발생: {str(e)}")
             return {
@@ -1142,56 +1951,1304 @@ class CatchScraper:
                 "error": str(e),
                 "message": "기업 상세 정보 추출 실패"
             }
+    
+    def _read_company_snapshot(self):
+        """기본 정보 + 연봉 정보를 한 번의 JS 실행으로 읽기 (없는 항목은 빈 값)"""
+        try:
+            # 준비 신호는 기업명 하나만 기다림 (나머지 항목은 없으면 바로 빈 값)
+            WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.XPATH, "//div[@class='name']//h2")))
+        except TimeoutException:
+            print("기업명 요소가 없어 현재 상태로 추출합니다.")
+        snapshot = self.driver.execute_script(COMPANY_DETAIL_SCRIPT) or {}
+        missing = [key for key, value in snapshot.items() if not value]
+        if missing:
+            print(f"비어 있는 기업 정보 항목: {', '.join(missing)}")
+        return snapshot
+    
+    def _read_company_reviews(self, wait):
+        """현직자리뷰 탭을 열어 리뷰 목록 추출 (탭이나 목록을 읽지 못하면 None)"""
+        try:
+            print("현직자 리뷰 탭으로 이동...")
+            # 현직자리뷰 탭 클릭 (더 구체적인 XPath 사용)
+            review_tab = wait.until(EC.element_to_be_clickable((By.XPATH, "//div[@class='bot']//ul[@class='menu']//li//a[contains(text(), '현직자리뷰')]")))
+            review_tab.click()
+            # 탭 전환 후 리뷰 목록 요청이 끝날 때까지 대기
+            self.wait_for_network_idle()
+            
+            # 리뷰 목록을 한 번에 읽고, 아직 그려지지 않았으면 잠깐만 더 확인 (리뷰가 없는 기업도 있음)
+            try:
+                reviews = WebDriverWait(self.driver, 3).until(lambda driver: driver.execute_script(COMPANY_REVIEWS_SCRIPT))
+            except TimeoutException:
+                reviews = []
+            
+            print(f"현직자 리뷰 {len(reviews)}개 추출 완료")
+            return reviews
+            
+        except Exception as e:
+            print(f"현직자 리뷰 추출 실패: {e}")
+            # 디버깅을 위해 현재 페이지 URL과 제목 확인
+            print(f"현재 페이지 URL: {self.driver.current_url}")
+            print(f"현재 페이지 제목: {self.driver.title}")
+            return None
 
-scraper = CatchScraper()
-
-def _handle_api_error(e):
-    """API 에러 처리 헬퍼 함수"""
-    return jsonify({"success": False, "message": str(e)})
-
-@app.route('/api/init', methods=['POST'])
-def init_scraper():
-    """스크래퍼 초기화"""
-    try:
-        success = scraper.init_driver()
-        return jsonify({"success": success, "message": "스크래퍼가 초기화되었습니다." if success else "스크래퍼 초기화에 실패했습니다."})
-    except Exception as e:
-        return _handle_api_error(e)
-
-@app.route('/api/login', methods=['POST'])
-def login():
-    """로그인"""
-    try:
-        data = request.get_json()
-        username = data.get('username', 'test0137')
-        password = data.get('password', '#test0808')
+class DriverPool:
+    """로그인된 CatchScraper 인스턴스 풀 (요청마다 드라이버를 대여하고 반납)"""
+    def __init__(self, size=DRIVER_POOL_SIZE, lease_timeout=DRIVER_LEASE_TIMEOUT, base_debug_port=DRIVER_BASE_DEBUG_PORT, spares=DRIVER_WARM_SPARES):
+        self.size = size
+        self.lease_timeout = lease_timeout
+        self.base_debug_port = base_debug_port
+        self.spares = spares
+        self.username = CATCH_USERNAME
+        self.password = CATCH_PASSWORD
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._members = []
+        self._spares = []
+        self._launching_spares = []
+        self._replenishing = False
+        self._closed = False
+        self._recycled = 0
+        self._free_ports = list(range(base_debug_port, base_debug_port + size + spares))
+    
+    def set_credentials(self, username, password):
+        """새로 생성되는 드라이버가 사용할 로그인 정보 설정"""
+        self.username = username
+        self.password = password
+    
+    def _launch(self, scraper):
+        """드라이버를 띄우고 로그인 (실패하면 폐기 후 예외)"""
+        try:
+            if not scraper.init_driver():
+                raise RuntimeError("Chrome 드라이버 초기화에 실패했습니다.")
+            login_result = scraper.ensure_login(self.username, self.password)
+            if not login_result.get('success'):
+                raise RuntimeError(f"풀 드라이버 로그인 실패: {login_result.get('message')}")
+            return login_result
+        except Exception:
+            self._discard(scraper)
+            raise
+    
+    def _create_scraper(self):
+        """풀에 여유가 있으면 예비 드라이버를 투입하거나 새로 만들고 로그인 (여유가 없으면 None)"""
+        spare = self._promote_spare()
+        if spare:
+            return spare
         
-        return jsonify(scraper.login(username, password))
-    except Exception as e:
-        return _handle_api_error(e)
-
-@app.route('/api/status', methods=['GET'])
-def get_status():
-    """현재 상태 확인"""
-    try:
-        return jsonify(scraper.get_current_status())
-    except Exception as e:
-        return _handle_api_error(e)
-
-@app.route('/api/recruit', methods=['POST'])
-def navigate_to_recruit():
-    """채용공고 페이지로 이동"""
-    try:
-        result = scraper.navigate_to_recruit_page()
-        return jsonify(result)
-    except Exception as e:
-        return _handle_api_error(e)
-
-@app.route('/api/filter-it', methods=['POST'])
-def filter_it_jobs():
-    """IT개발 공고 필터링"""
-    try:
-        result = scraper.filter_it_jobs()
+        with self._lock:
+            if len(self._members) >= self.size or not self._free_ports:
+                return None
+            scraper = CatchScraper(debug_port=self._free_ports.pop(0))
+            self._members.append(scraper)
+        
+        login_result = self._launch(scraper)
+        print(f"[POOL] 드라이버 생성 완료 (port={scraper.debug_port}, {login_result.get('method')}, {len(self._members)}/{self.size})")
+        return scraper
+    
+    def _promote_spare(self):
+        """풀에 여유가 있으면 살아있는 예비 드라이버를 풀 드라이버로 전환 (없으면 None)"""
+        while True:
+            with self._lock:
+                if len(self._members) >= self.size or not self._spares:
+                    return None
+                spare = self._spares.pop()
+                self._members.append(spare)
+            self.replenish_spares()
+            if spare.is_alive():
+                # 교체 기준 가동 시간은 투입 시점부터 계산 (대기만 한 예비 드라이버는 메모리가 거의 늘지 않음)
+                spare.started_at = time.monotonic()
+                print(f"[POOL] 예비 드라이버 투입 (port={spare.debug_port}, {len(self._members)}/{self.size})")
+                return spare
+            print(f"[POOL] 응답 없는 예비 드라이버 폐기 (port={spare.debug_port})")
+            self._discard(spare)
+    
+    def replenish_spares(self):
+        """예비 드라이버가 부족하면 백그라운드에서 채움 (이미 채우는 중이면 무시)"""
+        with self._lock:
+            if self._closed or self._replenishing or len(self._spares) >= self.spares:
+                return
+            self._replenishing = True
+        threading.Thread(target=self._replenish_loop, name="driver-pool-spares", daemon=True).start()
+    
+    def _replenish_loop(self):
+        try:
+            while True:
+                with self._lock:
+                    if self._closed or len(self._spares) >= self.spares or not self._free_ports:
+                        return
+                    spare = CatchScraper(debug_port=self._free_ports.pop(0))
+                    self._launching_spares.append(spare)
+                try:
+                    login_result = self._launch(spare)
+                except Exception as e:
+                    print(f"[POOL] 예비 드라이버 준비 실패: {e}")
+                    return
+                
+                with self._lock:
+                    self._launching_spares.remove(spare)
+                    closed = self._closed
+                    if not closed:
+                        self._spares.append(spare)
+                if closed:
+                    self._discard(spare)
+                    return
+                print(f"[POOL] 예비 드라이버 준비 완료 (port={spare.debug_port}, {login_result.get('method')}, {len(self._spares)}/{self.spares})")
+        finally:
+            with self._lock:
+                self._replenishing = False
+    
+    def _discard(self, scraper):
+        """드라이버를 종료하고 풀에서 제거"""
+        try:
+            scraper.close_driver()
+        except Exception as e:
+            print(f"[POOL] 드라이버 종료 중 오류: {e}")
+        with self._lock:
+            if scraper in self._members:
+                self._members.remove(scraper)
+                self._free_ports.append(scraper.debug_port)
+            elif scraper in self._spares:
+                self._spares.remove(scraper)
+                self._free_ports.append(scraper.debug_port)
+            elif scraper in self._launching_spares:
+                self._launching_spares.remove(scraper)
+                self._free_ports.append(scraper.debug_port)
+    
+    def acquire(self, timeout=None):
+        """사용 가능한 드라이버 대여 (없으면 생성, 풀이 가득 차면 반납될 때까지 대기)"""
+        timeout = self.lease_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        self.replenish_spares()
+        while True:
+            try:
+                scraper = self._idle.get_nowait()
+            except queue.Empty:
+                scraper = self._create_scraper()
+                if scraper:
+                    return scraper
+                # 다른 드라이버가 폐기되어 자리가 나면 새로 만들 수 있도록 짧게 나눠서 대기
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"{timeout:.0f}초 안에 사용 가능한 드라이버가 없습니다.")
+                try:
+                    scraper = self._idle.get(timeout=min(remaining, 1.0))
+                except queue.Empty:
+                    continue
+            
+            # 대기 중에 Chrome이 죽었거나 가동 시간 기준을 넘은 드라이버는 내주지 않고 예비 드라이버로 교체
+            reason = "응답 없음" if not scraper.is_alive() else scraper.recycle_reason(include_memory=False)
+            if not reason:
+                return scraper
+            self._retire(scraper, reason)
+    
+    def release(self, scraper):
+        """드라이버 반납 (죽었거나 교체 기준을 넘은 드라이버는 폐기하고 예비 드라이버로 대체)"""
+        reason = "응답 없음" if not scraper.is_alive() else scraper.recycle_reason()
+        if reason:
+            self._retire(scraper, reason)
+        else:
+            self._idle.put(scraper)
+    
+    def _retire(self, scraper, reason):
+        """사용 중이 아닌 드라이버를 종료하고 예비 드라이버를 바로 대기열에 넣음"""
+        print(f"[POOL] 드라이버 교체 (port={scraper.debug_port}, {reason})")
+        self._discard(scraper)
+        with self._lock:
+            self._recycled += 1
+        spare = self._promote_spare()
+        if spare:
+            self._idle.put(spare)
+    
+    @contextmanager
+    def lease(self, timeout=None):
+        """with 문으로 드라이버를 대여하고 자동 반납"""
+        scraper = self.acquire(timeout)
+        try:
+            yield scraper
+        finally:
+            self.release(scraper)
+    
+    def ensure(self, count=1):
+        """대기 중인 드라이버의 세션을 보장하고 최소 count개가 준비되도록 부족한 만큼만 생성"""
+        count = max(0, min(count, self.size))
+        checked, created, failed = [], 0, []
+        self.replenish_spares()
+        
+        # 지금 대기 중인 드라이버만 꺼내 확인 (대여 중인 드라이버는 사용 중이므로 건드리지 않음)
+        idle_members = []
+        for _ in range(self._idle.qsize()):
+            try:
+                idle_members.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        for member in idle_members:
+            reason = member.recycle_reason()
+            if reason:
+                self._retire(member, reason)
+                continue
+            try:
+                result = member.ensure_session(self.username, self.password)
+            except Exception as e:
+                result = {"success": False, "message": str(e)}
+            if result.get("success"):
+                checked.append({"port": member.debug_port, "actions": result.get("actions", [])})
+                self._idle.put(member)
+            else:
+                failed.append({"port": member.debug_port, "message": result.get("message")})
+                self._discard(member)
+        
+        while self.status()["active"] < count:
+            try:
+                member = self._create_scraper()
+            except Exception as e:
+                failed.append({"port": None, "message": str(e)})
+                break
+            if not member:
+                break
+            self._idle.put(member)
+            created += 1
+        
+        return {"checked": checked, "created": created, "failed": failed, **self.status()}
+    
+    def status(self):
+        """풀 상태 확인"""
+        with self._lock:
+            total = len(self._members)
+            spares = len(self._spares)
+            launching = len(self._launching_spares)
+            recycled = self._recycled
+        idle = self._idle.qsize()
+        return {"size": self.size, "active": total, "idle": idle, "leased": total - idle,
+                "spares": spares, "spares_target": self.spares, "spares_launching": launching, "recycled": recycled}
+    
+    def usage(self):
+        """풀 드라이버별 사용량 (문서 수, 가동 시간, 메모리)"""
+        with self._lock:
+            members = list(self._members)
+        usage = []
+        for member in members:
+            try:
+                usage.append(member.usage(passive=True))
+            except Exception as e:
+                usage.append({"port": member.debug_port, "error": str(e)})
+        return usage
+    
+    def close_all(self):
+        """풀의 모든 드라이버(예비 포함) 종료"""
+        with self._lock:
+            self._closed = True
+            members = list(self._members) + list(self._spares)
+        for member in members:
+            self._discard(member)
+        while not self._idle.empty():
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 작업을 한 번만 실행하고 결과(또는 예외)를 모두에게 전달"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+    
+    def do(self, key, fn):
+        """진행 중인 같은 키의 작업이 있으면 그 결과를 기다리고, 없으면 fn()을 직접 실행"""
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+        
+        if not leader:
+            print(f"[SINGLE-FLIGHT] {key} 진행 중인 작업 결과를 함께 사용")
+            return future.result()
+        
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+    
+    def in_flight(self):
+        """현재 실행 중인 작업 키 목록"""
+        with self._lock:
+            return [str(key) for key in self._in_flight]
+
+class NegativeCache:
+    """찾지 못한 결과를 짧게 기억하는 크기 제한 캐시 (오래된 항목부터 제거)"""
+    def __init__(self, ttl=NEGATIVE_CACHE_TTL, max_entries=NEGATIVE_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """기억 중인 결과 메시지와 남은 시간 (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, message = entry
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                del self._entries[key]
+                return None
+            return {"message": message, "expires_in": round(remaining, 1)}
+    
+    def add(self, key, message):
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, message)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def size(self):
+        with self._lock:
+            return len(self._entries)
+
+class StaleWhileRevalidateCache:
+    """TTL이 지난 값도 즉시 반환하고 백그라운드에서 새로 고치는 캐시 (마지막 정상 결과 유지)"""
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._load_locks = {}
+        self._refreshing = set()
+    
+    def _load(self, key, loader):
+        """loader를 실행해 정상 결과(None이 아닌 값)만 저장"""
+        value = loader()
+        if value is not None:
+            with self._lock:
+                self._entries[key] = (value, time.time())
+        return value
+    
+    def _refresh_in_background(self, key, loader):
+        """같은 키는 한 번만 백그라운드 갱신"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def refresh():
+            try:
+                self._load(key, loader)
+                print(f"[CACHE] '{key}' 백그라운드 갱신 완료")
+            except Exception as e:
+                print(f"[CACHE] '{key}' 백그라운드 갱신 실패 (이전 결과 유지): {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=refresh, name=f'catch-swr-{key}', daemon=True).start()
+    
+    def get(self, key, loader, force=False):
+        """(값, 생성 시각, 오래된 값 여부) 반환 - 값이 없거나 force면 동기로 불러옴"""
+        with self._lock:
+            entry = self._entries.get(key)
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        
+        if force:
+            # 강제 갱신은 기다리지 않고 바로 불러옴 (동시 요청 합치기는 loader 쪽 single-flight가 담당)
+            self._load(key, loader)
+            with self._lock:
+                entry = self._entries.get(key)
+        elif entry is None:
+            # 처음 요청이 동시에 몰려도 한 번만 불러오도록 키별 잠금
+            with load_lock:
+                with self._lock:
+                    entry = self._entries.get(key)
+                if entry is None:
+                    self._load(key, loader)
+                    with self._lock:
+                        entry = self._entries.get(key)
+        if entry is None:
+            return None, None, False
+        
+        value, generated_at = entry
+        stale = time.time() - generated_at >= self.ttl
+        if stale:
+            self._refresh_in_background(key, loader)
+        return value, generated_at, stale
+
+class SqliteStore:
+    """스레드별 연결을 쓰는 SQLite 저장소 공통 부분 (WAL 모드, 생성 시 SCHEMA 적용)"""
+    SCHEMA = ""
+    
+    def __init__(self, path=JOB_STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(self.SCHEMA)
+    
+    def _connection(self):
+        """현재 스레드 전용 SQLite 연결"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+class JobStore(SqliteStore):
+    """수집한 공고를 job_id 기준으로 upsert하는 SQLite 저장소"""
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            company TEXT NOT NULL,
+            job_info TEXT NOT NULL DEFAULT '[]',
+            conditions TEXT NOT NULL DEFAULT '[]',
+            registration_info TEXT NOT NULL DEFAULT '[]',
+            url TEXT NOT NULL,
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS job_categories (
+            job_id TEXT NOT NULL REFERENCES jobs(job_id),
+            category TEXT NOT NULL,
+            page INTEGER,
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL,
+            PRIMARY KEY (job_id, category)
+        );
+        CREATE INDEX IF NOT EXISTS idx_job_categories_last_seen ON job_categories(category, last_seen);
+        CREATE TABLE IF NOT EXISTS crawl_watermarks (
+            category TEXT PRIMARY KEY,
+            mode TEXT NOT NULL,
+            newest_job_id TEXT,
+            pages_read INTEGER NOT NULL,
+            new_jobs INTEGER NOT NULL,
+            crawled_at TEXT NOT NULL
+        );
+    """
+    
+    # 카테고리를 묶은 공고 조회: category/page는 가장 최근에 본 카테고리 행에서 직접 가져옴
+    # (MIN()과 MAX()를 함께 쓰면 SQLite가 일반 컬럼을 어느 행에서 가져올지 정해져 있지 않음)
+    GROUPED_JOBS_QUERY = """
+        SELECT j.job_id, j.title, j.company, j.job_info, j.conditions, j.registration_info, j.url,
+               latest.category, latest.page, grouped.first_seen, grouped.last_seen, grouped.categories
+        FROM (
+            SELECT c.job_id, MIN(c.first_seen) AS first_seen, MAX(c.last_seen) AS last_seen,
+                   GROUP_CONCAT(c.category) AS categories
+            FROM jobs j JOIN job_categories c ON c.job_id = j.job_id{where}
+            GROUP BY c.job_id
+        ) grouped
+        JOIN jobs j ON j.job_id = grouped.job_id
+        JOIN job_categories latest ON latest.job_id = grouped.job_id AND latest.category = (
+            SELECT category FROM job_categories WHERE job_id = grouped.job_id
+            ORDER BY last_seen DESC, page ASC, category LIMIT 1
+        )
+    """
+    
+    def upsert_jobs(self, jobs, category):
+        """공고 목록 저장 (이미 있는 job_id는 내용과 last_seen만 갱신), 저장한 개수 반환"""
+        now = datetime.now().isoformat(timespec='seconds')
+        job_rows = []
+        category_rows = []
+        for job in jobs:
+            job_id = job.get('job_id') or job_id_from_url(job.get('url'))
+            if not job_id:
+                continue
+            job_rows.append((
+                job_id, job.get('title', ''), job.get('company', ''),
+                json.dumps(job.get('job_info', []), ensure_ascii=False),
+                json.dumps(job.get('conditions', []), ensure_ascii=False),
+                json.dumps(job.get('registration_info', []), ensure_ascii=False),
+                job.get('url', ''), now, now
+            ))
+            category_rows.append((job_id, category, job.get('page'), now, now))
+        
+        with self._connection() as conn:
+            conn.executemany("""
+                INSERT INTO jobs (job_id, title, company, job_info, conditions, registration_info, url, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET
+                    title = excluded.title, company = excluded.company, job_info = excluded.job_info,
+                    conditions = excluded.conditions, registration_info = excluded.registration_info,
+                    url = excluded.url, last_seen = excluded.last_seen
+            """, job_rows)
+            conn.executemany("""
+                INSERT INTO job_categories (job_id, category, page, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(job_id, category) DO UPDATE SET page = excluded.page, last_seen = excluded.last_seen
+            """, category_rows)
+        return len(job_rows)
+    
+    @staticmethod
+    def _row_to_job(row):
+        """DB 행을 API 응답용 공고 dict로 변환"""
+        return {
+            "job_id": row["job_id"],
+            "title": row["title"],
+            "company": row["company"],
+            "job_info": json.loads(row["job_info"]),
+            "conditions": json.loads(row["conditions"]),
+            "registration_info": json.loads(row["registration_info"]),
+            "url": row["url"],
+            "category": row["category"],
+            "categories": sorted(set(row["categories"].split(','))) if "categories" in row.keys() else [row["category"]],
+            "page": row["page"],
+            "first_seen": row["first_seen"],
+            "last_seen": row["last_seen"]
+        }
+    
+    @staticmethod
+    def _filters(category=None, company=None):
+        """카테고리/기업명 조건절과 파라미터"""
+        conditions = []
+        params = []
+        if category:
+            conditions.append("c.category = ?")
+            params.append(category)
+        if company:
+            conditions.append("j.company LIKE ?")
+            params.append(f"%{company}%")
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+    
+    def get_jobs(self, category=None, company=None, limit=100, offset=0):
+        """저장된 공고 조회 (최근에 본 공고부터)
+        
+        카테고리를 지정하지 않으면 여러 카테고리에 걸친 공고도 한 건으로 묶고
+        category/page는 가장 최근에 본 카테고리 기준, categories에 전체 카테고리를 담음
+        """
+        where, params = self._filters(category, company)
+        if category:
+            query = f"""
+                SELECT j.job_id, j.title, j.company, j.job_info, j.conditions, j.registration_info, j.url,
+                       c.category, c.page, c.first_seen, c.last_seen
+                FROM jobs j JOIN job_categories c ON c.job_id = j.job_id{where}
+                ORDER BY c.last_seen DESC, c.page ASC LIMIT ? OFFSET ?
+            """
+        else:
+            query = self.GROUPED_JOBS_QUERY.format(where=where) + """
+                ORDER BY grouped.last_seen DESC, latest.page ASC, j.job_id LIMIT ? OFFSET ?
+            """
+        params.extend([limit, offset])
+        
+        return [self._row_to_job(row) for row in self._connection().execute(query, params)]
+    
+    def get_job(self, job_id):
+        """job_id로 공고 한 건 조회 (없으면 None)"""
+        rows = self._connection().execute(
+            self.GROUPED_JOBS_QUERY.format(where=" WHERE j.job_id = ?"), (job_id,)
+        ).fetchall()
+        return self._row_to_job(rows[0]) if rows else None
+    
+    def known_job_ids(self, job_ids, category):
+        """job_ids 중 해당 카테고리에서 이미 저장된 ID 집합 (증분 수집의 중단 판단용)"""
+        job_ids = [job_id for job_id in job_ids if job_id]
+        if not job_ids:
+            return set()
+        placeholders = ", ".join("?" * len(job_ids))
+        rows = self._connection().execute(
+            f"SELECT job_id FROM job_categories WHERE category = ? AND job_id IN ({placeholders})",
+            [category, *job_ids]
+        )
+        return {row["job_id"] for row in rows}
+    
+    def get_watermark(self, category):
+        """카테고리의 마지막 수집 기록 (없으면 None)"""
+        row = self._connection().execute("SELECT * FROM crawl_watermarks WHERE category = ?", (category,)).fetchone()
+        return dict(row) if row else None
+    
+    def set_watermark(self, category, mode, newest_job_id, pages_read, new_jobs):
+        """카테고리 수집 기록 갱신 (mode: 'full', 'partial'(max_pages까지만 전체 수집) 또는 'incremental')"""
+        with self._connection() as conn:
+            conn.execute("""
+                INSERT INTO crawl_watermarks (category, mode, newest_job_id, pages_read, new_jobs, crawled_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(category) DO UPDATE SET
+                    mode = excluded.mode, newest_job_id = excluded.newest_job_id, pages_read = excluded.pages_read,
+                    new_jobs = excluded.new_jobs, crawled_at = excluded.crawled_at
+            """, (category, mode, newest_job_id, pages_read, new_jobs, datetime.now().isoformat(timespec='seconds')))
+    
+    def count_jobs(self, category=None, company=None):
+        """저장된 공고 수 (get_jobs와 같은 기준, 카테고리를 지정하지 않으면 공고 단위)"""
+        where, params = self._filters(category, company)
+        return self._connection().execute(
+            f"SELECT COUNT(DISTINCT j.job_id) FROM jobs j JOIN job_categories c ON c.job_id = j.job_id{where}", params
+        ).fetchone()[0]
+
+class CompanyDetailCache(SqliteStore):
+    """기업 URL별 상세 정보를 섹션(profile, salary, reviews)마다 따로 저장하고 섹션별 TTL로 만료 판단"""
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS company_detail_sections (
+            company_url TEXT NOT NULL,
+            section TEXT NOT NULL,
+            data TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (company_url, section)
+        );
+    """
+    
+    def __init__(self, path=JOB_STORE_PATH, ttls=COMPANY_DETAIL_TTLS):
+        self.ttls = ttls
+        super().__init__(path)
+    
+    def load(self, company_url):
+        """(저장된 섹션 {섹션: (데이터, 저장 시각)}, 만료되었거나 없는 섹션 목록) 반환"""
+        rows = self._connection().execute(
+            "SELECT section, data, fetched_at FROM company_detail_sections WHERE company_url = ?", (company_url,)
+        ).fetchall()
+        sections = {row["section"]: (json.loads(row["data"]), row["fetched_at"]) for row in rows}
+        now = time.time()
+        expired = [section for section, ttl in self.ttls.items()
+                   if section not in sections or now - sections[section][1] >= ttl]
+        return sections, expired
+    
+    def save(self, company_url, company_detail, sections):
+        """새로 추출한 섹션만 저장 (reviews는 리스트, 나머지는 필드 dict)"""
+        now = time.time()
+        rows = []
+        for section in sections:
+            if section == 'reviews':
+                data = company_detail.get("reviews", [])
+            else:
+                data = {key: company_detail.get(key) for key in COMPANY_DETAIL_FIELDS[section]}
+            rows.append((company_url, section, json.dumps(data, ensure_ascii=False), now))
+        with self._connection() as conn:
+            conn.executemany("""
+                INSERT INTO company_detail_sections (company_url, section, data, fetched_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(company_url, section) DO UPDATE SET data = excluded.data, fetched_at = excluded.fetched_at
+            """, rows)
+    
+    @staticmethod
+    def merge(sections):
+        """섹션별 데이터를 하나의 company_detail dict로 합침"""
+        company_detail = {}
+        for section, (data, _) in sections.items():
+            if section == 'reviews':
+                company_detail["reviews"] = data
+            else:
+                company_detail.update(data)
+        return company_detail
+
+class CompanyDirectory(SqliteStore):
+    """기업명 → 기업 URL 디렉터리 (정규화한 별칭 + 트라이그램 색인으로 유사 이름도 조회)
+    
+    실시간 검색 결과로 채워지며, 조회는 메모리 색인만 사용
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS company_directory (
+            company_url TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS company_aliases (
+            alias TEXT PRIMARY KEY,
+            company_url TEXT NOT NULL REFERENCES company_directory(company_url)
+        );
+    """
+    
+    def __init__(self, path=JOB_STORE_PATH, threshold=COMPANY_MATCH_THRESHOLD):
+        super().__init__(path)
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._names = {}
+        self._aliases = {}
+        self._alias_sizes = {}
+        self._trigrams = {}
+        for row in self._connection().execute("SELECT company_url, name FROM company_directory"):
+            self._index(row["company_url"], row["name"])
+        for row in self._connection().execute("SELECT alias, company_url FROM company_aliases"):
+            if row["company_url"] in self._names:
+                self._index(row["company_url"], self._names[row["company_url"]], row["alias"])
+    
+    @staticmethod
+    def _trigrams_of(alias):
+        padded = f"  {alias} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def _index(self, company_url, name, alias=None):
+        """메모리 색인에 추가 (self._lock을 잡았거나 초기화 중일 때 호출)"""
+        self._names[company_url] = name
+        for key in {normalize_company_name(name), alias}:
+            if not key:
+                continue
+            new_alias = key not in self._aliases
+            self._aliases[key] = company_url
+            if new_alias:
+                trigrams = self._trigrams_of(key)
+                self._alias_sizes[key] = len(trigrams)
+                for trigram in trigrams:
+                    self._trigrams.setdefault(trigram, set()).add(key)
+    
+    def add(self, company_url, name, alias=None):
+        """기업 등록 (alias는 이 기업으로 찾아진 검색어, 정규화해서 저장)"""
+        if not company_url or not name:
+            return
+        alias = normalize_company_name(alias) if alias else None
+        aliases = {normalize_company_name(name), alias} - {None, ''}
+        with self._connection() as conn:
+            conn.execute("""
+                INSERT INTO company_directory (company_url, name, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(company_url) DO UPDATE SET name = excluded.name, updated_at = excluded.updated_at
+            """, (company_url, name, datetime.now().isoformat(timespec='seconds')))
+            conn.executemany("""
+                INSERT INTO company_aliases (alias, company_url) VALUES (?, ?)
+                ON CONFLICT(alias) DO UPDATE SET company_url = excluded.company_url
+            """, [(key, company_url) for key in aliases])
+        with self._lock:
+            self._index(company_url, name, alias)
+    
+    def search(self, query, limit=5):
+        """유사도 순 후보 목록 [{"company_url", "name", "score"}] (별칭이 정확히 같으면 score 1.0)"""
+        alias = normalize_company_name(query)
+        if not alias:
+            return []
+        query_trigrams = self._trigrams_of(alias)
+        with self._lock:
+            overlaps = {}
+            for trigram in query_trigrams:
+                for candidate in self._trigrams.get(trigram, ()):
+                    overlaps[candidate] = overlaps.get(candidate, 0) + 1
+            
+            # 별칭별 Dice 계수 중 기업마다 가장 높은 점수
+            scores = {}
+            for candidate, overlap in overlaps.items():
+                score = 2 * overlap / (len(query_trigrams) + self._alias_sizes[candidate])
+                company_url = self._aliases[candidate]
+                scores[company_url] = max(score, scores.get(company_url, 0))
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+            exact_url = self._aliases.get(alias)
+            return [{"company_url": url, "name": self._names[url], "score": round(score, 3), "exact": url == exact_url}
+                    for url, score in ranked]
+    
+    def lookup(self, query):
+        """정규화한 별칭이 정확히 같은 기업 (없으면 None, 유사한 이름은 다른 기업일 수 있으므로 suggest 사용)"""
+        alias = normalize_company_name(query)
+        with self._lock:
+            company_url = self._aliases.get(alias) if alias else None
+            if not company_url:
+                return None
+            return {"company_url": company_url, "name": self._names[company_url], "score": 1.0, "exact": True}
+    
+    def suggest(self, query, limit=5):
+        """기준 점수 이상인 유사 후보 목록 (실시간 검색 전 참고용)"""
+        return [candidate for candidate in self.search(query, limit=limit) if candidate["score"] >= self.threshold]
+    
+    def similarity(self, query, name):
+        """두 기업명의 트라이그램 Dice 유사도 (정규화 후 비교)"""
+        left, right = normalize_company_name(query), normalize_company_name(name)
+        if not left or not right:
+            return 0.0
+        if left == right:
+            return 1.0
+        left_trigrams, right_trigrams = self._trigrams_of(left), self._trigrams_of(right)
+        return round(2 * len(left_trigrams & right_trigrams) / (len(left_trigrams) + len(right_trigrams)), 3)
+    
+    def size(self):
+        with self._lock:
+            return len(self._names)
+
+class CrawlJob:
+    """백그라운드 수집 작업 하나의 상태 (진행 상황, 결과, 취소 요청)"""
+    def __init__(self, kind, params):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.status = 'queued'
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.progress = {"phase": None, "category": None, "page": None, "pages_done": 0, "jobs_found": 0}
+        self.result = None
+        self.error = None
+        self.events = []
+        self.cancel_requested = threading.Event()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+    
+    def report(self, phase, **info):
+        """수집 함수에 넘기는 progress 콜백 (취소가 요청됐으면 다음 페이지로 넘어가기 전에 중단)"""
+        if self.cancel_requested.is_set():
+            raise CrawlCancelled(f"작업 {self.id}이(가) 취소되었습니다.")
+        with self._lock:
+            self.progress["phase"] = phase
+            if 'category' in info:
+                self.progress["category"] = info['category']
+            if phase == 'page':
+                self.progress["page"] = info.get('page')
+                self.progress["pages_done"] += 1
+                self.progress["jobs_found"] += info.get('rows', 0)
+            self._add_event(phase, info)
+    
+    def _add_event(self, phase, info):
+        """진행 이벤트 기록 후 구독자 깨우기 (self._lock을 잡은 상태에서 호출)"""
+        elapsed = time.time() - (self.started_at or self.created_at)
+        self.events.append(dict(info, seq=len(self.events) + 1, phase=phase, elapsed=round(elapsed, 2),
+                                pages_done=self.progress["pages_done"], jobs_found=self.progress["jobs_found"]))
+        self._changed.notify_all()
+    
+    def mark(self, status, **info):
+        """작업 상태 변경 ('running' 또는 종료 상태) 및 이벤트 기록"""
+        with self._lock:
+            self.status = status
+            if status == 'running':
+                self.started_at = time.time()
+            else:
+                self.finished_at = time.time()
+            self._add_event('start' if status == 'running' else 'end', dict(info, status=status))
+    
+    def iter_events(self, after=0, heartbeat=15):
+        """after번 이후의 진행 이벤트를 차례로 생성, 작업이 끝나면 종료 (heartbeat초 동안 새 이벤트가 없으면 None)"""
+        index = after
+        while True:
+            with self._changed:
+                self._changed.wait_for(lambda: len(self.events) > index or self.finished_at, timeout=heartbeat)
+                new_events = self.events[index:]
+                finished = self.finished_at is not None
+            if not new_events:
+                if finished:
+                    return
+                yield None
+                continue
+            for event in new_events:
+                yield event
+            index += len(new_events)
+    
+    def to_dict(self, include_result=True):
+        """API 응답용 상태 dict"""
+        def iso(timestamp):
+            return datetime.fromtimestamp(timestamp).isoformat(timespec='seconds') if timestamp else None
+        
+        with self._lock:
+            progress = dict(self.progress)
+        end = self.finished_at or time.time()
+        job = {
+            "job_id": self.id,
+            "type": self.kind,
+            "params": self.params,
+            "status": self.status,
+            "created_at": iso(self.created_at),
+            "started_at": iso(self.started_at),
+            "finished_at": iso(self.finished_at),
+            "elapsed": round(end - self.started_at, 1) if self.started_at else 0,
+            "progress": progress,
+            "error": self.error
+        }
+        if include_result and self.result is not None:
+            job["result"] = self.result
+        return job
+
+class CrawlJobManager:
+    """오래 걸리는 수집을 HTTP 요청과 분리해 백그라운드 스레드에서 실행하고 결과를 보관"""
+    def __init__(self, workers=CRAWL_JOB_WORKERS, retention=CRAWL_JOB_RETENTION):
+        self.retention = retention
+        self.jobs = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='catch-crawl-job')
+    
+    def submit(self, kind, runner, params):
+        """작업 등록 후 바로 CrawlJob 반환 (runner(progress=..., **params)를 백그라운드에서 실행)"""
+        self._prune()
+        job = CrawlJob(kind, params)
+        with self._lock:
+            self.jobs[job.id] = job
+        self._executor.submit(self._run, job, runner)
+        return job
+    
+    def _run(self, job, runner):
+        if job.cancel_requested.is_set():
+            job.mark('cancelled')
+            return
+        job.mark('running')
+        status = 'failed'
+        try:
+            job.result = runner(progress=job.report, **job.params)
+            if job.result.get('success'):
+                status = 'succeeded'
+            else:
+                job.error = job.result.get('message')
+        except CrawlCancelled:
+            status = 'cancelled'
+        except Exception as e:
+            job.error = str(e)
+        finally:
+            job.mark(status, error=job.error, result=job.result)
+            print(f"[JOB] {job.kind} 작업 {job.id} {job.status} ({job.finished_at - job.started_at:.1f}초)")
+    
+    def get(self, job_id):
+        with self._lock:
+            return self.jobs.get(job_id)
+    
+    def list(self):
+        with self._lock:
+            return sorted(self.jobs.values(), key=lambda job: job.created_at, reverse=True)
+    
+    def cancel(self, job_id):
+        """취소 요청 (대기 중이면 바로 취소, 실행 중이면 다음 페이지 경계에서 중단), 없는 작업이면 None"""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        if job.status in ('queued', 'running'):
+            job.cancel_requested.set()
+        return job
+    
+    def _prune(self):
+        """보관 시간이 지난 완료 작업 정리"""
+        cutoff = time.time() - self.retention
+        with self._lock:
+            for job_id in [job_id for job_id, job in self.jobs.items() if job.finished_at and job.finished_at < cutoff]:
+                del self.jobs[job_id]
+    
+    def shutdown(self):
+        """실행 중인 작업 모두 취소"""
+        for job in self.list():
+            job.cancel_requested.set()
+        self._executor.shutdown(wait=False)
+
+scraper = CatchScraper()
+driver_pool = DriverPool()
+homepage_cache = StaleWhileRevalidateCache(ttl=HOMEPAGE_CACHE_TTL)
+single_flight = SingleFlight()
+not_found_cache = NegativeCache()
+job_store = JobStore()
+company_detail_cache = CompanyDetailCache()
+company_directory = CompanyDirectory()
+crawl_jobs = CrawlJobManager()
+
+def _handle_api_error(e):
+    """API 에러 처리 헬퍼 함수"""
+    return jsonify({"success": False, "message": str(e)})
+
+def _open_listing_for_fallback(worker, category):
+    """Selenium 대체 경로용 목록 열기 (목록 API 탐색 겸 쿠키 갱신)"""
+    listing_result = worker.open_listing_with_discovery(category)
+    if listing_result.get('success') and category in listing_endpoints:
+        listing_api.sync_cookies(worker.driver)
+    return listing_result
+
+def _store_jobs(jobs_result, category):
+    """수집에 성공한 공고를 저장소에 upsert (저장 실패는 응답에 영향 주지 않음)"""
+    if not jobs_result.get('success'):
+        return
+    try:
+        stored = job_store.upsert_jobs(jobs_result.get('jobs', []), category)
+        print(f"[STORE] {LISTING_CATEGORIES[category]['name']} 공고 {stored}개 저장")
+    except Exception as e:
+        print(f"[STORE] 공고 저장 실패: {e}")
+
+def _collect_first_page_jobs(category, max_jobs=10):
+    """카테고리 첫 페이지 공고 수집 (목록 API 빠른 경로 → 실패 시 풀 드라이버로 Selenium 수집)"""
+    fast_result = listing_api.fetch_jobs(category, max_pages=1)
+    if fast_result.get('success'):
+        jobs_result = dict(fast_result, jobs=fast_result['jobs'][:max_jobs])
+    else:
+        with driver_pool.lease() as worker:
+            listing_result = _open_listing_for_fallback(worker, category)
+            if not listing_result.get('success'):
+                return listing_result
+            jobs_result = worker.extract_first_page_jobs(max_jobs=max_jobs)
+    
+    _store_jobs(jobs_result, category)
+    return jobs_result
+
+def _listing_url_navigation_works(worker, category):
+    """목록 2페이지를 URL로 바로 열 수 있는지 확인
+    
+    URL 이동이 안 되면 각 구간 워커가 1페이지부터 다음 페이지를 눌러가며 구간 시작까지 가야 하므로
+    구간 병렬 수집이 순차 수집보다 오히려 느려짐
+    """
+    if not (LISTING_CATEGORIES[category]['url'] or listing_url_cache.get(category)):
+        # 클릭 필터를 한 번 적용하면서 목록 URL을 학습할 수 있음
+        _open_listing_for_fallback(worker, category)
+    if not (LISTING_CATEGORIES[category]['url'] or listing_url_cache.get(category)):
+        return False
+    return worker.open_listing(category, 2).get('method') == 'url'
+
+def crawl_category_sequential(category, max_pages=None, progress=None):
+    """드라이버 하나로 1페이지부터 다음 페이지를 눌러가며 순차 수집"""
+    with driver_pool.lease() as worker:
+        listing_result = _open_listing_for_fallback(worker, category)
+        if not listing_result.get('success'):
+            return listing_result
+        result = worker.extract_job_list(max_pages=max_pages, progress=progress)
+    if result.get('success'):
+        result["workers"] = 1
+        result["failed_shards"] = []
+    return result
+
+def crawl_category_sharded(category, workers=CRAWL_WORKERS, shard_pages=SHARD_PAGES, max_pages=None, progress=None):
+    """카테고리 전체 페이지를 shard_pages 단위 구간으로 나눠 여러 풀 드라이버가 병렬 수집
+    
+    목록 페이지를 URL로 바로 열 수 있을 때만 구간을 나누고, 그렇지 않으면 순차 수집으로 대체.
+    각 워커는 다음 구간을 가져가 open_listing으로 구간 시작 페이지에 바로 이동한 뒤 수집하고,
+    구간 시작 페이지가 URL로 열리지 않거나 마지막 페이지가 확인되면 그 이후 구간은 더 이상 배정하지 않음. 결과는 페이지 순서로 합치고
+    수집 중 페이지 사이를 이동한 공고는 job_id(없으면 URL) 기준으로 중복 제거
+    """
+    workers = max(1, min(workers, driver_pool.size))
+    if max_pages and max_pages <= shard_pages:
+        workers = 1
+    if workers > 1:
+        with driver_pool.lease() as worker:
+            url_navigation = _listing_url_navigation_works(worker, category)
+        if not url_navigation:
+            print(f"{LISTING_CATEGORIES[category]['name']}: 목록 URL로 페이지를 바로 열 수 없어 순차 수집합니다.")
+            workers = 1
+    if workers == 1:
+        return crawl_category_sequential(category, max_pages=max_pages, progress=progress)
+    
+    lock = threading.Lock()
+    state = {"next_start": 1, "last_page": None}
+    shard_jobs = {}
+    failed_shards = []
+    
+    def claim_shard():
+        with lock:
+            start = state["next_start"]
+            last_page = state["last_page"]
+            if (last_page is not None and start > last_page) or (max_pages and start > max_pages):
+                return None
+            end = start + shard_pages - 1
+            if max_pages:
+                end = min(end, max_pages)
+            state["next_start"] = end + 1
+            return start, end
+    
+    def mark_last_page(page):
+        with lock:
+            if state["last_page"] is None or page < state["last_page"]:
+                state["last_page"] = page
+    
+    def run_worker(worker_index):
+        with driver_pool.lease() as worker:
+            while True:
+                shard = claim_shard()
+                if not shard:
+                    return
+                start, end = shard
+                _report(progress, 'shard', start=start, end=end)
+                print(f"[SHARD {worker_index}] {LISTING_CATEGORIES[category]['name']} {start}~{end}페이지 수집 시작")
+                
+                if start == 1:
+                    listing_result = _open_listing_for_fallback(worker, category)
+                else:
+                    # URL 이동이 확인된 상태이므로 구간 시작 페이지가 열리지 않으면 목록이 끝난 것 (앞 페이지를 클릭해 가지 않음)
+                    listing_result = worker.open_listing(category, start, allow_click_fallback=False)
+                if not listing_result.get('success'):
+                    if 'page' in listing_result:
+                        # 구간 시작 페이지가 없으면 도달한 페이지가 마지막 페이지
+                        mark_last_page(listing_result['page'])
+                        return
+                    failed_shards.append(shard)
+                    continue
+                
+                result = worker.extract_job_list(start_page=start, end_page=end, progress=progress)
+                if not result.get('success'):
+                    failed_shards.append(shard)
+                    continue
+                
+                shard_jobs[start] = result['jobs']
+                last_read_page = max([job['page'] for job in result['jobs']], default=start)
+                if last_read_page < end:
+                    mark_last_page(last_read_page)
+    
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='catch-shard') as executor:
+        futures = [executor.submit(run_worker, index + 1) for index in range(workers)]
+        errors = []
+        cancelled = None
+        for future in futures:
+            try:
+                future.result()
+            except CrawlCancelled as e:
+                cancelled = e
+            except Exception as e:
+                errors.append(str(e))
+        if cancelled:
+            raise cancelled
+    
+    # 페이지 순서대로 합치면서 페이지 경계에서 밀려 중복 수집된 공고 제거
+    all_jobs = []
+    seen_keys = set()
+    for start in sorted(shard_jobs):
+        for job in shard_jobs[start]:
+            job_key = job.get('job_id') or job['url']
+            if job_key in seen_keys:
+                continue
+            seen_keys.add(job_key)
+            all_jobs.append(job)
+    
+    if not shard_jobs:
+        return {"success": False, "message": "; ".join(errors) or "공고 목록을 수집하지 못했습니다."}
+    
+    total_pages = max(job['page'] for job in all_jobs) if all_jobs else 0
+    elapsed = time.monotonic() - started
+    print(f"{LISTING_CATEGORIES[category]['name']}: {workers}개 드라이버로 {len(all_jobs)}개 공고, {total_pages}페이지 수집 ({elapsed:.1f}초)")
+    return {
+        "success": True,
+        "message": f"총 {len(all_jobs)}개의 {LISTING_CATEGORIES[category]['name']} 공고를 {total_pages}페이지에서 찾았습니다.",
+        "jobs": all_jobs,
+        "total_pages": total_pages,
+        "workers": workers,
+        "failed_shards": sorted(failed_shards)
+    }
+
+def _collect_category_jobs(category, max_pages=None, progress=None):
+    """카테고리 전체 공고 수집 (목록 API 빠른 경로 → 실패 시 풀 드라이버들로 병렬 Selenium 수집)"""
+    jobs_result = listing_api.fetch_jobs(category, max_pages=max_pages, progress=progress)
+    if not jobs_result.get('success'):
+        jobs_result = crawl_category_sharded(category, max_pages=max_pages, progress=progress)
+    
+    _store_jobs(jobs_result, category)
+    if jobs_result.get('success'):
+        # max_pages로 앞쪽 페이지만 읽었으면 'partial' (증분 수집의 시작점으로는 충분함)
+        jobs = jobs_result.get('jobs', [])
+        job_store.set_watermark(category, 'partial' if max_pages else 'full', jobs[0].get('job_id') if jobs else None,
+                                jobs_result.get('total_pages', 0), len(jobs))
+    return jobs_result
+
+def crawl_category_incremental(category, max_pages=None, known_pages=INCREMENTAL_KNOWN_PAGES, progress=None):
+    """최신순 목록을 앞에서부터 읽으며 새 공고만 수집하고, 저장소에 이미 있는 공고만 나오는
+    페이지가 known_pages번 연속되면 중단 (저장소가 본 공고 집합 역할)
+    
+    이 카테고리를 한 번도 수집하지 않았으면 전체 수집으로 대신하고, 최신순 정렬을 확인하지 못하면
+    사이트 기본 순서가 등록순이 아니므로 중간에 멈추지 않고 끝까지(또는 max_pages까지) 읽음
+    """
+    name = LISTING_CATEGORIES[category]['name']
+    if not job_store.get_watermark(category):
+        print(f"{name} 수집 기록이 없어 전체 수집을 먼저 진행합니다.")
+        jobs_result = _collect_category_jobs(category, max_pages=max_pages, progress=progress)
+        if jobs_result.get('success'):
+            jobs_result = dict(jobs_result, mode='partial' if max_pages else 'full', new_jobs=len(jobs_result.get('jobs', [])))
+        return jobs_result
+    
+    with driver_pool.lease() as worker:
+        listing_result = _open_listing_for_fallback(worker, category)
+        if not listing_result.get('success'):
+            return listing_result
+        sorted_newest = worker.sort_listing_newest_first()
+        if not sorted_newest:
+            print(f"{name}: 최신순 정렬을 확인하지 못해 조기 중단 없이 전체 페이지를 확인합니다.")
+        
+        new_jobs = []
+        newest_job_id = None
+        pages_read = 0
+        known_streak = 0
+        for page, page_jobs in worker.iter_pages(max_pages):
+            pages_read = page
+            if newest_job_id is None and page_jobs:
+                newest_job_id = page_jobs[0].get('job_id')
+            
+            known_ids = job_store.known_job_ids([job.get('job_id') for job in page_jobs], category)
+            page_new_jobs = [job for job in page_jobs if job.get('job_id') not in known_ids]
+            # 새 공고가 없어도 last_seen 갱신을 위해 페이지 전체를 저장
+            job_store.upsert_jobs(page_jobs, category)
+            new_jobs.extend(page_new_jobs)
+            print(f"페이지 {page}: 새 공고 {len(page_new_jobs)}개 / {len(page_jobs)}개")
+            _report(progress, 'page', page=page, rows=len(page_new_jobs))
+            
+            known_streak = known_streak + 1 if page_jobs and not page_new_jobs else 0
+            if sorted_newest and known_streak >= known_pages:
+                print(f"{name}: 이미 저장된 공고만 있는 페이지가 {known_streak}개 연속되어 수집을 멈춥니다.")
+                break
+    
+    mode = 'incremental' if sorted_newest else ('partial' if max_pages else 'full')
+    job_store.set_watermark(category, mode, newest_job_id, pages_read, len(new_jobs))
+    return {
+        "success": True,
+        "message": f"{name} 새 공고 {len(new_jobs)}개를 {pages_read}페이지에서 찾았습니다.",
+        "jobs": new_jobs,
+        "total_pages": pages_read,
+        "mode": mode,
+        "new_jobs": len(new_jobs),
+        "sorted_newest": sorted_newest
+    }
+
+@app.route('/api/init', methods=['POST'])
+def init_scraper():
+    """스크래퍼 초기화"""
+    try:
+        success = scraper.init_driver()
+        return jsonify({"success": success, "message": "스크래퍼가 초기화되었습니다." if success else "스크래퍼 초기화에 실패했습니다."})
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/login', methods=['POST'])
+def login():
+    """로그인"""
+    try:
+        data = request.get_json()
+        username = data.get('username', CATCH_USERNAME)
+        password = data.get('password', CATCH_PASSWORD)
+        
+        # 풀에서 새로 생성되는 드라이버도 같은 계정으로 로그인
+        driver_pool.set_credentials(username, password)
+        return jsonify(scraper.ensure_login(username, password, force=bool(data.get('force'))))
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/session/ensure', methods=['POST'])
+def ensure_session():
+    """드라이버 초기화 + 로그인을 한 번에 보장 (이미 준비되어 있으면 아무것도 하지 않고 즉시 응답)"""
+    try:
+        started = time.monotonic()
+        data = request.get_json(silent=True) or {}
+        username = data.get('username', CATCH_USERNAME)
+        password = data.get('password', CATCH_PASSWORD)
+        driver_pool.set_credentials(username, password)
+        
+        response = {}
+        if data.get('scraper', True):
+            response["scraper"] = scraper.ensure_session(username, password)
+        response["pool"] = driver_pool.ensure(int(data.get('pool', 1)))
+        response["success"] = response.get("scraper", {"success": True})["success"] and not response["pool"]["failed"]
+        response["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+        return jsonify(response)
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/status', methods=['GET'])
+def get_status():
+    """현재 상태 확인"""
+    try:
+        status = scraper.get_current_status()
+        status["pool"] = driver_pool.status()
+        status["pool"]["drivers"] = driver_pool.usage()
+        status["in_flight"] = single_flight.in_flight()
+        status["not_found_cache"] = not_found_cache.size()
+        return jsonify(status)
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/recruit', methods=['POST'])
+def navigate_to_recruit():
+    """채용공고 페이지로 이동"""
+    try:
+        result = scraper.navigate_to_recruit_page()
+        return jsonify(result)
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/open-listing', methods=['POST'])
+def open_listing():
+    """카테고리 공고 목록의 특정 페이지로 바로 이동"""
+    try:
+        data = request.get_json() or {}
+        result = scraper.open_listing(data.get('category', 'it'), data.get('page', 1))
+        return jsonify(result)
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/filter-it', methods=['POST'])
+def filter_it_jobs():
+    """IT개발 공고 필터링"""
+    try:
+        result = scraper.filter_it_jobs()
         return jsonify(result)
     except Exception as e:
         return _handle_api_error(e)
@@ -1210,7 +3267,16 @@ def extract_jobs():
     """IT개발 공고 목록 추출"""
     try:
         max_pages = request.args.get('max_pages', type=int)
-        result = scraper.extract_job_list(max_pages=max_pages)
+        category = request.args.get('category')
+        start_page = request.args.get('start_page', 1, type=int)
+        
+        # category가 주어지면 해당 카테고리의 start_page로 바로 이동한 뒤 추출 (이어서 수집)
+        if category:
+            listing_result = scraper.open_listing(category, start_page)
+            if not listing_result.get('success'):
+                return jsonify(listing_result)
+        
+        result = scraper.extract_job_list(max_pages=max_pages, start_page=start_page)
         return jsonify(result)
     except Exception as e:
         return _handle_api_error(e)
@@ -1225,61 +3291,66 @@ def extract_first_page_jobs():
     except Exception as e:
         return _handle_api_error(e)
 
+def _scrape_homepage_jobs():
+    """홈페이지용 공고 수집 (공고를 하나도 못 가져오면 None - 캐시에 저장하지 않음)"""
+    results = {
+        "it_jobs": [],
+        "bigdata_ai_jobs": [],
+        "total_it_jobs": 0,
+        "total_bigdata_ai_jobs": 0
+    }
+    
+    # IT개발 10개와 빅데이터·AI 10개를 서로 다른 풀 드라이버에서 동시에 추출
+    print("=== 홈페이지용 IT개발 + 빅데이터·AI 공고 동시 추출 ===")
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix='catch-homepage') as executor:
+        it_future = executor.submit(_collect_first_page_jobs, 'it', 10)
+        bigdata_future = executor.submit(_collect_first_page_jobs, 'bigdata_ai', 10)
+        it_jobs_result = it_future.result()
+        bigdata_jobs_result = bigdata_future.result()
+    
+    # 1. IT개발 공고 10개
+    if it_jobs_result.get('success'):
+        results["it_jobs"] = it_jobs_result.get('jobs', [])
+        results["total_it_jobs"] = len(results["it_jobs"])
+        print(f"IT개발: {results['total_it_jobs']}개 공고 추출")
+    
+    # 2. 빅데이터·AI 공고 10개
+    if bigdata_jobs_result.get('success'):
+        results["bigdata_ai_jobs"] = bigdata_jobs_result.get('jobs', [])
+        results["total_bigdata_ai_jobs"] = len(results["bigdata_ai_jobs"])
+        print(f"빅데이터·AI: {results['total_bigdata_ai_jobs']}개 공고 추출")
+    
+    if results["total_it_jobs"] + results["total_bigdata_ai_jobs"] == 0:
+        return None
+    return results
+
 @app.route('/api/homepage-jobs', methods=['GET'])
 def get_homepage_jobs():
-    """홈페이지용 공고 (IT개발 10개 + 빅데이터·AI 10개)"""
+    """홈페이지용 공고 (IT개발 10개 + 빅데이터·AI 10개, 캐시된 결과를 바로 반환하고 오래되면 백그라운드 갱신)"""
     try:
-        results = {
-            "it_jobs": [],
-            "bigdata_ai_jobs": [],
-            "total_it_jobs": 0,
-            "total_bigdata_ai_jobs": 0
-        }
-        
-        # 1. IT개발 공고 10개
-        print("=== 홈페이지용 IT개발 공고 추출 ===")
-        it_filter_result = scraper.filter_it_jobs()
-        if it_filter_result.get('success'):
-            it_jobs_result = scraper.extract_first_page_jobs(max_jobs=10)
-            if it_jobs_result.get('success'):
-                results["it_jobs"] = it_jobs_result.get('jobs', [])
-                results["total_it_jobs"] = len(results["it_jobs"])
-                print(f"IT개발: {results['total_it_jobs']}개 공고 추출")
-        
-        # 2. 빅데이터·AI 공고 10개 (새로운 세션으로)
-        print("=== 홈페이지용 빅데이터·AI 공고 추출 ===")
-        # 채용공고 페이지로 다시 이동하여 필터 초기화
-        recruit_result = scraper.navigate_to_recruit_page()
-        if recruit_result.get('success'):
-            bigdata_filter_result = scraper.filter_bigdata_ai()
-            if bigdata_filter_result.get('success'):
-                bigdata_jobs_result = scraper.extract_first_page_jobs(max_jobs=10)
-                if bigdata_jobs_result.get('success'):
-                    results["bigdata_ai_jobs"] = bigdata_jobs_result.get('jobs', [])
-                    results["total_bigdata_ai_jobs"] = len(results["bigdata_ai_jobs"])
-                    print(f"빅데이터·AI: {results['total_bigdata_ai_jobs']}개 공고 추출")
+        force = request.args.get('refresh', '0') == '1'
+        results, generated_at, stale = homepage_cache.get(
+            'homepage_jobs', lambda: single_flight.do(('homepage_jobs',), _scrape_homepage_jobs), force=force)
+        if results is None:
+            return jsonify({"success": False, "message": "홈페이지용 공고를 가져오지 못했습니다."})
         
         total_jobs = results["total_it_jobs"] + results["total_bigdata_ai_jobs"]
         
         return jsonify({
             "success": True,
             "message": f"홈페이지용 총 {total_jobs}개 공고를 추출했습니다. (IT개발: {results['total_it_jobs']}개, 빅데이터·AI: {results['total_bigdata_ai_jobs']}개)",
-            "results": results
+            "results": results,
+            "generated_at": datetime.fromtimestamp(generated_at).isoformat(timespec='seconds'),
+            "age": round(time.time() - generated_at, 1),
+            "stale": stale
         })
         
     except Exception as e:
         return _handle_api_error(e)
 
-@app.route('/api/search-company', methods=['POST'])
-def search_company():
-    """특정 기업의 공고 검색 (IT개발 + 빅데이터·AI)"""
-    try:
-        data = request.get_json()
-        company_name = data.get('company_name', '')
-        
-        if not company_name:
-            return jsonify({"success": False, "message": "기업명을 입력해주세요."})
-        
+def _search_company_jobs(company_name, progress=None):
+    """특정 기업의 IT개발 + 빅데이터·AI 공고 검색 (한 풀 드라이버에서 두 카테고리 순서대로)"""
+    with driver_pool.lease() as worker:
         results = {
             "company_name": company_name,
             "it_jobs": [],
@@ -1288,33 +3359,42 @@ def search_company():
             "total_bigdata_ai_jobs": 0
         }
         
-        # 1. IT개발 공고 검색
-        print(f"\n=== {company_name} 기업 IT개발 공고 검색 시작 ===")
-        it_filter_result = scraper.filter_it_jobs()
-        if it_filter_result.get('success'):
-            it_jobs_result = scraper.extract_company_jobs(company_name)
-            if it_jobs_result.get('success'):
-                results["it_jobs"] = it_jobs_result.get('jobs', [])
-                results["total_it_jobs"] = len(results["it_jobs"])
-                print(f"IT개발: {results['total_it_jobs']}개 공고 발견")
-        
-        # 2. 빅데이터·AI 공고 검색
-        print(f"\n=== {company_name} 기업 빅데이터·AI 공고 검색 시작 ===")
-        bigdata_filter_result = scraper.filter_bigdata_ai()
-        if bigdata_filter_result.get('success'):
-            bigdata_jobs_result = scraper.extract_company_jobs(company_name)
-            if bigdata_jobs_result.get('success'):
-                results["bigdata_ai_jobs"] = bigdata_jobs_result.get('jobs', [])
-                results["total_bigdata_ai_jobs"] = len(results["bigdata_ai_jobs"])
-                print(f"빅데이터·AI: {results['total_bigdata_ai_jobs']}개 공고 발견")
+        for category in ('it', 'bigdata_ai'):
+            name = LISTING_CATEGORIES[category]['name']
+            print(f"\n=== {company_name} 기업 {name} 공고 검색 시작 ===")
+            _report(progress, 'category', category=category)
+            filter_result = worker.open_listing(category)
+            if not filter_result.get('success'):
+                continue
+            jobs_result = worker.extract_company_jobs(company_name, progress=_category_progress(progress, category))
+            _store_jobs(jobs_result, category)
+            if jobs_result.get('success'):
+                results[f"{category}_jobs"] = jobs_result.get('jobs', [])
+                results[f"total_{category}_jobs"] = len(results[f"{category}_jobs"])
+                print(f"{name}: {results[f'total_{category}_jobs']}개 공고 발견")
         
         total_jobs = results["total_it_jobs"] + results["total_bigdata_ai_jobs"]
         
-        return jsonify({
+        return {
             "success": True, 
             "message": f"'{company_name}' 기업의 총 {total_jobs}개 공고를 찾았습니다. (IT개발: {results['total_it_jobs']}개, 빅데이터·AI: {results['total_bigdata_ai_jobs']}개)",
             "results": results
-        })
+        }
+
+@app.route('/api/search-company', methods=['POST'])
+def search_company():
+    """특정 기업의 공고 검색 (IT개발 + 빅데이터·AI)"""
+    try:
+        data = request.get_json()
+        company_name = data.get('company_name', '')
+        
+        company_name = _normalize_text(company_name)
+        if not company_name:
+            return jsonify({"success": False, "message": "기업명을 입력해주세요."})
+        
+        # 기업명 비교가 대소문자 무시 부분 일치이므로 키도 대소문자를 구분하지 않음
+        return jsonify(single_flight.do(('company_jobs', company_name.casefold()),
+                                        lambda: _search_company_jobs(company_name)))
         
     except Exception as e:
         return _handle_api_error(e)
@@ -1335,8 +3415,28 @@ def get_job_detail():
         
         print(f"공고 상세 정보 추출 요청: {job_url}")
         
-        # 공고 상세 정보 추출
-        result = scraper.extract_job_detail(job_url)
+        # 공고 상세 정보 추출 (같은 공고를 동시에 요청하면 한 번만 추출)
+        job_url = job_url.strip()
+        job_key = ('job_detail', job_id_from_url(job_url) or job_url)
+        
+        not_found = not_found_cache.get(job_key)
+        if not_found:
+            print(f"[NOT FOUND] 최근에 볼 수 없었던 공고 (남은 시간 {not_found['expires_in']}초)")
+            return jsonify({
+                "success": False,
+                "not_found": True,
+                "cached": True,
+                "error": not_found["message"],
+                "message": "삭제되었거나 존재하지 않는 공고입니다"
+            })
+        
+        def extract():
+            with driver_pool.lease() as worker:
+                return worker.extract_job_detail(job_url)
+        
+        result = single_flight.do(job_key, extract)
+        if result.get('not_found'):
+            not_found_cache.add(job_key, result.get('error'))
         
         if result.get('success'):
             return jsonify({
@@ -1347,10 +3447,11 @@ def get_job_detail():
         else:
             return jsonify({
                 "success": False,
+                "not_found": bool(result.get('not_found')),
                 "error": result.get('error'),
-                "message": "공고 상세 정보 추출 실패"
+                "message": result.get('message', "공고 상세 정보 추출 실패")
             })
-            
+        
     except Exception as e:
         print(f"공고 상세 정보 추출 API 오류: {str(e)}")
         return jsonify({
@@ -1359,52 +3460,370 @@ def get_job_detail():
             "message": "서버 오류가 발생했습니다"
         })
 
+def _crawl_all_jobs(max_pages=None, progress=None):
+    """IT개발 전체 + 빅데이터·AI 전체 공고 순차 수집"""
+    results = {
+        "it_jobs": [],
+        "bigdata_ai_jobs": [],
+        "total_it_jobs": 0,
+        "total_bigdata_ai_jobs": 0,
+        "total_pages_it": 0,
+        "total_pages_bigdata_ai": 0
+    }
+    
+    for category in ('it', 'bigdata_ai'):
+        name = LISTING_CATEGORIES[category]['name']
+        print(f"=== {name} 전체 공고 수집 시작 ===")
+        _report(progress, 'category', category=category)
+        jobs_result = _collect_category_jobs(category, max_pages=max_pages, progress=_category_progress(progress, category))
+        if jobs_result.get('success'):
+            results[f"{category}_jobs"] = jobs_result.get('jobs', [])
+            results[f"total_{category}_jobs"] = len(results[f"{category}_jobs"])
+            results[f"total_pages_{category}"] = jobs_result.get('total_pages', 0)
+            print(f"{name}: {results[f'total_{category}_jobs']}개 공고, {results[f'total_pages_{category}']}페이지 수집 완료")
+    
+    total_jobs = results["total_it_jobs"] + results["total_bigdata_ai_jobs"]
+    total_pages = results["total_pages_it"] + results["total_pages_bigdata_ai"]
+    
+    return {
+        "success": True,
+        "message": f"전체 공고 수집 완료! 총 {total_jobs}개 공고, {total_pages}페이지 (IT개발: {results['total_it_jobs']}개, 빅데이터·AI: {results['total_bigdata_ai_jobs']}개)",
+        "results": results
+    }
+
 @app.route('/api/extract-all-jobs', methods=['GET'])
 def extract_all_jobs():
     """IT개발 전체 + 빅데이터·AI 전체 공고 순차 수집"""
     try:
-        results = {
-            "it_jobs": [],
-            "bigdata_ai_jobs": [],
-            "total_it_jobs": 0,
-            "total_bigdata_ai_jobs": 0,
-            "total_pages_it": 0,
-            "total_pages_bigdata_ai": 0
-        }
-        
-        # 1. IT개발 전체 공고 수집
-        print("=== IT개발 전체 공고 수집 시작 ===")
-        it_filter_result = scraper.filter_it_jobs()
-        if it_filter_result.get('success'):
-            it_jobs_result = scraper.extract_job_list()
-            if it_jobs_result.get('success'):
-                results["it_jobs"] = it_jobs_result.get('jobs', [])
-                results["total_it_jobs"] = len(results["it_jobs"])
-                results["total_pages_it"] = it_jobs_result.get('total_pages', 0)
-                print(f"IT개발: {results['total_it_jobs']}개 공고, {results['total_pages_it']}페이지 수집 완료")
-        
-        # 2. 빅데이터·AI 전체 공고 수집 (채용공고 페이지로 다시 이동)
-        print("=== 빅데이터·AI 전체 공고 수집 시작 ===")
-        recruit_result = scraper.navigate_to_recruit_page()
-        if recruit_result.get('success'):
-            bigdata_filter_result = scraper.filter_bigdata_ai()
-            if bigdata_filter_result.get('success'):
-                bigdata_jobs_result = scraper.extract_job_list()
-                if bigdata_jobs_result.get('success'):
-                    results["bigdata_ai_jobs"] = bigdata_jobs_result.get('jobs', [])
-                    results["total_bigdata_ai_jobs"] = len(results["bigdata_ai_jobs"])
-                    results["total_pages_bigdata_ai"] = bigdata_jobs_result.get('total_pages', 0)
-                    print(f"빅데이터·AI: {results['total_bigdata_ai_jobs']}개 공고, {results['total_pages_bigdata_ai']}페이지 수집 완료")
+        return jsonify(_crawl_all_jobs())
+    except Exception as e:
+        return _handle_api_error(e)
+
+def _crawl_new_jobs(category=None, max_pages=None, progress=None):
+    """카테고리별 증분 수집 (category를 생략하면 IT개발, 빅데이터·AI 모두)"""
+    results = {}
+    for key in ([category] if category else list(LISTING_CATEGORIES)):
+        print(f"=== {LISTING_CATEGORIES[key]['name']} 증분 수집 시작 ===")
+        _report(progress, 'category', category=key)
+        jobs_result = crawl_category_incremental(key, max_pages=max_pages, progress=_category_progress(progress, key))
+        jobs_result["watermark"] = job_store.get_watermark(key)
+        results[key] = jobs_result
+    
+    total_new = sum(result.get('new_jobs', 0) for result in results.values() if result.get('success'))
+    return {
+        "success": any(result.get('success') for result in results.values()),
+        "message": f"새 공고 {total_new}개를 수집했습니다.",
+        "results": results
+    }
+
+def iter_category_pages(category, max_pages=None):
+    """카테고리 공고를 페이지 단위로 (페이지 번호, 공고 목록) 생성 (목록 API → 실패하거나 1페이지까지만 가져올 수 있으면 그 다음 페이지부터 Selenium)
+    
+    전체 결과를 모으지 않으므로 스트리밍 응답에서 페이지마다 바로 내보낼 수 있음
+    """
+    next_page = 1
+    if listing_api.is_available(category):
+        endpoint = listing_endpoints[category]
+        try:
+            for page, page_jobs in listing_api.iter_pages(category, max_pages):
+                yield page, page_jobs
+                next_page = page + 1
+            # 페이지 파라미터가 없는 목록 API는 1페이지만 가져오므로 2페이지부터는 Selenium으로 이어서 수집
+            if next_page == 1 or endpoint.page_key:
+                return
+        except Exception as e:
+            print(f"[FAST] 목록 API 호출 실패, {next_page}페이지부터 Selenium으로 대체: {e}")
+    
+    remaining_pages = max_pages - (next_page - 1) if max_pages else None
+    if remaining_pages is not None and remaining_pages <= 0:
+        return
+    with driver_pool.lease() as worker:
+        if next_page == 1:
+            listing_result = _open_listing_for_fallback(worker, category)
+        else:
+            listing_result = worker.open_listing(category, next_page)
+        if not listing_result.get('success'):
+            raise RuntimeError(listing_result.get('message', '공고 목록을 열 수 없습니다.'))
+        yield from worker.iter_pages(remaining_pages, start_page=next_page)
+
+def _stream_jobs_ndjson(categories, max_pages=None):
+    """공고를 한 줄에 하나씩 JSON으로 내보내는 제너레이터 (페이지를 읽을 때마다 저장소에도 upsert)"""
+    def line(payload):
+        return json.dumps(payload, ensure_ascii=False) + "\n"
+    
+    totals = {}
+    for category in categories:
+        totals[category] = 0
+        try:
+            for page, page_jobs in iter_category_pages(category, max_pages):
+                job_store.upsert_jobs(page_jobs, category)
+                for job in page_jobs:
+                    yield line(dict(job, type='job', category=category, page=page))
+                totals[category] += len(page_jobs)
+        except Exception as e:
+            yield line({"type": "error", "category": category, "message": str(e)})
+    
+    yield line({"type": "done", "totals": totals, "total_jobs": sum(totals.values())})
+
+@app.route('/api/extract-all-jobs/stream', methods=['GET'])
+def stream_all_jobs():
+    """전체 공고를 NDJSON(한 줄에 공고 하나)으로 페이지마다 바로 스트리밍 (category, max_pages)"""
+    category = request.args.get('category')
+    if category and category not in LISTING_CATEGORIES:
+        return jsonify({"success": False, "message": f"알 수 없는 카테고리입니다: {category}"})
+    categories = [category] if category else list(LISTING_CATEGORIES)
+    max_pages = request.args.get('max_pages', type=int)
+    
+    return Response(stream_with_context(_stream_jobs_ndjson(categories, max_pages)),
+                    mimetype='application/x-ndjson', headers={'X-Accel-Buffering': 'no'})
+
+@app.route('/api/extract-new-jobs', methods=['GET'])
+def extract_new_jobs():
+    """마지막 수집 이후 새로 올라온 공고만 증분 수집 (category: it, bigdata_ai, 생략 시 둘 다)"""
+    try:
+        category = request.args.get('category')
+        max_pages = request.args.get('max_pages', type=int)
+        if category and category not in LISTING_CATEGORIES:
+            return jsonify({"success": False, "message": f"알 수 없는 카테고리입니다: {category}"})
         
-        total_jobs = results["total_it_jobs"] + results["total_bigdata_ai_jobs"]
-        total_pages = results["total_pages_it"] + results["total_pages_bigdata_ai"]
+        return jsonify(_crawl_new_jobs(category, max_pages))
+    except Exception as e:
+        return _handle_api_error(e)
+
+def _extract_job_list(category='it', max_pages=None, start_page=1, progress=None):
+    """카테고리 목록의 start_page부터 공고 추출 (풀 드라이버 사용)"""
+    with driver_pool.lease() as worker:
+        listing_result = worker.open_listing(category, start_page, progress=_category_progress(progress, category))
+        if not listing_result.get('success'):
+            return listing_result
+        jobs_result = worker.extract_job_list(max_pages=max_pages, start_page=start_page, progress=_category_progress(progress, category))
+    _store_jobs(jobs_result, category)
+    return jobs_result
+
+def _search_company_info(company_name, progress=None, refresh=False):
+    """기업 검색 후 상세 정보 + 현직자 리뷰 추출 (풀 드라이버 사용)
+    
+    기업 URL은 디렉터리 색인에서 정규화한 이름이 정확히 같을 때만 바로 사용하고, 그 외에는 실시간 검색
+    (유사한 이름은 다른 기업일 수 있으므로 후보로만 응답에 포함, 검색 결과는 색인에 추가)
+    상세 정보는 섹션별 캐시를 먼저 보고 만료된 섹션만 다시 추출 (refresh면 전체 다시 추출)
+    """
+    def expired_sections(company_url):
+        cached_sections, expired = company_detail_cache.load(company_url)
+        return cached_sections, list(COMPANY_DETAIL_SECTIONS) if refresh else expired
+    
+    match = company_directory.lookup(company_name)
+    if match:
+        company_url = match["company_url"]
+        resolved = {"name": match["name"], "score": match["score"], "method": "directory"}
+        print(f"[DIRECTORY] '{company_name}' → {match['name']}")
+        _report(progress, 'resolve', company_name=match["name"], score=match["score"])
+        cached_sections, expired = expired_sections(company_url)
+    
+    if match and not expired:
+        # 디렉터리와 캐시로 모두 해결되면 드라이버를 빌리지 않음
+        print(f"[COMPANY CACHE] {company_name}: 모든 섹션 캐시 사용")
+        detail_result = {"success": True, "company_detail": {}, "failed_sections": []}
+    else:
+        negative_key = ('company', normalize_company_name(company_name))
+        if not match:
+            not_found = not_found_cache.get(negative_key)
+            if not_found and not refresh:
+                print(f"[NOT FOUND] '{company_name}' 최근에 찾지 못한 기업 (남은 시간 {not_found['expires_in']}초)")
+                return {"success": False, "not_found": True, "cached": True, "candidates": company_directory.suggest(company_name),
+                        "message": not_found["message"]}
         
+        with driver_pool.lease() as worker:
+            if not match:
+                _report(progress, 'search', company_name=company_name)
+                search_result = worker.search_company(company_name)
+                for company in search_result.get('companies', []):
+                    company_directory.add(company["url"], company["name"])
+                if not search_result.get('success'):
+                    if search_result.get('not_found'):
+                        not_found_cache.add(negative_key, search_result.get('message'))
+                    return {
+                        "success": False,
+                        "not_found": bool(search_result.get('not_found')),
+                        "candidates": company_directory.suggest(company_name),
+                        "message": search_result.get('message')
+                    }
+                not_found_cache.discard(negative_key)
+                company_url = search_result.get('company_url')
+                resolved_name = search_result.get('company_name', company_name)
+                resolved = {"name": resolved_name, "score": company_directory.similarity(company_name, resolved_name), "method": "search"}
+                company_directory.add(company_url, resolved_name, alias=company_name)
+                cached_sections, expired = expired_sections(company_url)
+            
+            if expired:
+                print(f"[COMPANY CACHE] {company_name}: {', '.join(expired)} 섹션 다시 추출")
+                detail_result = worker.extract_company_detail(company_url, progress=progress, sections=expired)
+            else:
+                print(f"[COMPANY CACHE] {company_name}: 모든 섹션 캐시 사용")
+                detail_result = {"success": True, "company_detail": {}, "failed_sections": []}
+    
+    if not detail_result.get('success'):
+        if not cached_sections:
+            return {
+                "success": False,
+                "error": detail_result.get('error'),
+                "message": "기업 상세 정보 추출 실패"
+            }
+        # 다시 추출하지 못했으면 만료된 캐시라도 반환
+        detail_result = {"success": True, "company_detail": {}, "failed_sections": expired}
+    
+    refreshed = [section for section in expired if section not in detail_result.get('failed_sections', [])]
+    if refreshed:
+        company_detail_cache.save(company_url, detail_result['company_detail'], refreshed)
+    
+    # 새로 추출한 결과 위에 다시 추출하지 않은 섹션의 캐시를 덮어씀 (추출에 실패한 섹션은 이전 캐시 유지)
+    company_detail = {key: [] if key in ("tags", "recommendation_keywords") else ""
+                      for fields in COMPANY_DETAIL_FIELDS.values() for key in fields}
+    company_detail["reviews"] = []
+    company_detail.update(detail_result['company_detail'])
+    company_detail.update(company_detail_cache.merge({section: cached for section, cached in cached_sections.items()
+                                                      if section not in refreshed}))
+    return {
+        "success": True,
+        "company_detail": company_detail,
+        "company_url": company_url,
+        "resolved_company": resolved,
+        "cache": {section: ("refreshed" if section in refreshed else "cached" if section in cached_sections else "missing")
+                  for section in COMPANY_DETAIL_SECTIONS},
+        "message": f"'{company_name}' 기업 정보 추출 완료"
+    }
+
+def _start_crawl_job(data):
+    """요청 본문으로 백그라운드 수집 작업 등록 (잘못된 요청이면 에러 메시지 문자열 반환)"""
+    kind = data.get('type', 'all_jobs')
+    max_pages = data.get('max_pages')
+    if kind == 'all_jobs':
+        return crawl_jobs.submit(kind, _crawl_all_jobs, {"max_pages": max_pages})
+    if kind == 'new_jobs':
+        category = data.get('category')
+        if category and category not in LISTING_CATEGORIES:
+            return f"알 수 없는 카테고리입니다: {category}"
+        return crawl_jobs.submit(kind, _crawl_new_jobs, {"category": category, "max_pages": max_pages})
+    if kind == 'job_list':
+        category = data.get('category', 'it')
+        if category not in LISTING_CATEGORIES:
+            return f"알 수 없는 카테고리입니다: {category}"
+        return crawl_jobs.submit(kind, _extract_job_list, {"category": category, "max_pages": max_pages,
+                                                            "start_page": data.get('start_page', 1)})
+    if kind in ('company', 'company_detail'):
+        company_name = data.get('company_name', '')
+        if not company_name:
+            return "기업명을 입력해주세요."
+        runner = _search_company_jobs if kind == 'company' else _search_company_info
+        return crawl_jobs.submit(kind, runner, {"company_name": company_name})
+    return f"알 수 없는 작업 종류입니다: {kind} (all_jobs, new_jobs, job_list, company, company_detail 중 하나)"
+
+@app.route('/api/crawl-jobs', methods=['POST'])
+def create_crawl_job():
+    """수집 작업을 백그라운드로 시작하고 작업 ID를 바로 반환 (type: all_jobs, new_jobs, company)"""
+    try:
+        job = _start_crawl_job(request.get_json(silent=True) or {})
+        if isinstance(job, str):
+            return jsonify({"success": False, "message": job})
         return jsonify({
             "success": True,
-            "message": f"전체 공고 수집 완료! 총 {total_jobs}개 공고, {total_pages}페이지 (IT개발: {results['total_it_jobs']}개, 빅데이터·AI: {results['total_bigdata_ai_jobs']}개)",
-            "results": results
+            "message": "수집 작업을 시작했습니다.",
+            "job_id": job.id,
+            "status_url": f"/api/crawl-jobs/{job.id}",
+            "events_url": f"/api/crawl-jobs/{job.id}/events",
+            "job": job.to_dict()
         })
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/crawl-jobs', methods=['GET'])
+def list_crawl_jobs():
+    """보관 중인 수집 작업 목록 (결과 제외)"""
+    try:
+        return jsonify({"success": True, "jobs": [job.to_dict(include_result=False) for job in crawl_jobs.list()]})
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/crawl-jobs/<job_id>', methods=['GET'])
+def get_crawl_job(job_id):
+    """수집 작업 진행 상황 (끝난 작업은 결과 포함)"""
+    try:
+        job = crawl_jobs.get(job_id)
+        if job is None:
+            return jsonify({"success": False, "message": f"'{job_id}' 작업을 찾을 수 없습니다."})
+        return jsonify({"success": True, "job": job.to_dict()})
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/crawl-jobs/<job_id>/events', methods=['GET'])
+def stream_crawl_job_events(job_id):
+    """수집 작업 진행 이벤트를 Server-Sent Events로 전달 (단계, 경과 시간, 페이지/행 수, 마지막은 end 이벤트)
+    
+    재연결 시 Last-Event-ID 헤더(또는 after 파라미터) 이후의 이벤트부터 이어서 전달
+    """
+    job = crawl_jobs.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "message": f"'{job_id}' 작업을 찾을 수 없습니다."})
+    after = request.headers.get('Last-Event-ID', type=int) or request.args.get('after', 0, type=int)
+    
+    def generate():
+        yield "retry: 3000\n\n"
+        for event in job.iter_events(after=after):
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"id: {event['seq']}\nevent: {event['phase']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/crawl-jobs/<job_id>', methods=['DELETE'])
+def cancel_crawl_job(job_id):
+    """수집 작업 취소 (실행 중이면 현재 페이지를 마친 뒤 중단)"""
+    try:
+        job = crawl_jobs.cancel(job_id)
+        if job is None:
+            return jsonify({"success": False, "message": f"'{job_id}' 작업을 찾을 수 없습니다."})
+        return jsonify({"success": True, "message": "작업 취소를 요청했습니다.", "job": job.to_dict(include_result=False)})
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/stored-jobs', methods=['GET'])
+def get_stored_jobs():
+    """저장소에 쌓인 공고 조회 (Chrome 사용 안 함)"""
+    try:
+        category = request.args.get('category')
+        company = request.args.get('company')
+        limit = min(request.args.get('limit', 100, type=int), 1000)
+        offset = request.args.get('offset', 0, type=int)
         
+        jobs = job_store.get_jobs(category=category, company=company, limit=limit, offset=offset)
+        return jsonify({
+            "success": True,
+            "message": f"저장된 공고 {len(jobs)}개를 조회했습니다.",
+            "jobs": jobs,
+            "total": job_store.count_jobs(category, company)
+        })
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/stored-jobs/<job_id>', methods=['GET'])
+def get_stored_job(job_id):
+    """저장소에서 job_id로 공고 한 건 조회"""
+    try:
+        job = job_store.get_job(job_id)
+        if not job:
+            return jsonify({"success": False, "message": f"'{job_id}' 공고가 저장소에 없습니다."})
+        return jsonify({"success": True, "job": job})
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/company-directory', methods=['GET'])
+def search_company_directory():
+    """기업 디렉터리에서 이름으로 후보 조회 (q, limit - Chrome 사용 안 함)"""
+    try:
+        query = request.args.get('q', '')
+        limit = min(request.args.get('limit', 5, type=int), 50)
+        return jsonify({"success": True, "companies": company_directory.search(query, limit=limit), "total": company_directory.size()})
     except Exception as e:
         return _handle_api_error(e)
 
@@ -1415,34 +3834,14 @@ def search_company_info():
         data = request.get_json()
         company_name = data.get('company_name', '')
         
+        company_name = _normalize_text(company_name)
         if not company_name:
             return jsonify({"success": False, "message": "기업명을 입력해주세요."})
         
+        refresh = bool(data.get('refresh'))
         print(f"기업 정보 검색 요청: {company_name}")
-        
-        # 1. 기업 검색
-        search_result = scraper.search_company(company_name)
-        if not search_result.get('success'):
-            return jsonify({
-                "success": False,
-                "message": search_result.get('message')
-            })
-        
-        # 2. 기업 상세 정보 추출
-        detail_result = scraper.extract_company_detail(search_result.get('company_url'))
-        
-        if detail_result.get('success'):
-            return jsonify({
-                "success": True,
-                "company_detail": detail_result.get('company_detail'),
-                "message": f"'{company_name}' 기업 정보 추출 완료"
-            })
-        else:
-            return jsonify({
-                "success": False,
-                "error": detail_result.get('error'),
-                "message": "기업 상세 정보 추출 실패"
-            })
+        return jsonify(single_flight.do(('company_info', normalize_company_name(company_name), refresh),
+                                        lambda: _search_company_info(company_name, refresh=refresh)))
             
     except Exception as e:
         print(f"기업 정보 검색 API 오류: {str(e)}")
@@ -1457,3 +3856,5 @@ if __name__ == '__main__':
         app.run(host='0.0.0.0', port=3000, debug=True)
     except KeyboardInterrupt:
         scraper.close_driver()
+        crawl_jobs.shutdown()
+        driver_pool.close_all()
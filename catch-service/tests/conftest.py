@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+
+# catch_scraper는 import 시점에 SQLite 저장소를 만들므로 테스트용 임시 경로를 먼저 지정
+_tmp_dir = tempfile.mkdtemp(prefix='catch-tests-')
+os.environ.setdefault('CATCH_JOB_STORE_PATH', os.path.join(_tmp_dir, 'catch_jobs.db'))
+os.environ.setdefault('CATCH_SESSION_COOKIE_PATH', os.path.join(_tmp_dir, 'catch_session.json'))
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,46 @@
+from catch_scraper import DriverPool
+
+
+class StubScraper:
+    def __init__(self, debug_port, alive=True):
+        self.debug_port = debug_port
+        self.alive = alive
+        self.closed = False
+        self.started_at = None
+
+    def is_alive(self):
+        return self.alive
+
+    def recycle_reason(self, include_memory=True):
+        return None
+
+    def close_driver(self):
+        self.closed = True
+
+
+def make_pool(idle, spares=()):
+    pool = DriverPool(size=2, lease_timeout=1, base_debug_port=9400, spares=0)
+    for scraper in idle:
+        pool._members.append(scraper)
+        pool._idle.put(scraper)
+    pool._spares.extend(spares)
+    return pool
+
+
+def test_acquire_returns_live_idle_driver():
+    scraper = StubScraper(9400)
+    pool = make_pool([scraper])
+
+    assert pool.acquire() is scraper
+    assert pool.status()["recycled"] == 0
+
+
+def test_acquire_swaps_driver_that_died_while_idle_for_spare():
+    dead = StubScraper(9400, alive=False)
+    spare = StubScraper(9401)
+    pool = make_pool([dead], spares=[spare])
+
+    assert pool.acquire() is spare
+    assert dead.closed is True
+    assert dead not in pool._members and spare in pool._members
+    assert pool.status()["recycled"] == 1
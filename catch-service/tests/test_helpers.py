@@ -0,0 +1,266 @@
+import json
+import threading
+import time
+
+import pytest
+
+import catch_scraper
+from catch_scraper import (
+    CompanyDirectory,
+    JobListParser,
+    ListingEndpoint,
+    NegativeCache,
+    SingleFlight,
+    StaleWhileRevalidateCache,
+    build_listing_url,
+    job_id_from_url,
+    normalize_company_name,
+)
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_job_id_from_url():
+    assert job_id_from_url("https://www.catch.co.kr/NCS/RecruitInfoDetails/123456") == "123456"
+    assert job_id_from_url("https://www.catch.co.kr/Recruit/View?recruitSeq=987") == "987"
+    assert job_id_from_url("") is None
+    assert job_id_from_url("https://www.catch.co.kr/NCS/RecruitSearch") is None
+
+
+def test_normalize_company_name():
+    assert normalize_company_name("(주) 현대모비스") == "현대모비스"
+    assert normalize_company_name("주식회사 Kakao") == "kakao"
+    assert normalize_company_name("㈜네이버") == normalize_company_name("네이버 주식회사")
+    assert normalize_company_name(None) == ""
+
+
+def test_build_listing_url_sets_page_param():
+    url = build_listing_url("https://www.catch.co.kr/NCS/RecruitSearch?jobCode=IT&page=1", page=3)
+    assert f"{catch_scraper.LISTING_PAGE_PARAM}=3" in url
+    assert "jobCode=IT" in url
+    assert build_listing_url("https://example.com/list/{page}", page=2) == "https://example.com/list/2"
+
+
+@pytest.mark.skipif(catch_scraper.etree is None, reason="lxml이 설치되어 있지 않음")
+def test_job_list_parser_parses_rows_and_skips_incomplete():
+    html = """
+    <table><tbody>
+      <tr><td>
+        <p class="name2">테스트기업</p>
+        <a href="/NCS/RecruitInfoDetails/555"><p class="subj2">백엔드   개발자</p></a>
+        <p class="job"><span>서버</span><span>Java</span></p>
+        <p class="cond">경력 3년</p><p class="cond">정규직</p>
+        <p class="date2">09.01</p><p class="num_dday">D-3</p>
+      </td></tr>
+      <tr><td><p class="name2">링크없음</p><p class="subj2">제목만 있는 행</p></td></tr>
+    </tbody></table>
+    """
+    jobs = JobListParser().parse(html)
+
+    assert jobs == [{
+        "title": "백엔드 개발자",
+        "company": "테스트기업",
+        "job_info": ["서버", "Java"],
+        "conditions": ["경력 3년", "정규직"],
+        "registration_info": ["09.01", "D-3"],
+        "url": "https://www.catch.co.kr/NCS/RecruitInfoDetails/555",
+        "job_id": "555",
+    }]
+    assert JobListParser().parse("") == []
+
+
+def make_capture(url="https://www.catch.co.kr/api/recruit/list?page=1&size=20", post_data=None, method="GET"):
+    request_info = {
+        "url": url,
+        "method": method,
+        "headers": {":authority": "www.catch.co.kr", "Accept": "application/json", "Cookie": "session=1"},
+        "post_data": post_data,
+    }
+    data = {"data": {"list": [
+        {"recruitSeq": 123456, "recruitTitle": "백엔드 개발자", "compName": "테스트기업", "career": "경력 3년"},
+        {"recruitSeq": 123457, "recruitTitle": "프론트엔드 개발자", "compName": "다른기업", "career": "신입"},
+    ]}}
+    dom_rows = [
+        {"title": "백엔드 개발자", "company": "테스트기업", "job_info": [], "conditions": ["경력 3년"],
+         "registration_info": [], "url": "https://www.catch.co.kr/NCS/RecruitInfoDetails/123456"},
+        {"title": "프론트엔드 개발자", "company": "다른기업", "job_info": [], "conditions": ["신입"],
+         "registration_info": [], "url": "https://www.catch.co.kr/NCS/RecruitInfoDetails/123457"},
+    ]
+    return request_info, data, dom_rows
+
+
+def test_listing_endpoint_infers_fields_from_capture():
+    request_info, data, dom_rows = make_capture()
+    endpoint = ListingEndpoint.from_capture("IT개발", request_info, data, dom_rows)
+
+    assert endpoint.rows_path == ("data", "list")
+    assert endpoint.field_map["title"] == "recruitTitle"
+    assert endpoint.field_map["company"] == "compName"
+    assert endpoint.field_map["id"] == "recruitSeq"
+    assert endpoint.field_map["conditions"] == ["career"]
+    assert endpoint.page_key == ("query", "page")
+    assert endpoint.headers == {"Accept": "application/json"}
+
+    jobs = endpoint.parse_rows(data, page=1)
+    assert jobs[0]["url"] == "https://www.catch.co.kr/NCS/RecruitInfoDetails/123456"
+    assert jobs[0]["job_id"] == "123456"
+    assert jobs[1]["conditions"] == ["신입"]
+
+
+def test_listing_endpoint_rejects_unrelated_response():
+    request_info, _, dom_rows = make_capture()
+    data = {"items": [{"id": 1, "name": "배너"}]}
+
+    assert ListingEndpoint.from_capture("IT개발", request_info, data, dom_rows) is None
+    assert ListingEndpoint.from_capture("IT개발", request_info, data, []) is None
+
+
+def test_listing_endpoint_build_request_pages():
+    request_info, data, dom_rows = make_capture()
+    endpoint = ListingEndpoint.from_capture("IT개발", request_info, data, dom_rows)
+
+    method, url, body = endpoint.build_request(3)
+    assert method == "GET"
+    assert "page=3" in url and "size=20" in url
+    assert body is None
+
+    json_info, _, _ = make_capture(url="https://www.catch.co.kr/api/recruit/list", method="POST",
+                                   post_data=json.dumps({"pageNo": 1, "size": 20}))
+    json_endpoint = ListingEndpoint.from_capture("IT개발", json_info, data, dom_rows)
+    _, _, body = json_endpoint.build_request(2)
+    assert json.loads(body) == {"pageNo": 2, "size": 20}
+
+    no_page_info, _, _ = make_capture(url="https://www.catch.co.kr/api/recruit/list")
+    no_page_endpoint = ListingEndpoint.from_capture("IT개발", no_page_info, data, dom_rows)
+    assert no_page_endpoint.build_request(1)[1] == "https://www.catch.co.kr/api/recruit/list"
+    with pytest.raises(ValueError):
+        no_page_endpoint.build_request(2)
+
+
+def test_stale_while_revalidate_cache_serves_fresh_value_without_reloading():
+    cache = StaleWhileRevalidateCache(ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"count": len(calls)}
+
+    value, generated_at, stale = cache.get("key", loader)
+    assert value == {"count": 1} and generated_at is not None and stale is False
+    assert cache.get("key", loader)[0] == {"count": 1}
+    assert len(calls) == 1
+
+    assert cache.get("key", loader, force=True)[0] == {"count": 2}
+
+
+def test_stale_while_revalidate_cache_returns_stale_value_and_refreshes():
+    cache = StaleWhileRevalidateCache(ttl=0.05)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get("key", loader)[0] == 1
+    time.sleep(0.1)
+    value, _, stale = cache.get("key", loader)
+    assert value == 1 and stale is True
+
+    assert wait_until(lambda: len(calls) >= 2 and cache.get("key", lambda: None)[0] >= 2)
+
+
+def test_stale_while_revalidate_cache_keeps_last_good_value():
+    cache = StaleWhileRevalidateCache(ttl=0)
+    assert cache.get("empty", lambda: None) == (None, None, False)
+
+    cache.get("key", lambda: "good")
+    cache.get("key", lambda: None)
+    time.sleep(0.05)
+    assert cache.get("key", lambda: None)[0] == "good"
+
+
+def test_single_flight_shares_result_with_concurrent_callers():
+    flight = SingleFlight()
+    release = threading.Event()
+    follower_calls = []
+    results = {}
+
+    def leader():
+        results["leader"] = flight.do("key", lambda: release.wait(2) and "result")
+
+    def follower():
+        results["follower"] = flight.do("key", lambda: follower_calls.append(1) or "own")
+
+    leader_thread = threading.Thread(target=leader)
+    leader_thread.start()
+    assert wait_until(lambda: flight.in_flight() == ["key"])
+
+    follower_thread = threading.Thread(target=follower)
+    follower_thread.start()
+    time.sleep(0.1)
+    release.set()
+    leader_thread.join(2)
+    follower_thread.join(2)
+
+    assert results == {"leader": "result", "follower": "result"}
+    assert follower_calls == []
+    assert flight.in_flight() == []
+
+
+def test_single_flight_propagates_exception_and_clears_key():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", fail)
+    assert flight.in_flight() == []
+    assert flight.do("key", lambda: "ok") == "ok"
+
+
+def test_negative_cache_expires_and_evicts_oldest():
+    cache = NegativeCache(ttl=60, max_entries=2)
+    cache.add("a", "없음 a")
+    cache.add("b", "없음 b")
+    cache.add("c", "없음 c")
+
+    assert cache.get("a") is None
+    assert cache.get("c")["message"] == "없음 c"
+    assert cache.size() == 2
+
+    expired = NegativeCache(ttl=0)
+    expired.add("a", "없음")
+    assert expired.get("a") is None
+
+
+def test_company_directory_lookup_is_exact_and_suggest_is_fuzzy(tmp_path):
+    directory = CompanyDirectory(str(tmp_path / "directory.db"), threshold=0.75)
+    directory.add("https://www.catch.co.kr/Comp/CompSummary/1", "현대모비스")
+    directory.add("https://www.catch.co.kr/Comp/CompSummary/2", "현대자동차", alias="현대차")
+
+    assert directory.lookup("(주)현대모비스")["company_url"] == "https://www.catch.co.kr/Comp/CompSummary/1"
+    assert directory.lookup("현대차")["name"] == "현대자동차"
+    # 이름이 비슷해도 다른 기업일 수 있으므로 lookup은 정확히 같은 별칭만 반환
+    assert directory.lookup("현대모비스서비스") is None
+
+    suggestions = directory.suggest("현대모비스서비스")
+    assert [s["company_url"] for s in suggestions] == ["https://www.catch.co.kr/Comp/CompSummary/1"]
+    assert suggestions[0]["score"] == 0.8 and suggestions[0]["exact"] is False
+    assert directory.similarity("현대모비스", "㈜현대모비스") == 1.0
+
+
+def test_company_directory_reloads_index_from_disk(tmp_path):
+    path = str(tmp_path / "directory.db")
+    CompanyDirectory(path).add("https://www.catch.co.kr/Comp/CompSummary/2", "현대자동차", alias="현대차")
+
+    reloaded = CompanyDirectory(path)
+    assert reloaded.size() == 1
+    assert reloaded.lookup("현대차")["name"] == "현대자동차"
@@ -0,0 +1,132 @@
+from contextlib import contextmanager
+
+from selenium.common.exceptions import NoAlertPresentException, UnexpectedAlertPresentException
+
+import catch_scraper
+
+JOB_URL = "https://www.catch.co.kr/NCS/RecruitInfoDetails/123456"
+LOGIN_URL = "https://www.catch.co.kr/Member/Login?returnUrl=%2FNCS%2FRecruitInfoDetails%2F123456"
+
+
+class NoAlert:
+    @property
+    def alert(self):
+        raise NoAlertPresentException()
+
+
+class StubDetailDriver:
+    """get 할 때마다 redirects에서 차례로 꺼낸 주소로 이동하는 드라이버 (body_text는 화면 문구)"""
+    def __init__(self, redirects, body_text="", alert_text=None):
+        self.redirects = list(redirects)
+        self.body_text = body_text
+        self.alert_text = alert_text
+        self.current_url = "about:blank"
+        self.visited = []
+        self.switch_to = NoAlert()
+
+    def get(self, url):
+        self.visited.append(url)
+        if self.alert_text:
+            raise UnexpectedAlertPresentException(alert_text=self.alert_text)
+        self.current_url = self.redirects.pop(0) if self.redirects else url
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def find_elements(self, by, value):
+        return []
+
+    def execute_script(self, script, *args):
+        return self.body_text
+
+
+def make_scraper(driver, login_success=True):
+    scraper = catch_scraper.CatchScraper()
+    scraper.driver = driver
+    scraper.wait_for_page_ready = lambda *args, **kwargs: True
+    scraper.logins = 0
+
+    def ensure_login():
+        scraper.logins += 1
+        return {"success": login_success}
+
+    scraper.ensure_login = ensure_login
+    return scraper
+
+
+def test_login_redirect_is_error_not_missing_job():
+    driver = StubDetailDriver([LOGIN_URL])
+    scraper = make_scraper(driver, login_success=False)
+
+    result = scraper.extract_job_detail(JOB_URL)
+
+    assert result["success"] is False
+    assert "not_found" not in result
+    assert scraper.logins == 1
+
+
+def test_login_redirect_retries_once_after_login():
+    driver = StubDetailDriver([LOGIN_URL, LOGIN_URL])
+    scraper = make_scraper(driver)
+
+    result = scraper.extract_job_detail(JOB_URL)
+
+    assert result["success"] is False and "not_found" not in result
+    assert driver.visited == [JOB_URL, JOB_URL]
+    assert scraper.logins == 1
+
+
+def test_other_redirect_is_error_without_login():
+    driver = StubDetailDriver(["https://www.catch.co.kr/"])
+    scraper = make_scraper(driver)
+
+    result = scraper.extract_job_detail(JOB_URL)
+
+    assert result["success"] is False and "not_found" not in result
+    assert scraper.logins == 0
+
+
+def test_missing_job_notice_is_not_found():
+    driver = StubDetailDriver(["https://www.catch.co.kr/Error"], body_text="존재하지 않는 공고입니다.")
+    scraper = make_scraper(driver)
+
+    result = scraper.extract_job_detail(JOB_URL)
+
+    assert result["not_found"] is True
+    assert result["error"] == "존재하지 않는 공고"
+
+
+def test_missing_job_alert_is_not_found():
+    driver = StubDetailDriver([], alert_text="삭제된 공고입니다.")
+    scraper = make_scraper(driver)
+
+    result = scraper.extract_job_detail(JOB_URL)
+
+    assert result["not_found"] is True
+    assert result["error"] == "삭제된 공고입니다."
+
+
+class StubPool:
+    def __init__(self, result):
+        self.result = result
+
+    @contextmanager
+    def lease(self, timeout=None):
+        class Worker:
+            def extract_job_detail(worker, job_url):
+                return self.result
+        yield Worker()
+
+
+def test_job_detail_route_caches_only_missing_jobs(monkeypatch):
+    cache = catch_scraper.NegativeCache()
+    monkeypatch.setattr(catch_scraper, 'not_found_cache', cache)
+    client = catch_scraper.app.test_client()
+
+    monkeypatch.setattr(catch_scraper, 'driver_pool', StubPool({"success": False, "error": f"상세 페이지가 아닌 곳으로 이동: {LOGIN_URL}"}))
+    client.post('/api/job-detail', json={"job_url": JOB_URL})
+    assert cache.size() == 0
+
+    monkeypatch.setattr(catch_scraper, 'driver_pool', StubPool({"success": False, "not_found": True, "error": "삭제된 공고"}))
+    client.post('/api/job-detail', json={"job_url": JOB_URL})
+    assert cache.get(('job_detail', '123456'))["message"] == "삭제된 공고"
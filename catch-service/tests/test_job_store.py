@@ -0,0 +1,61 @@
+import pytest
+
+from catch_scraper import JobStore
+
+
+def add_job(store, job_id, company, seen):
+    """seen: [(카테고리, 페이지, first_seen, last_seen)]"""
+    with store._connection() as conn:
+        conn.execute("""
+            INSERT INTO jobs (job_id, title, company, url, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?)
+        """, (job_id, f"공고 {job_id}", company, f"https://www.catch.co.kr/NCS/RecruitInfoDetails/{job_id}",
+              min(row[2] for row in seen), max(row[3] for row in seen)))
+        conn.executemany("""
+            INSERT INTO job_categories (job_id, category, page, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)
+        """, [(job_id, *row) for row in seen])
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    # 1: 나중에 빅데이터·AI에서 다시 봄, 2: 마지막으로 IT개발에서 봄, 3: IT개발에만 있음
+    add_job(store, "1", "테스트기업", [("it", 3, "2026-01-01T09:00:00", "2026-01-02T09:00:00"),
+                                       ("bigdata_ai", 1, "2026-01-05T09:00:00", "2026-01-10T09:00:00")])
+    add_job(store, "2", "다른기업", [("bigdata_ai", 2, "2026-01-03T09:00:00", "2026-01-04T09:00:00"),
+                                     ("it", 5, "2026-01-01T09:00:00", "2026-01-09T09:00:00")])
+    add_job(store, "3", "테스트기업", [("it", 1, "2026-01-06T09:00:00", "2026-01-08T09:00:00")])
+    return store
+
+
+def test_get_jobs_without_category_takes_category_and_page_from_latest_row(store):
+    jobs = store.get_jobs()
+
+    assert [job["job_id"] for job in jobs] == ["1", "2", "3"]
+    assert [(job["category"], job["page"]) for job in jobs] == [("bigdata_ai", 1), ("it", 5), ("it", 1)]
+    assert jobs[0]["categories"] == ["bigdata_ai", "it"]
+    assert (jobs[0]["first_seen"], jobs[0]["last_seen"]) == ("2026-01-01T09:00:00", "2026-01-10T09:00:00")
+    assert (jobs[1]["first_seen"], jobs[1]["last_seen"]) == ("2026-01-01T09:00:00", "2026-01-09T09:00:00")
+
+
+def test_get_jobs_with_category_lists_category_rows(store):
+    jobs = store.get_jobs(category="it")
+
+    assert [job["job_id"] for job in jobs] == ["2", "3", "1"]
+    assert jobs[2]["page"] == 3 and jobs[2]["last_seen"] == "2026-01-02T09:00:00"
+    assert store.count_jobs(category="it") == 3
+
+
+def test_get_jobs_company_filter_and_count(store):
+    jobs = store.get_jobs(company="테스트")
+
+    assert [job["job_id"] for job in jobs] == ["1", "3"]
+    assert store.count_jobs(company="테스트") == 2
+    assert store.count_jobs() == 3
+
+
+def test_get_job_uses_latest_category(store):
+    job = store.get_job("2")
+
+    assert (job["category"], job["page"]) == ("it", 5)
+    assert job["categories"] == ["bigdata_ai", "it"]
+    assert store.get_job("missing") is None
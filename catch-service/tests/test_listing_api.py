@@ -0,0 +1,95 @@
+from contextlib import contextmanager
+
+import pytest
+
+import catch_scraper
+from catch_scraper import ListingEndpoint
+
+
+def make_endpoint(page_key):
+    request_info = {"url": "https://www.catch.co.kr/api/recruit/list", "method": "GET", "headers": {}, "post_data": None}
+    field_map = {"title": "title", "company": "company", "id": "id", "job_info": [], "conditions": [], "registration_info": []}
+    return ListingEndpoint('it', request_info, ("list",), field_map,
+                           "https://www.catch.co.kr/NCS/RecruitInfoDetails/{id}", page_key)
+
+
+def api_page(page):
+    return [{"title": f"API 공고 {page}", "company": "테스트기업", "job_info": [], "conditions": [],
+             "registration_info": [], "url": f"https://www.catch.co.kr/NCS/RecruitInfoDetails/{page}",
+             "job_id": str(page), "page": page}]
+
+
+class StubWorker:
+    def __init__(self):
+        self.opened = []
+
+    def open_listing(self, category, page):
+        self.opened.append(page)
+        return {"success": True, "method": "url"}
+
+    def iter_pages(self, max_pages=None, start_page=1):
+        last_page = start_page + max_pages - 1 if max_pages else 4
+        for page in range(start_page, last_page + 1):
+            yield page, [{"title": f"Selenium 공고 {page}", "page": page}]
+
+
+class StubPool:
+    def __init__(self):
+        self.worker = StubWorker()
+
+    @contextmanager
+    def lease(self, timeout=None):
+        yield self.worker
+
+
+@pytest.fixture
+def api(monkeypatch):
+    client = catch_scraper.ListingApiClient()
+    if client.session is None:
+        pytest.skip("requests가 설치되어 있지 않음")
+    monkeypatch.setattr(catch_scraper, 'FAST_PATH_ENABLED', True)
+    monkeypatch.setattr(catch_scraper, 'listing_api', client)
+    monkeypatch.setattr(client, 'fetch_page', lambda category, page=1: api_page(page))
+    return client
+
+
+def test_fetch_jobs_without_page_key_fails_for_multiple_pages(api, monkeypatch):
+    monkeypatch.setitem(catch_scraper.listing_endpoints, 'it', make_endpoint(None))
+
+    assert api.fetch_jobs('it')["success"] is False
+    assert api.fetch_jobs('it', max_pages=3)["success"] is False
+
+    result = api.fetch_jobs('it', max_pages=1)
+    assert result["success"] is True and result["total_pages"] == 1
+
+
+def test_fetch_jobs_with_page_key_reads_requested_pages(api, monkeypatch):
+    monkeypatch.setitem(catch_scraper.listing_endpoints, 'it', make_endpoint(('query', 'page')))
+
+    result = api.fetch_jobs('it', max_pages=3)
+    assert result["success"] is True
+    assert [job["page"] for job in result["jobs"]] == [1, 2, 3]
+
+
+def test_iter_category_pages_continues_on_driver_without_page_key(api, monkeypatch):
+    monkeypatch.setitem(catch_scraper.listing_endpoints, 'it', make_endpoint(None))
+    pool = StubPool()
+    monkeypatch.setattr(catch_scraper, 'driver_pool', pool)
+
+    pages = list(catch_scraper.iter_category_pages('it', max_pages=3))
+
+    assert [page for page, _ in pages] == [1, 2, 3]
+    assert pages[0][1][0]["title"] == "API 공고 1"
+    assert pages[1][1][0]["title"] == "Selenium 공고 2"
+    assert pool.worker.opened == [2]
+
+
+def test_iter_category_pages_single_page_without_page_key_skips_driver(api, monkeypatch):
+    monkeypatch.setitem(catch_scraper.listing_endpoints, 'it', make_endpoint(None))
+    pool = StubPool()
+    monkeypatch.setattr(catch_scraper, 'driver_pool', pool)
+
+    pages = list(catch_scraper.iter_category_pages('it', max_pages=1))
+
+    assert [page for page, _ in pages] == [1]
+    assert pool.worker.opened == []
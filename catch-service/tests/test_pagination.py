@@ -0,0 +1,264 @@
+import re
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.support.ui import WebDriverWait
+
+import catch_scraper
+
+
+class QuickWait(WebDriverWait):
+    """테스트에서 없는 버튼을 10초씩 기다리지 않도록 대기 시간을 줄인 WebDriverWait"""
+    def __init__(self, driver, timeout, poll_frequency=0.05, ignored_exceptions=None):
+        super().__init__(driver, min(timeout, 0.2), poll_frequency=0.05, ignored_exceptions=ignored_exceptions)
+
+
+class StubElement:
+    def __init__(self, driver, text='', target=None):
+        self.driver = driver
+        self.text = text
+        self.target = target
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        self.driver.clicks += 1
+        if self.driver.click_changes_rows:
+            self.driver.index = self.target
+            self.driver.version += 1
+
+
+class StubListingDriver:
+    """공고 목록 페이지를 흉내내는 드라이버 (pages는 페이지별 공고 제목 목록)"""
+    def __init__(self, pages, next_button=True, number_buttons=False, click_changes_rows=True):
+        self.pages = pages
+        self.next_button = next_button
+        self.number_buttons = number_buttons
+        self.click_changes_rows = click_changes_rows
+        self.index = 0
+        self.version = 0
+        self.clicks = 0
+
+    def _rows(self):
+        return [{
+            "title": title,
+            "company": "테스트기업",
+            "job_info": ["백엔드"],
+            "conditions": ["경력무관"],
+            "registration_info": ["D-7"],
+            "url": f"https://www.catch.co.kr/NCS/RecruitInfoDetails/{1000 + self.index * 10 + i}"
+        } for i, title in enumerate(self.pages[self.index])]
+
+    @property
+    def page_source(self):
+        rows = "".join(
+            f"<tr><td><p class='name2'>{row['company']}</p>"
+            f"<a href='{row['url']}'><p class='subj2'>{row['title']}</p></a>"
+            f"<p class='job'><span>{row['job_info'][0]}</span></p>"
+            f"<p class='cond'>{row['conditions'][0]}</p>"
+            f"<p class='num_dday'>{row['registration_info'][0]}</p></td></tr>"
+            for row in self._rows()
+        )
+        return f"<html><body><table><tbody>{rows}</tbody></table></body></html>"
+
+    def find_element(self, by, value):
+        if 'subj2' in value:
+            if not self.pages[self.index]:
+                raise NoSuchElementException(value)
+            return StubElement(self, text=self.pages[self.index][0])
+        if 'ico next' in value:
+            if self.next_button and self.index + 1 < len(self.pages):
+                return StubElement(self, target=self.index + 1)
+            raise NoSuchElementException(value)
+        match = re.search(r"text\(\)='(\d+)'", value)
+        if match and self.number_buttons:
+            # 숫자 버튼은 start_page 기준이 아니라 현재 위치 바로 다음 페이지로 이동
+            if self.index + 1 < len(self.pages):
+                return StubElement(self, text=match.group(1), target=self.index + 1)
+        raise NoSuchElementException(value)
+
+    def find_elements(self, by, value):
+        if value == "//tbody//tr":
+            return [StubElement(self) for _ in self.pages[self.index]]
+        return []
+
+    def execute_script(self, script, *args):
+        if script == catch_scraper.ROWS_OBSERVER_SCRIPT:
+            return {"epoch": "stub", "version": self.version, "quiet_ms": 1000, "rows": len(self.pages[self.index])}
+        if script == catch_scraper.JOB_ROWS_SCRIPT:
+            return self._rows()
+        if script == "arguments[0].click();":
+            args[0].click()
+        return None
+
+
+class IdleNetwork:
+    available = True
+
+    def is_idle(self, idle_ms=None):
+        return True
+
+
+@pytest.fixture(autouse=True)
+def quick_waits(monkeypatch):
+    monkeypatch.setattr(catch_scraper, 'WebDriverWait', QuickWait)
+    monkeypatch.setattr(catch_scraper, 'NETWORK_IDLE_MS', 0)
+    monkeypatch.setattr(catch_scraper, 'ROW_EXTRACTION_MODE', 'js')
+
+
+def make_scraper(driver):
+    scraper = catch_scraper.CatchScraper()
+    scraper.driver = driver
+    scraper.network = IdleNetwork()
+    return scraper
+
+
+def test_go_to_next_page_with_next_button():
+    driver = StubListingDriver([["공고 A"], ["공고 B"]])
+    scraper = make_scraper(driver)
+
+    assert scraper.go_to_next_page(1) is True
+    assert driver.index == 1
+    assert driver.clicks == 1
+
+
+def test_go_to_next_page_falls_back_to_number_button():
+    driver = StubListingDriver([["공고 A"], ["공고 B"]], next_button=False, number_buttons=True)
+    scraper = make_scraper(driver)
+
+    assert scraper.go_to_next_page(1) is True
+    assert driver.index == 1
+
+
+def test_go_to_next_page_without_next_button_is_last_page():
+    driver = StubListingDriver([["공고 A"]], next_button=False, number_buttons=False)
+    scraper = make_scraper(driver)
+
+    assert scraper.go_to_next_page(1) is False
+    assert driver.clicks == 0
+
+
+def test_go_to_next_page_click_without_row_change_is_last_page():
+    driver = StubListingDriver([["공고 A"], ["공고 B"]], click_changes_rows=False)
+    scraper = make_scraper(driver)
+
+    assert scraper.go_to_next_page(1) is False
+    assert driver.clicks == 1
+    assert driver.index == 0
+
+
+def test_iter_pages_reads_until_last_page():
+    driver = StubListingDriver([["공고 A", "공고 B"], ["공고 C"], ["공고 D"]])
+    scraper = make_scraper(driver)
+
+    pages = list(scraper.iter_pages())
+
+    assert [page for page, _ in pages] == [1, 2, 3]
+    assert [[job["title"] for job in jobs] for _, jobs in pages] == [["공고 A", "공고 B"], ["공고 C"], ["공고 D"]]
+    assert pages[0][1][0]["page"] == 1
+    assert pages[0][1][0]["job_id"] == "1000"
+    assert driver.clicks == 2
+
+
+def test_iter_pages_stops_when_click_does_not_change_rows():
+    driver = StubListingDriver([["공고 A"], ["공고 B"]], click_changes_rows=False)
+    scraper = make_scraper(driver)
+
+    pages = list(scraper.iter_pages())
+
+    assert [page for page, _ in pages] == [1]
+    assert driver.clicks == 1
+
+
+def test_iter_pages_stops_at_max_pages():
+    driver = StubListingDriver([["공고 A"], ["공고 B"], ["공고 C"], ["공고 D"]])
+    scraper = make_scraper(driver)
+
+    pages = list(scraper.iter_pages(max_pages=2))
+
+    assert [page for page, _ in pages] == [1, 2]
+    # 마지막으로 읽은 페이지에서는 다음 페이지로 이동하지 않음
+    assert driver.clicks == 1
+
+
+def test_iter_pages_max_pages_counts_from_start_page():
+    driver = StubListingDriver([["공고 C"], ["공고 D"], ["공고 E"]])
+    scraper = make_scraper(driver)
+
+    pages = list(scraper.iter_pages(max_pages=2, start_page=3))
+
+    assert [page for page, _ in pages] == [3, 4]
+    assert pages[1][1][0]["page"] == 4
+
+
+@pytest.mark.skipif(catch_scraper.job_list_parser is None, reason="lxml이 설치되어 있지 않음")
+def test_iter_pages_lxml_mode_stops_at_max_pages(monkeypatch):
+    monkeypatch.setattr(catch_scraper, 'ROW_EXTRACTION_MODE', 'lxml')
+    driver = StubListingDriver([["공고 A"], ["공고 B"], ["공고 C"]])
+    scraper = make_scraper(driver)
+
+    pages = list(scraper.iter_pages(max_pages=2))
+
+    assert [[job["title"] for job in jobs] for _, jobs in pages] == [["공고 A"], ["공고 B"]]
+    assert driver.clicks == 1
+
+
+class StubUrlListingDriver(StubListingDriver):
+    """목록 URL의 page 파라미터로 바로 이동되는 드라이버 (없는 페이지는 빈 목록 또는 마지막 페이지를 보여줌)"""
+    def __init__(self, pages, clamp_to_last_page=False):
+        super().__init__(pages)
+        self.clamp_to_last_page = clamp_to_last_page
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+        match = re.search(r'[?&]page=(\d+)', url)
+        requested = int(match.group(1)) - 1 if match else 0
+        if requested < len(self.pages):
+            self.index = requested
+        elif self.clamp_to_last_page:
+            self.index = len(self.pages) - 1
+        else:
+            self.pages = self.pages + [[]] * (requested + 1 - len(self.pages))
+            self.index = requested
+        self.version += 1
+
+    def find_element(self, by, value):
+        if 'selected' in value:
+            if not self.pages[self.index]:
+                raise NoSuchElementException(value)
+            return StubElement(self, text=str(self.index + 1))
+        return super().find_element(by, value)
+
+
+@pytest.fixture
+def listing_url(monkeypatch):
+    monkeypatch.setitem(catch_scraper.listing_url_cache, 'it', "https://www.catch.co.kr/NCS/RecruitSearch?page=1")
+
+
+def test_open_listing_by_url(listing_url):
+    driver = StubUrlListingDriver([["공고 A"], ["공고 B"], ["공고 C"]])
+    scraper = make_scraper(driver)
+
+    result = scraper.open_listing('it', 2, allow_click_fallback=False)
+
+    assert result["success"] is True and result["method"] == "url"
+    assert driver.index == 1
+
+
+@pytest.mark.parametrize("clamp_to_last_page", [False, True])
+def test_open_listing_past_last_page_without_click_fallback(listing_url, clamp_to_last_page):
+    driver = StubUrlListingDriver([["공고 A"], ["공고 B"], ["공고 C"]], clamp_to_last_page=clamp_to_last_page)
+    scraper = make_scraper(driver)
+
+    result = scraper.open_listing('it', 6, allow_click_fallback=False)
+
+    assert result["success"] is False
+    assert result["page"] == (3 if clamp_to_last_page else 5)
+    # 채용공고 첫 화면으로 돌아가 클릭 방식으로 전환하지 않음
+    assert len(driver.visited) == 1
+    assert driver.clicks == 0
@@ -0,0 +1,66 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+import catch_scraper
+
+
+class StubShardWorker:
+    """URL로 페이지를 바로 여는 워커 (total_pages 이후 페이지는 없음)"""
+    def __init__(self, total_pages, calls):
+        self.total_pages = total_pages
+        self.calls = calls
+        self.driver = None
+
+    def open_listing_with_discovery(self, category):
+        return {"success": True, "page": 1, "method": "url"}
+
+    def open_listing(self, category, page=1, progress=None, allow_click_fallback=True):
+        self.calls.append((page, allow_click_fallback))
+        if page <= self.total_pages:
+            return {"success": True, "page": page, "method": "url"}
+        if allow_click_fallback:
+            # 클릭 방식이면 1페이지부터 마지막 페이지까지 눌러본 뒤에야 실패
+            self.calls.append(("clicked", self.total_pages))
+        return {"success": False, "message": "없는 페이지", "page": self.total_pages}
+
+    def extract_job_list(self, max_pages=None, start_page=1, end_page=None, progress=None):
+        last_page = min(end_page, self.total_pages)
+        jobs = [{"title": f"공고 {page}", "url": f"https://www.catch.co.kr/NCS/RecruitInfoDetails/{page}",
+                 "job_id": str(page), "page": page} for page in range(start_page, last_page + 1)]
+        return {"success": True, "jobs": jobs, "total_pages": last_page}
+
+
+class StubPool:
+    def __init__(self, size, total_pages):
+        self.size = size
+        self.calls = []
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(StubShardWorker(total_pages, self.calls))
+
+    @contextmanager
+    def lease(self, timeout=None):
+        worker = self._idle.get(timeout=5)
+        try:
+            yield worker
+        finally:
+            self._idle.put(worker)
+
+
+def test_sharded_crawl_stops_at_missing_shard_without_clicking(monkeypatch):
+    pool = StubPool(size=3, total_pages=7)
+    monkeypatch.setattr(catch_scraper, 'driver_pool', pool)
+    monkeypatch.setitem(catch_scraper.listing_url_cache, 'it', "https://www.catch.co.kr/NCS/RecruitSearch?page=1")
+
+    result = catch_scraper.crawl_category_sharded('it', workers=3, shard_pages=2)
+
+    assert result["success"] is True
+    assert result["workers"] == 3
+    assert result["total_pages"] == 7
+    assert [job["page"] for job in result["jobs"]] == [1, 2, 3, 4, 5, 6, 7]
+    assert result["failed_shards"] == []
+    # 첫 호출은 URL 이동 확인용 2페이지 열기, 이후 구간 워커는 클릭 방식으로 대체하지 않음
+    assert pool.calls[0] == (2, True)
+    assert all(allow is False for _, allow in pool.calls[1:])
+    assert not any(call[0] == "clicked" for call in pool.calls)